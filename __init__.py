@@ -1,8 +1,10 @@
 # Root package __init__.py
-# Autoload all node modules from ./nodes without requiring 'nodes' to be a Python package.
+# Register all node modules from ./nodes without requiring 'nodes' to be a Python package.
 # IMPORTANT: ComfyUI looks for WEB_DIRECTORY to mount our web assets.
 # DO NOT REMOVE WEB_DIRECTORY or its export from __all__ — the web UI will not load without it.
 
+import sys
+import time
 from importlib.util import spec_from_file_location, module_from_spec
 from pathlib import Path
 
@@ -12,33 +14,32 @@ WEB_DIRECTORY = "./web"  # <- ComfyUI scans this. Removing or renaming breaks JS
 NODE_CLASS_MAPPINGS = {}
 NODE_DISPLAY_NAME_MAPPINGS = {}
 
-def _merge(dst: dict, src: dict):
-    if not isinstance(src, dict):
-        return
-    for k, v in src.items():
-        if k not in dst:
-            dst[k] = v
-        # silently keep first value if duplicate during dev
+def _registry():
+    """nodes/_registry.py, shared with nodes/__init__.py and the node modules through sys.modules.
+    Loaded by path: this file may be loaded without a parent package (tests)."""
+    mod = sys.modules.get("ea_nodes._registry")
+    if mod is None:
+        spec = spec_from_file_location("ea_nodes._registry", Path(__file__).parent / "nodes" / "_registry.py")
+        mod = module_from_spec(spec)
+        sys.modules["ea_nodes._registry"] = mod
+        spec.loader.exec_module(mod)
+    return mod
 
 def _load_all():
-    base = Path(__file__).parent / "nodes"
-    if not base.exists():
+    # Nodes listed in nodes/_registry.py register as stand-ins; their modules import on first use
+    t0 = time.perf_counter()
+    try:
+        stats = _registry().register(NODE_CLASS_MAPPINGS, NODE_DISPLAY_NAME_MAPPINGS)
+    except Exception as e:
+        print(f"[EA Nodes] Registry unavailable: {e}")
         return
-    for p in sorted(base.glob("*.py")):
-        if p.name.startswith("_"):
-            continue
-        mod_name = f"ea_nodes.{p.stem}"
-        try:
-            spec = spec_from_file_location(mod_name, p)
-            if spec is None or spec.loader is None:
-                raise RuntimeError("no loader")
-            mod = module_from_spec(spec)
-            spec.loader.exec_module(mod)
-        except Exception as e:
-            print(f"[EA Nodes] Skipping nodes.{p.stem}: {e}")
-            continue
-        _merge(NODE_CLASS_MAPPINGS, getattr(mod, "NODE_CLASS_MAPPINGS", {}))
-        _merge(NODE_DISPLAY_NAME_MAPPINGS, getattr(mod, "NODE_DISPLAY_NAME_MAPPINGS", {}))
+    failed = f", {stats['failed']} module(s) failed; see load_report()" if stats["failed"] else ""
+    print(f"[EA Nodes] Registered {stats['nodes']} nodes ({stats['deferred']} deferred) "
+          f"in {(time.perf_counter() - t0) * 1000:.1f} ms{failed}")
+
+def load_report() -> dict:
+    """Module load timings/failures and deferred-node state (see nodes/_registry.py)."""
+    return _registry().load_report()
 
 _load_all()
 
@@ -0,0 +1,269 @@
+# nodes/_profiler.py
+# Opt-in execution profiler shared by all EA nodes (not a node module; leading "_").
+# The registry wraps every EA node's FUNCTION with instrument(); while disabled the wrapper
+# only checks a flag. Enable with EA_PROFILE=1 or from the EA Profiler Dump node.
+# Per call: wall time, CPU time, peak CUDA bytes allocated, output tensor bytes, input shapes
+# and sub-stage timings (stage("decode") etc.), kept in a bounded ring buffer plus running totals.
+# Nested EA calls on the same thread are folded into the outermost one.
+# Node modules time stages through a _PROFILER proxy that resolves registry.profiler() on first use.
+# Totals are also written as a Prometheus text file (EA_PROFILE_PROM, default temp dir).
+
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+from typing import Dict, List, Optional
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.environ.get(name, default)))
+    except (TypeError, ValueError):
+        return default
+
+_ENABLED = _env_flag("EA_PROFILE")
+_BUFFER_SIZE = _env_int("EA_PROFILE_BUFFER", 512)
+# Minimum seconds between automatic Prometheus file rewrites
+_PROM_INTERVAL_S = 5.0
+
+_lock = threading.Lock()
+_records: deque = deque(maxlen=_BUFFER_SIZE)
+_totals: Dict[str, dict] = {}
+_local = threading.local()
+_prom_written = 0.0
+
+def enabled() -> bool:
+    return _ENABLED
+
+def set_enabled(flag: bool):
+    global _ENABLED
+    _ENABLED = bool(flag)
+
+def clear():
+    with _lock:
+        _records.clear()
+        _totals.clear()
+
+def current() -> Optional[dict]:
+    """Record of the profiled call running on this thread (None when not profiling)."""
+    return getattr(_local, "record", None)
+
+@contextmanager
+def attach(rec: Optional[dict]):
+    """Let a worker thread report stages into the call that spawned it (pass current() from the caller)."""
+    prev = getattr(_local, "record", None)
+    _local.record = rec
+    try:
+        yield
+    finally:
+        _local.record = prev
+
+@contextmanager
+def stage(name: str):
+    """Time a sub-stage of the profiled call on this thread (no-op outside one).
+    Stages timed on attached worker threads are summed, so they can exceed the call's wall time."""
+    rec = getattr(_local, "record", None)
+    if rec is None:
+        yield
+        return
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - t0
+        with _lock:
+            stages = rec["stages"]
+            stages[name] = stages.get(name, 0.0) + elapsed
+
+def _shape_of(v):
+    shape = getattr(v, "shape", None)
+    if shape is not None:
+        try:
+            return [int(d) for d in shape]
+        except Exception:
+            return str(shape)
+    if isinstance(v, (list, tuple)) and v and getattr(v[0], "shape", None) is not None:
+        return [_shape_of(x) for x in v[:4]] + (["..."] if len(v) > 4 else [])
+    return None
+
+def _input_shapes(args, kwargs) -> dict:
+    out = {}
+    for i, v in enumerate(args[1:] if args else ()):  # args[0] is self/cls
+        s = _shape_of(v)
+        if s is not None:
+            out[f"arg{i}"] = s
+    for k, v in kwargs.items():
+        s = _shape_of(v)
+        if s is not None:
+            out[k] = s
+    return out
+
+def _output_bytes(result) -> int:
+    """Bytes held by tensors in a node's result (the CPU-side counterpart of the CUDA peak)."""
+    items = result if isinstance(result, (list, tuple)) else (result,)
+    total = 0
+    for v in items:
+        for x in (v if isinstance(v, (list, tuple)) else (v,)):
+            nbytes = getattr(x, "nbytes", None)
+            if isinstance(nbytes, int):
+                total += nbytes
+    return total
+
+def _cuda():
+    """torch module when CUDA is already initialized (never initializes it ourselves)."""
+    torch = sys.modules.get("torch")
+    try:
+        if torch is not None and torch.cuda.is_initialized():
+            return torch
+    except Exception:
+        pass
+    return None
+
+def _run(key: str, fn, args, kwargs):
+    if getattr(_local, "record", None) is not None:
+        # Nested EA call (e.g. a node re-entering its own FUNCTION): already timed by the outer one
+        return fn(*args, **kwargs)
+    rec = {"node": key, "started_at": time.time(), "stages": {}, "inputs": _input_shapes(args, kwargs)}
+    _local.record = rec
+    torch = _cuda()
+    if torch is not None:
+        # High-water mark is process-global and never reset here (other code may be tracking it)
+        alloc0, peak0 = torch.cuda.memory_allocated(), torch.cuda.max_memory_allocated()
+    w0, c0 = time.perf_counter(), time.process_time()
+    try:
+        result = fn(*args, **kwargs)
+        rec["output_bytes"] = _output_bytes(result)
+        return result
+    except BaseException as e:
+        rec["error"] = type(e).__name__
+        raise
+    finally:
+        rec["wall_s"] = time.perf_counter() - w0
+        rec["cpu_s"] = time.process_time() - c0
+        rec["peak_bytes"] = rec["peak_exact"] = None
+        if torch is not None:
+            peak1 = torch.cuda.max_memory_allocated()
+            # Exact only if this call raised the high-water mark; otherwise an upper bound
+            rec["peak_exact"] = peak1 > peak0
+            rec["peak_bytes"] = max(0, peak1 - alloc0)
+        _local.record = None
+        _commit(rec)
+
+def _commit(rec: dict):
+    global _prom_written
+    with _lock:
+        _records.append(rec)
+        t = _totals.setdefault(rec["node"], {"calls": 0, "errors": 0, "wall_s": 0.0, "cpu_s": 0.0,
+                                             "max_wall_s": 0.0, "peak_bytes": 0, "stages": {}})
+        t["calls"] += 1
+        t["errors"] += 1 if "error" in rec else 0
+        t["wall_s"] += rec["wall_s"]
+        t["cpu_s"] += rec["cpu_s"]
+        t["max_wall_s"] = max(t["max_wall_s"], rec["wall_s"])
+        if rec["peak_exact"]:
+            t["peak_bytes"] = max(t["peak_bytes"], rec["peak_bytes"])
+        for name, secs in rec["stages"].items():
+            t["stages"][name] = t["stages"].get(name, 0.0) + secs
+        due = time.monotonic() - _prom_written >= _PROM_INTERVAL_S
+        if due:
+            _prom_written = time.monotonic()
+    if due:
+        try:
+            write_prometheus()
+        except Exception as e:
+            print(f"[EA Profiler] Could not write metrics file: {e}")
+
+def _wrap(fn, key: str):
+    @wraps(fn)
+    def profiled(*args, **kwargs):
+        if not _ENABLED:
+            return fn(*args, **kwargs)
+        return _run(key, fn, args, kwargs)
+    profiled.__ea_profiled__ = True
+    return profiled
+
+def instrument(cls: type, key: str) -> bool:
+    """Wrap cls.FUNCTION (plain, static or class method) once. Classes can opt out with _EA_NO_PROFILE."""
+    fname = cls.__dict__.get("FUNCTION") or getattr(cls, "FUNCTION", None)
+    if not fname or getattr(cls, "_EA_NO_PROFILE", False):
+        return False
+    raw = next((k.__dict__[fname] for k in cls.__mro__ if fname in k.__dict__), None)
+    if raw is None:
+        return False
+    func = raw.__func__ if isinstance(raw, (staticmethod, classmethod)) else raw
+    if getattr(func, "__ea_profiled__", False) and fname in cls.__dict__:
+        return False
+    wrapped = _wrap(func, key)
+    if isinstance(raw, staticmethod):
+        wrapped = staticmethod(wrapped)
+    elif isinstance(raw, classmethod):
+        wrapped = classmethod(wrapped)
+    setattr(cls, fname, wrapped)
+    return True
+
+def snapshot(last_n: int = 50) -> dict:
+    with _lock:
+        recent: List[dict] = list(_records)[-max(0, int(last_n)):] if last_n else []
+        totals = {k: dict(v, stages=dict(v["stages"])) for k, v in _totals.items()}
+    return {"enabled": _ENABLED, "buffer_size": _BUFFER_SIZE, "totals": totals, "recent": recent}
+
+def prometheus_path() -> str:
+    path = os.environ.get("EA_PROFILE_PROM", "").strip()
+    if path:
+        return path
+    try:
+        import folder_paths
+        base = folder_paths.get_temp_directory()
+    except Exception:
+        base = tempfile.gettempdir()
+    return os.path.join(base, "ea_nodes.prom")
+
+def _label(v: str) -> str:
+    return str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+def prometheus_text() -> str:
+    with _lock:
+        totals = {k: dict(v, stages=dict(v["stages"])) for k, v in _totals.items()}
+    lines = []
+
+    def metric(name, mtype, help_text, rows):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {mtype}")
+        lines.extend(rows)
+
+    metric("ea_node_calls_total", "counter", "Profiled EA node executions.",
+           [f'ea_node_calls_total{{node="{_label(k)}"}} {v["calls"]}' for k, v in totals.items()])
+    metric("ea_node_errors_total", "counter", "EA node executions that raised.",
+           [f'ea_node_errors_total{{node="{_label(k)}"}} {v["errors"]}' for k, v in totals.items()])
+    metric("ea_node_wall_seconds_total", "counter", "Wall time spent in EA nodes.",
+           [f'ea_node_wall_seconds_total{{node="{_label(k)}"}} {v["wall_s"]:.6f}' for k, v in totals.items()])
+    metric("ea_node_cpu_seconds_total", "counter", "Process CPU time during EA node calls.",
+           [f'ea_node_cpu_seconds_total{{node="{_label(k)}"}} {v["cpu_s"]:.6f}' for k, v in totals.items()])
+    metric("ea_node_max_wall_seconds", "gauge", "Slowest single EA node call.",
+           [f'ea_node_max_wall_seconds{{node="{_label(k)}"}} {v["max_wall_s"]:.6f}' for k, v in totals.items()])
+    metric("ea_node_peak_cuda_bytes", "gauge", "Largest measured CUDA allocation peak above a call's baseline.",
+           [f'ea_node_peak_cuda_bytes{{node="{_label(k)}"}} {v["peak_bytes"]}' for k, v in totals.items()])
+    metric("ea_node_stage_seconds_total", "counter", "Wall time per EA node sub-stage.",
+           [f'ea_node_stage_seconds_total{{node="{_label(k)}",stage="{_label(s)}"}} {secs:.6f}'
+            for k, v in totals.items() for s, secs in v["stages"].items()])
+    return "\n".join(lines) + "\n"
+
+def write_prometheus(path: Optional[str] = None) -> str:
+    """Atomically (re)write the Prometheus text file; returns its path."""
+    path = path or prometheus_path()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(prometheus_text())
+    os.replace(tmp, path)
+    return path
+
+def dump_json(last_n: int = 50) -> str:
+    return json.dumps(snapshot(last_n), indent=2, default=str)
@@ -0,0 +1,257 @@
+# nodes/_registry.py
+# Node metadata declared up front so ComfyUI can register every EA node at startup
+# without importing the implementation modules. Each module is imported on first use
+# (first INPUT_TYPES call, attribute read or instantiation of one of its nodes).
+# Not a node module itself (leading "_" keeps the autoloaders away from it).
+# This is the only loader: the root __init__.py bootstraps it by path, nodes/__init__.py and
+# the node modules reuse it through sys.modules["ea_nodes._registry"] (node modules imported on
+# their own load it by path the same way), and every node module (and _profiler) is executed
+# by load_module(), at most once per process.
+# Each module load is logged with its time and trigger; load_report() returns the same timings
+# and failures. Loaded node classes are wrapped by the opt-in execution profiler
+# (nodes/_profiler.py, see profiler()).
+
+import os
+import sys
+import threading
+import time
+import traceback
+from importlib.util import spec_from_file_location, module_from_spec
+from pathlib import Path
+from typing import Dict, Tuple
+
+NODES_DIR = Path(__file__).resolve().parent
+MODULE_PREFIX = "ea_nodes"
+
+# One registry per process, whatever name this file was first imported under
+sys.modules.setdefault(f"{MODULE_PREFIX}._registry", sys.modules[__name__])
+
+# (node key, display name, module in nodes/, class name) — keep in sync with each module's mappings
+NODE_SPECS: Tuple[Tuple[str, str, str, str], ...] = (
+    ("EA_AutoTrimPingPong", "EA Auto Trim (PingPong)", "ea_auto_trim", "EA_AutoTrimPingPong"),
+    ("EAImageCompare", "EA Image Compare", "ea_image_compare", "EAImageCompare"),
+    ("EAImageCompare3Way", "EA 3-Way Image Compare", "ea_image_compare", "EAImageCompare3Way"),
+    ("EAImageCompare4Way", "EA 4-Way Image Compare", "ea_image_compare", "EAImageCompare4Way"),
+    ("EAImageCompareGrid", "EA Image Compare Grid", "ea_image_compare", "EAImageCompareGrid"),
+    ("EA_LightningMotionBias", "EA Motion Bias (Lightning)", "ea_lightning_motion_bias", "EA_LightningMotionBias"),
+    ("EA_LightningMotionBiasSweep", "EA Motion Bias Sweep (Lightning)", "ea_lightning_motion_bias",
+     "EA_LightningMotionBiasSweep"),
+    ("EA_LightningMotionBiasFit", "EA Motion Bias Fit (Lightning)", "ea_lightning_motion_bias",
+     "EA_LightningMotionBiasFit"),
+    ("EA_PingPong", "EA PingPong", "ea_pingpong", "EA_PingPong"),
+    ("EA_PowerLora", "EA Power LoRA", "ea_power_lora", "EA_PowerLora"),
+    ("EA_PowerLora_CLIP", "EA Power LoRA +CLIP", "ea_power_lora", "EA_PowerLora_CLIP"),
+    ("EA_PowerLoraInspect", "EA Power LoRA Inspect", "ea_power_lora", "EA_PowerLoraInspect"),
+    ("EA_PowerLoraBake", "EA Power LoRA Bake", "ea_power_lora", "EA_PowerLoraBake"),
+    ("EA_PowerLora_WanVideo", "EA Power LoRA WanVideo", "ea_power_lora_wanvideo", "EA_PowerLora_WanVideo"),
+    ("EA_ProfilerDump", "EA Profiler Dump", "ea_profiler", "EA_ProfilerDump"),
+    ("EA_FilenameCombine", "EA Filename → Combine", "ea_simple_filename", "EA_SimpleFilenameCombine"),
+    ("EA_TrimFrames", "EA Trim Frames", "ea_trim_frames", "EA_TrimFrames"),
+    ("EA_TrimWindow", "EA Trim Window", "ea_trim_window", "EA_TrimWindow"),
+    ("EA_VideoLoad", "EA Video Load", "ea_video_io", "EA_VideoLoad"),
+    ("EA_ListVideos", "EA List Videos", "ea_video_io", "EA_ListVideos"),
+    ("EA_ManifestIndex", "EA Manifest Pick", "ea_video_io", "EA_ManifestIndex"),
+    ("EA_VideoSaveIdempotent", "EA Video Save (Idempotent)", "ea_video_save_idempotent", "EA_VideoSaveIdempotent"),
+    ("EA_VideoSaveBatch", "EA Video Save Batch", "ea_video_save_idempotent", "EA_VideoSaveBatch"),
+)
+
+# EA_NODES_EAGER=1 imports every module at startup (debugging / CI)
+EAGER = os.environ.get("EA_NODES_EAGER", "").strip().lower() in ("1", "true", "yes")
+
+_lock = threading.RLock()
+
+# stem -> {"status": "loaded" | "failed", "seconds", "trigger", "loaded_at", "error", "traceback", "warnings"}
+_MODULES: Dict[str, dict] = {}
+# node key -> stand-in class, so every caller of register() gets the same class objects
+_STANDINS: Dict[str, type] = {}
+_DUPLICATES: Dict[str, str] = {}
+
+def load_module(stem: str, trigger: str = "direct"):
+    """Import nodes/<stem>.py once per process as ea_nodes.<stem>, recording time or failure
+    (one log line per module: startup and deferred first-use loads alike).
+    A failed module is not re-executed; later calls re-raise the recorded error."""
+    name = f"{MODULE_PREFIX}.{stem}"
+    with _lock:
+        mod = sys.modules.get(name)
+        if mod is not None:
+            _MODULES.setdefault(stem, {"status": "loaded", "seconds": None, "trigger": "external",
+                                       "loaded_at": time.time(), "warnings": _check_specs(stem, mod)})
+            return mod
+        rec = _MODULES.get(stem)
+        if rec is not None and rec["status"] == "failed":
+            raise ImportError(f"nodes.{stem} failed to import: {rec['error']}")
+        t0 = time.perf_counter()
+        try:
+            spec = spec_from_file_location(name, NODES_DIR / f"{stem}.py")
+            if spec is None or spec.loader is None:
+                raise ImportError(f"no loader for nodes/{stem}.py")
+            mod = module_from_spec(spec)
+            # registered before exec so sibling modules can share state instead of re-executing each other
+            sys.modules[name] = mod
+            spec.loader.exec_module(mod)
+        except Exception as e:
+            sys.modules.pop(name, None)
+            _MODULES[stem] = {"status": "failed", "seconds": time.perf_counter() - t0, "trigger": trigger,
+                              "loaded_at": time.time(), "error": f"{type(e).__name__}: {e}",
+                              "traceback": traceback.format_exc(), "warnings": []}
+            print(f"[EA Nodes] Failed to load {stem} after {_MODULES[stem]['seconds'] * 1000:.1f} ms "
+                  f"({trigger}): {_MODULES[stem]['error']}")
+            raise
+        _MODULES[stem] = {"status": "loaded", "seconds": time.perf_counter() - t0, "trigger": trigger,
+                          "loaded_at": time.time(), "warnings": _check_specs(stem, mod)}
+        print(f"[EA Nodes] Loaded {stem} in {_MODULES[stem]['seconds'] * 1000:.1f} ms ({trigger})")
+        _instrument(mod)
+        return mod
+
+def profiler():
+    """The shared execution profiler (nodes/_profiler.py as ea_nodes._profiler)."""
+    return load_module("_profiler", trigger="profiler")
+
+def _instrument(mod):
+    """Wrap each node's FUNCTION with the profiler (a flag check while profiling is off)."""
+    try:
+        prof = profiler()
+        for key, cls in (getattr(mod, "NODE_CLASS_MAPPINGS", {}) or {}).items():
+            if isinstance(cls, type) and "_ea_key" not in cls.__dict__:
+                prof.instrument(cls, key)
+    except Exception as e:
+        print(f"[EA Nodes] Profiler hooks skipped for {getattr(mod, '__name__', mod)}: {e}")
+
+def _check_specs(stem: str, mod) -> list:
+    """Drift between a module's own mappings and NODE_SPECS (reported, not fatal)."""
+    classes = getattr(mod, "NODE_CLASS_MAPPINGS", {}) or {}
+    names = getattr(mod, "NODE_DISPLAY_NAME_MAPPINGS", {}) or {}
+    out = []
+    for key, display, spec_stem, _ in NODE_SPECS:
+        if spec_stem != stem:
+            continue
+        if key not in classes:
+            out.append(f"{key} is listed in NODE_SPECS but not defined")
+        elif names.get(key, display) != display:
+            out.append(f"display name for {key} is '{names[key]}', registry says '{display}'")
+    return out
+
+def load_report() -> dict:
+    """Queryable load state: per-module status/timing/errors and per-node deferred/loaded state."""
+    with _lock:
+        modules = {stem: dict(rec) for stem, rec in _MODULES.items()}
+        listed = {stem for _, _, stem, _ in NODE_SPECS}
+        for stem in listed - modules.keys():
+            modules[stem] = {"status": "deferred", "seconds": None, "trigger": None}
+        nodes = {}
+        for key, _, stem, _ in NODE_SPECS:
+            standin = _STANDINS.get(key)
+            nodes[key] = {"module": stem,
+                          "state": "loaded" if standin is None or "_ea_cls" in standin.__dict__ else "deferred"}
+        timed = [r["seconds"] for r in modules.values() if r.get("seconds") is not None]
+        return {
+            "modules": modules,
+            "nodes": nodes,
+            "duplicates": dict(_DUPLICATES),
+            "failed": sorted(s for s, r in modules.items() if r["status"] == "failed"),
+            "total_import_seconds": sum(timed),
+        }
+
+class _LazyNodeMeta(type):
+    """Stand-in node classes: attributes they don't define, and instantiation, are forwarded
+    to the real class, whose module is imported on first use."""
+
+    def _ea_real(cls):
+        real = cls.__dict__.get("_ea_cls")
+        if real is None:
+            mod = load_module(cls._ea_module, trigger=f"first use of {cls._ea_key}")
+            real = (getattr(mod, "NODE_CLASS_MAPPINGS", {}) or {}).get(cls._ea_key)
+            if real is None:
+                raise ImportError(f"nodes.{cls._ea_module} does not define {cls._ea_key}")
+            type.__setattr__(cls, "_ea_cls", real)
+        return real
+
+    def __getattr__(cls, name):
+        if name.startswith("__") or name.startswith("_ea_"):
+            raise AttributeError(name)  # dunder probes shouldn't force an import
+        return getattr(cls._ea_real(), name)
+
+    def __call__(cls, *args, **kwargs):
+        return cls._ea_real()(*args, **kwargs)
+
+    def _ea_peek(cls):
+        """Real class if its module is already imported (type checks never trigger an import)."""
+        if "_ea_cls" not in cls.__dict__ and f"{MODULE_PREFIX}.{cls._ea_module}" not in sys.modules:
+            return None
+        try:
+            return cls._ea_real()
+        except Exception:
+            return None
+
+    # Instances are created by the real class; isinstance/issubclass answer for it
+    def __instancecheck__(cls, obj):
+        real = cls._ea_peek()
+        return real is not None and isinstance(obj, real)
+
+    def __subclasscheck__(cls, sub):
+        if sub is cls:
+            return True
+        if type(sub) is _LazyNodeMeta:
+            sub = sub._ea_peek()
+        real = cls._ea_peek()
+        return real is not None and sub is not None and issubclass(sub, real)
+
+def lazy_class(key: str, stem: str, class_name: str) -> type:
+    with _lock:
+        cls = _STANDINS.get(key)
+        if cls is None:
+            cls = _STANDINS[key] = _LazyNodeMeta(class_name, (), {
+                "_ea_key": key,
+                "_ea_module": stem,
+                "__module__": f"{MODULE_PREFIX}.{stem}",
+                "__doc__": f"Deferred EA node {key} (imported from nodes/{stem}.py on first use).",
+            })
+        return cls
+
+def _merge(dst: dict, src: dict, origin: str):
+    if not isinstance(src, dict):
+        return
+    for k, v in src.items():
+        if k not in dst:
+            dst[k] = v
+        elif dst[k] is not v:
+            _DUPLICATES.setdefault(k, origin)  # first one wins; recorded for load_report()
+
+def register(class_map: dict, display_map: dict) -> dict:
+    """
+    Fill the two Comfy mappings: NODE_SPECS entries as deferred stand-ins (real classes
+    when EAGER or already imported), then any nodes/*.py not listed in NODE_SPECS eagerly.
+    Safe to call from both entry points: modules and stand-ins are shared, never rebuilt.
+    Failures are recorded in load_report(). Returns {"nodes", "deferred", "failed", "seconds"}.
+    """
+    t0 = time.perf_counter()
+    listed = {stem for _, _, stem, _ in NODE_SPECS}
+    deferred = 0
+    for key, display, stem, class_name in NODE_SPECS:
+        if key in class_map:
+            continue
+        if EAGER or f"{MODULE_PREFIX}.{stem}" in sys.modules:
+            try:
+                real = (getattr(load_module(stem, trigger="startup"), "NODE_CLASS_MAPPINGS", {}) or {}).get(key)
+            except Exception:
+                continue
+            if real is None:
+                continue
+            class_map[key] = real
+        else:
+            class_map[key] = lazy_class(key, stem, class_name)
+            deferred += 1
+        display_map.setdefault(key, display)
+
+    for p in sorted(NODES_DIR.glob("*.py")):
+        if p.name.startswith("_") or p.stem in listed:
+            continue
+        try:
+            mod = load_module(p.stem, trigger="startup")
+        except Exception:
+            continue
+        _merge(class_map, getattr(mod, "NODE_CLASS_MAPPINGS", {}), p.stem)
+        _merge(display_map, getattr(mod, "NODE_DISPLAY_NAME_MAPPINGS", {}), p.stem)
+
+    failed = sum(1 for r in _MODULES.values() if r["status"] == "failed")
+    return {"nodes": len(class_map), "deferred": deferred, "failed": failed, "seconds": time.perf_counter() - t0}
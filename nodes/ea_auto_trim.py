@@ -22,6 +22,45 @@
 #
 # Import-safe: no torch at module import time.
 
+import sys
+from contextlib import nullcontext
+from importlib.util import spec_from_file_location, module_from_spec
+from pathlib import Path
+
+def _registry():
+    """nodes/_registry.py, shared through sys.modules; loaded by path if this module was imported on its own."""
+    mod = sys.modules.get("ea_nodes._registry")
+    if mod is None:
+        spec = spec_from_file_location("ea_nodes._registry", Path(__file__).with_name("_registry.py"))
+        mod = module_from_spec(spec)
+        sys.modules["ea_nodes._registry"] = mod
+        try:
+            spec.loader.exec_module(mod)
+        except Exception:
+            sys.modules.pop("ea_nodes._registry", None)
+            raise
+    return mod
+
+class _NoProfiler:
+    stage = attach = staticmethod(lambda _: nullcontext())
+    current = staticmethod(lambda: None)
+
+class _Profiler:
+    """Shared execution profiler, looked up when a node first runs (no-op if it can't be loaded).
+    _PROFILER.stage(name) times a sub-stage; outside a profiled call it does nothing."""
+    _mod = None
+
+    def __getattr__(self, name):
+        if _Profiler._mod is None:
+            try:
+                _Profiler._mod = _registry().profiler()
+            except Exception as e:
+                print(f"[EA Nodes] Profiler unavailable, stages not timed: {e}")
+                _Profiler._mod = _NoProfiler
+        return getattr(_Profiler._mod, name)
+
+_PROFILER = _Profiler()
+
 class EA_AutoTrimPingPong:
     @classmethod
     def INPUT_TYPES(cls):
@@ -224,7 +263,8 @@ class EA_AutoTrimPingPong:
             return (images, first, first, N, 0, 0, empty, empty)
 
         # Build motion curve
-        diff, sm = self._motion_curve(images, metric_size, smooth)
+        with _PROFILER.stage("motion_curve"):
+            diff, sm = self._motion_curve(images, metric_size, smooth)
 
         # Windows in curve space (T = N-1). Keep them non-degenerate.
         T = max(1, int(diff.numel()))
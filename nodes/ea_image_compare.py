@@ -1,28 +1,75 @@
 """
 EA Image Compare - Side-by-side image comparison with captions
+Import-safe: torch / numpy / PIL are imported where they are used.
 """
-import torch
-import numpy as np
-from PIL import Image, ImageDraw, ImageFont
-import folder_paths
+import math
 import os
+import threading
+from functools import lru_cache
+
+FONT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+    "comfyui-kjnodes",
+    "fonts"
+)
+
+# How tiles that don't match the cell size are normalized
+LAYOUTS = ["pad", "fit", "crop"]
+
+# Shortest tile side the max_pixels budget may shrink a tile to
+_MIN_TILE_SIDE = 16
+
+# Process-wide caches: parsed fonts, rendered caption strips, font dir listing
+_FONT_CACHE_SIZE = 32
+_CAPTION_CACHE_SIZE = 64
+_font_list_lock = threading.Lock()
+_font_list_cache = {"mtime": None, "fonts": ["default"]}
+
 
 def get_fonts():
-    """Get available fonts from KJNodes or use default"""
-    font_dir = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-        "comfyui-kjnodes",
-        "fonts"
-    )
+    """Get available fonts from KJNodes or use default (rescanned only when the dir mtime changes)"""
+    try:
+        mtime = os.stat(FONT_DIR).st_mtime_ns
+    except OSError:
+        mtime = -1
+
+    with _font_list_lock:
+        if _font_list_cache["mtime"] == mtime:
+            return list(_font_list_cache["fonts"])
+
+        fonts = []
+        if mtime != -1:
+            fonts = [f for f in os.listdir(FONT_DIR) if f.endswith((".ttf", ".otf"))]
 
-    fonts = []
-    if os.path.exists(font_dir):
-        fonts = [f for f in os.listdir(font_dir) if f.endswith(('.ttf', '.otf'))]
+        if not fonts:
+            fonts = ["default"]
 
-    if not fonts:
-        fonts = ["default"]
+        _font_list_cache["mtime"] = mtime
+        _font_list_cache["fonts"] = fonts
+        return list(fonts)
 
-    return fonts
+
+@lru_cache(maxsize=_FONT_CACHE_SIZE)
+def load_font(font_name, font_size):
+    """Load (and cache) a KJNodes font by file name and size, falling back to PIL's default"""
+    from PIL import ImageFont
+
+    try:
+        if font_name != "default":
+            return ImageFont.truetype(os.path.join(FONT_DIR, font_name), font_size)
+    except Exception:
+        pass
+    return ImageFont.load_default()
+
+
+@lru_cache(maxsize=_CAPTION_CACHE_SIZE)
+def _caption_bitmap(text, width, height, font_size, font_color, bg_color, font_name):
+    """Rendered caption strip as a CPU [H, W, 3] float tensor (shared; never modify in place)"""
+    import numpy as np
+    import torch
+
+    img = EAImageCompareBase.render_caption(text, width, height, font_size, font_color, bg_color, font_name)
+    return torch.from_numpy(np.array(img).astype(np.float32) / 255.0)
 
 
 class EAImageCompareBase:
@@ -30,23 +77,17 @@ class EAImageCompareBase:
 
     def create_caption(self, text, width, height, font_size, font_color, bg_color, font_name):
         """Create a caption image with centered text"""
+        return self.render_caption(text, width, height, font_size, font_color, bg_color, font_name)
+
+    @staticmethod
+    def render_caption(text, width, height, font_size, font_color, bg_color, font_name):
+        """Render a caption image with centered text (uncached)"""
+        from PIL import Image, ImageDraw
+
         img = Image.new('RGB', (width, height), bg_color)
         draw = ImageDraw.Draw(img)
 
-        # Try to load font
-        try:
-            if font_name != "default":
-                font_dir = os.path.join(
-                    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                    "comfyui-kjnodes",
-                    "fonts"
-                )
-                font_path = os.path.join(font_dir, font_name)
-                font = ImageFont.truetype(font_path, font_size)
-            else:
-                font = ImageFont.load_default()
-        except:
-            font = ImageFont.load_default()
+        font = load_font(font_name, font_size)
 
         # Get text bounding box for centering
         try:
@@ -67,6 +108,9 @@ class EAImageCompareBase:
 
     def tensor_to_pil(self, tensor):
         """Convert ComfyUI IMAGE tensor to PIL Image"""
+        import numpy as np
+        from PIL import Image
+
         # ComfyUI images are [B, H, W, C] in 0-1 range
         img = tensor[0]  # Take first image from batch
         img = (img.cpu().numpy() * 255).astype(np.uint8)
@@ -74,64 +118,171 @@ class EAImageCompareBase:
 
     def pil_to_tensor(self, pil_image):
         """Convert PIL Image to ComfyUI IMAGE tensor"""
+        import numpy as np
+        import torch
+
         img = np.array(pil_image).astype(np.float32) / 255.0
         img = torch.from_numpy(img).unsqueeze(0)  # Add batch dimension
         return img
 
-    def compose_comparison(self, images, captions, scale, font_size, caption_height,
-                          font_color, background_color, spacing, font="default"):
-        """Compose multiple images into a comparison layout"""
-        # Convert all tensors to PIL and apply scale
-        pil_images = []
-        for img_tensor in images:
-            pil_img = self.tensor_to_pil(img_tensor)
-
-            # Apply scale if not 1.0
-            if scale != 1.0:
-                new_width = int(pil_img.width * scale)
-                new_height = int(pil_img.height * scale)
-                pil_img = pil_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
-            pil_images.append(pil_img)
-
-        # Validate all images have the same dimensions (after scaling)
-        first_size = pil_images[0].size
-        for i, img in enumerate(pil_images[1:], start=2):
-            if img.size != first_size:
-                raise ValueError(
-                    f"All images must have the same dimensions. "
-                    f"Image 1: {first_size}, Image {i}: {img.size}"
-                )
+    def color_rgb(self, color):
+        """Parse a PIL color string ("white", "#202020", ...) into 0-1 floats"""
+        from PIL import ImageColor
 
-        # Use actual image dimensions (after scaling, preserves aspect ratio)
+        try:
+            rgb = ImageColor.getrgb(color)
+        except (ValueError, AttributeError):
+            rgb = (0, 0, 0)
+        return tuple(c / 255.0 for c in rgb[:3])
+
+    def caption_tensor(self, text, width, height, font_size, font_color, bg_color, font_name, device):
+        """Caption strip as a [H, W, 3] tensor on device (rendered once per unique caption, then cached)"""
+        return _caption_bitmap(text, width, height, font_size, font_color, bg_color, font_name).to(device)
+
+    def resize_tensor(self, img, height, width):
+        """Resize [B, H, W, C] with antialiased bicubic (closest torch match to LANCZOS)"""
+        import torch.nn.functional as F
+
+        x = img.permute(0, 3, 1, 2).float()
+        x = F.interpolate(x, size=(height, width), mode="bicubic", antialias=True, align_corners=False)
+        return x.clamp_(0.0, 1.0).permute(0, 2, 3, 1)
+
+    def fit_tile(self, img, width, height, layout="pad"):
+        """
+        Normalize [B, h, w, C] to a width x height cell with a single resize.
+        fit stretches, pad letterboxes (returns the smaller tile and its offset
+        inside the cell), crop scales to cover and center-crops.
+        Returns (tile, x_offset, y_offset).
+        """
+        h, w = int(img.shape[1]), int(img.shape[2])
+        if (w, h) == (width, height):
+            return img, 0, 0
+        if layout == "fit":
+            return self.resize_tensor(img, height, width), 0, 0
+
+        s = min(width / w, height / h) if layout == "pad" else max(width / w, height / h)
+        nw = max(1, round(w * s))
+        nh = max(1, round(h * s))
+        if layout == "pad":
+            nw, nh = min(nw, width), min(nh, height)
+        img = self.resize_tensor(img, nh, nw)
+        if layout == "pad":
+            return img, (width - nw) // 2, (height - nh) // 2
+
+        x0 = max(0, (nw - width) // 2)
+        y0 = max(0, (nh - height) // 2)
+        return img[:, y0:y0 + height, x0:x0 + width], 0, 0
+
+    def compose_comparison(self, images, captions, scale, font_size, caption_height,
+                          font_color, background_color, spacing, font="default", layout="pad"):
+        """Compose multiple images (or whole frame batches) into a comparison layout"""
+        return self.compose_grid(
+            images, captions, len(images), font_size, caption_height,
+            font_color, background_color, spacing, font, scale=scale, layout=layout
+        )
+
+    @staticmethod
+    def fit_budget(width, height, canvas_size, max_pixels):
+        """
+        Largest tile size (same aspect) whose canvas fits max_pixels. The
+        bands don't scale, so the canvas area is a quadratic in the tile
+        scale f: solve it, then clamp tiles to _MIN_TILE_SIDE.
+        """
+        if width < 1 or height < 1:
+            return width, height
+        bw, bh = canvas_size(0, 0)
+        gw, gh = (v - b for v, b in zip(canvas_size(width, height), (bw, bh)))
+        # (gw*f + bw) * (gh*f + bh) = max_pixels
+        a, b, c = gw * gh, gw * bh + gh * bw, bw * bh - max_pixels
+        f = (-b + math.sqrt(b * b - 4 * a * c)) / (2 * a) if c < 0 else 0.0
+        f = max(f, min(1.0, _MIN_TILE_SIDE / float(min(width, height))))
+        # int() rounds down, so only the _MIN_TILE_SIDE clamp can leave the canvas over budget
+        return max(1, int(width * f)), max(1, int(height * f))
+
+    def compose_grid(self, images, captions, columns, font_size, caption_height,
+                     font_color, background_color, spacing, font="default", scale=1.0,
+                     row_labels=None, col_labels=None, label_width=0, max_pixels=0, layout="pad",
+                     hide_empty_captions=False):
+        """
+        Compose inputs row-major into a grid in one preallocated pass.
+        Each input may be a frame batch: single images broadcast across the
+        longest input, shorter batches hold their last frame. Captions sit
+        above each tile, optional column labels form a header row and row
+        labels a left strip; hide_empty_captions drops the caption band when
+        every caption is empty. max_pixels > 0 downsamples tiles so one output
+        frame, bands included, fits the pixel budget (tiles stop at
+        _MIN_TILE_SIDE). The cell size is image 1's scaled size; other sizes
+        are normalized to it per `layout` (see fit_tile) in the same pass.
+        """
+        import torch
+
+        num_images = len(images)
+        num_frames = max(int(t.shape[0]) for t in images)
+        captions = list(captions or [])
+        captions += [""] * (num_images - len(captions))
+        row_labels = list(row_labels or [])
+        col_labels = list(col_labels or [])
+
+        # Cell size follows image 1 (after scaling); mismatched inputs are fit to it
+        first_size = (int(int(images[0].shape[2]) * scale), int(int(images[0].shape[1]) * scale))
+
+        cols = max(1, min(int(columns), num_images))
+        rows = (num_images + cols - 1) // cols
+        cap_h = 0 if hide_empty_captions and not any(captions) else int(caption_height)
+        head_h = int(caption_height) if col_labels else 0
+        label_w = int(label_width) if row_labels else 0
+
+        def canvas_size(w, h):
+            return (label_w + cols * w + spacing * (cols - 1),
+                    head_h + rows * (cap_h + h) + spacing * (rows - 1))
+
+        # Use actual image dimensions (after scaling, preserves aspect ratio),
+        # shrunk further if the canvas would exceed the pixel budget
         width, height = first_size
+        total_width, total_height = canvas_size(width, height)
+        if max_pixels and total_width * total_height > max_pixels:
+            width, height = self.fit_budget(width, height, canvas_size, max_pixels)
+            total_width, total_height = canvas_size(width, height)
+            if total_width * total_height > max_pixels:
+                print(f"[EA Image Compare] Grid is {total_width}x{total_height} even at {width}x{height} tiles; "
+                      f"labels and captions alone exceed the {max_pixels / 1e6:.2f} MP budget")
+
+        device = images[0].device
+
+        # Preallocate the composite, filled with the background color
+        composite = torch.empty((num_frames, total_height, total_width, 3), dtype=torch.float32, device=device)
+        composite[:] = torch.tensor(self.color_rgb(background_color), dtype=torch.float32, device=device)
+
+        def put_label(text, x, y, w, h):
+            if text and w > 0 and h > 0:
+                composite[:, y:y + h, x:x + w] = self.caption_tensor(
+                    text, w, h, font_size, font_color, background_color, font, device
+                )
 
-        # Create caption images for each
-        caption_images = []
-        for caption in captions:
-            cap_img = self.create_caption(
-                caption, width, caption_height, font_size,
-                font_color, background_color, font
-            )
-            caption_images.append(cap_img)
+        for c, text in enumerate(col_labels[:cols]):
+            put_label(text, label_w + c * (width + spacing), 0, width, head_h)
+        for r, text in enumerate(row_labels[:rows]):
+            put_label(text, 0, head_h + r * (cap_h + height + spacing), label_w, cap_h + height)
 
-        # Calculate dimensions for final image
-        num_images = len(pil_images)
-        total_width = width * num_images + spacing * (num_images - 1)
-        total_height = caption_height + height
+        # Write each caption strip (rendered once, broadcast over frames) and tile by slice assignment
+        for i, (img, caption) in enumerate(zip(images, captions)):
+            r, c = divmod(i, cols)
+            x = label_w + c * (width + spacing)
+            y = head_h + r * (cap_h + height + spacing)
+            put_label(caption, x, y, width, cap_h)
 
-        # Create composite image
-        composite = Image.new('RGB', (total_width, total_height), background_color)
+            # Scale/fit on the input's own device (vectorized over the batch)
+            img, ox, oy = self.fit_tile(img[:, :, :, :3], width, height, layout)
+            img = img.to(device=device, dtype=torch.float32)
 
-        # Paste each image with its caption
-        x_offset = 0
-        for img, cap_img in zip(pil_images, caption_images):
-            composite.paste(cap_img, (x_offset, 0))
-            composite.paste(img, (x_offset, caption_height))
-            x_offset += width + spacing
+            n, th, tw = int(img.shape[0]), int(img.shape[1]), int(img.shape[2])
+            x += ox
+            y += cap_h + oy
+            composite[:n, y:y + th, x:x + tw] = img
+            if n < num_frames:
+                composite[n:, y:y + th, x:x + tw] = img[-1:]
 
-        # Convert back to ComfyUI tensor
-        return self.pil_to_tensor(composite)
+        return composite
 
 
 class EAImageCompare(EAImageCompareBase):
@@ -159,6 +310,7 @@ class EAImageCompare(EAImageCompareBase):
             },
             "optional": {
                 "font": (fonts, {"default": fonts[0] if fonts else "default"}),
+                "layout": (LAYOUTS, {"default": "pad"}),
             }
         }
 
@@ -169,16 +321,18 @@ class EAImageCompare(EAImageCompareBase):
     DESCRIPTION = """
 Compare 2 images side-by-side with captions.
 Scale parameter resizes all images proportionally (1.0 = original size).
+Images of a different size than image 1 are letterboxed (pad), stretched (fit) or cropped (crop).
+Image batches (videos) are compared frame by frame; single images are held.
 """
 
     def compare_images(self, image_1, caption_1, image_2, caption_2,
                       scale, font_size, caption_height, font_color,
-                      background_color, spacing, font="default"):
+                      background_color, spacing, font="default", layout="pad"):
         return (self.compose_comparison(
             [image_1, image_2],
             [caption_1, caption_2],
             scale, font_size, caption_height,
-            font_color, background_color, spacing, font
+            font_color, background_color, spacing, font, layout
         ),)
 
 
@@ -209,6 +363,7 @@ class EAImageCompare3Way(EAImageCompareBase):
             },
             "optional": {
                 "font": (fonts, {"default": fonts[0] if fonts else "default"}),
+                "layout": (LAYOUTS, {"default": "pad"}),
             }
         }
 
@@ -219,16 +374,18 @@ class EAImageCompare3Way(EAImageCompareBase):
     DESCRIPTION = """
 Compare 3 images side-by-side with captions.
 Scale parameter resizes all images proportionally (1.0 = original size).
+Images of a different size than image 1 are letterboxed (pad), stretched (fit) or cropped (crop).
+Image batches (videos) are compared frame by frame; single images are held.
 """
 
     def compare_images(self, image_1, caption_1, image_2, caption_2,
                       image_3, caption_3, scale, font_size, caption_height,
-                      font_color, background_color, spacing, font="default"):
+                      font_color, background_color, spacing, font="default", layout="pad"):
         return (self.compose_comparison(
             [image_1, image_2, image_3],
             [caption_1, caption_2, caption_3],
             scale, font_size, caption_height,
-            font_color, background_color, spacing, font
+            font_color, background_color, spacing, font, layout
         ),)
 
 
@@ -261,6 +418,7 @@ class EAImageCompare4Way(EAImageCompareBase):
             },
             "optional": {
                 "font": (fonts, {"default": fonts[0] if fonts else "default"}),
+                "layout": (LAYOUTS, {"default": "pad"}),
             }
         }
 
@@ -271,17 +429,99 @@ class EAImageCompare4Way(EAImageCompareBase):
     DESCRIPTION = """
 Compare 4 images side-by-side with captions.
 Scale parameter resizes all images proportionally (1.0 = original size).
+Images of a different size than image 1 are letterboxed (pad), stretched (fit) or cropped (crop).
+Image batches (videos) are compared frame by frame; single images are held.
 """
 
     def compare_images(self, image_1, caption_1, image_2, caption_2,
                       image_3, caption_3, image_4, caption_4,
                       scale, font_size, caption_height, font_color,
-                      background_color, spacing, font="default"):
+                      background_color, spacing, font="default", layout="pad"):
         return (self.compose_comparison(
             [image_1, image_2, image_3, image_4],
             [caption_1, caption_2, caption_3, caption_4],
             scale, font_size, caption_height,
-            font_color, background_color, spacing, font
+            font_color, background_color, spacing, font, layout
+        ),)
+
+
+class EAImageCompareGrid(EAImageCompareBase):
+    """
+    Compare any number of images in an automatic grid.
+    Perfect for LoRA strength x seed sweeps.
+    """
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        fonts = get_fonts()
+
+        return {
+            "required": {
+                "images": ("IMAGE",),
+                "captions": ("STRING", {"default": "", "multiline": True}),
+                "columns": ("INT", {"default": 0, "min": 0, "max": 64, "step": 1}),
+                "scale": ("FLOAT", {"default": 1.0, "min": 0.1, "max": 2.0, "step": 0.05}),
+                "font_size": ("INT", {"default": 32, "min": 12, "max": 200, "step": 1}),
+                "caption_height": ("INT", {"default": 60, "min": 20, "max": 200, "step": 1}),
+                "font_color": ("STRING", {"default": "white"}),
+                "background_color": ("STRING", {"default": "black"}),
+                "spacing": ("INT", {"default": 4, "min": 0, "max": 50, "step": 1}),
+                "max_megapixels": ("FLOAT", {"default": 32.0, "min": 0.0, "max": 512.0, "step": 0.5}),
+            },
+            "optional": {
+                "row_labels": ("STRING", {"default": "", "multiline": True}),
+                "col_labels": ("STRING", {"default": "", "multiline": True}),
+                "label_width": ("INT", {"default": 160, "min": 0, "max": 1024, "step": 1}),
+                "font": (fonts, {"default": fonts[0] if fonts else "default"}),
+                "layout": (LAYOUTS, {"default": "pad"}),
+                "hide_empty_captions": ("BOOLEAN", {"default": False}),
+            }
+        }
+
+    RETURN_TYPES = ("IMAGE",)
+    RETURN_NAMES = ("comparison",)
+    FUNCTION = "compare_grid"
+    CATEGORY = "EA / IO"
+    DESCRIPTION = """
+Compare a batch of images in a grid; each image in the batch is one tile.
+Captions, row labels and column labels are one per line.
+Columns = 0 picks the layout automatically (column labels, then row labels, then a square-ish grid).
+Tiles are downsampled when one output image would exceed max_megapixels (0 = no limit).
+Layout decides how tiles that differ from the first image's size are normalized (pad / fit / crop).
+Hide empty captions drops the caption band when no caption text is given.
+"""
+
+    @staticmethod
+    def _lines(text):
+        return [line.strip() for line in (text or "").splitlines()]
+
+    @staticmethod
+    def auto_columns(count, columns=0, rows_hint=0, cols_hint=0):
+        if columns > 0:
+            return columns
+        if cols_hint > 0:
+            return cols_hint
+        if rows_hint > 0:
+            return (count + rows_hint - 1) // rows_hint
+        return max(1, math.ceil(math.sqrt(count)))
+
+    def compare_grid(self, images, captions, columns, scale, font_size, caption_height,
+                     font_color, background_color, spacing, max_megapixels,
+                     row_labels="", col_labels="", label_width=160, font="default", layout="pad",
+                     hide_empty_captions=False):
+        tiles = [images[i:i + 1] for i in range(int(images.shape[0]))]
+        if not tiles:
+            return (images,)
+        caption_list = self._lines(captions)
+        rows = [t for t in self._lines(row_labels) if t]
+        cols = [t for t in self._lines(col_labels) if t]
+        return (self.compose_grid(
+            tiles, caption_list,
+            self.auto_columns(len(tiles), int(columns), len(rows), len(cols)),
+            font_size, caption_height, font_color, background_color, spacing, font,
+            scale=scale, row_labels=rows, col_labels=cols, label_width=label_width,
+            max_pixels=int(max_megapixels * 1_000_000), layout=layout,
+            hide_empty_captions=hide_empty_captions
         ),)
 
 
@@ -289,10 +529,12 @@ NODE_CLASS_MAPPINGS = {
     "EAImageCompare": EAImageCompare,
     "EAImageCompare3Way": EAImageCompare3Way,
     "EAImageCompare4Way": EAImageCompare4Way,
+    "EAImageCompareGrid": EAImageCompareGrid,
 }
 
 NODE_DISPLAY_NAME_MAPPINGS = {
     "EAImageCompare": "EA Image Compare",
     "EAImageCompare3Way": "EA 3-Way Image Compare",
     "EAImageCompare4Way": "EA 4-Way Image Compare",
+    "EAImageCompareGrid": "EA Image Compare Grid",
 }
@@ -2,37 +2,45 @@
 # One dial → steps/split/sigmas + Lightning weights + add-noise hints.
 # Import-safe (no heavy deps at import time).
 
-from typing import List, Tuple
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 def _clamp(x, lo, hi): return lo if x < lo else hi if x > hi else x
-def _lerp(a: float, b: float, t: float): return a + (b - a) * t
-def _round5(x: float) -> float: return float(f"{x:.5f}")
+def _round5(x: float) -> float: return round(float(x), 5)
 
-def _strictly_decreasing(vals: List[float]) -> List[float]:
-    out, prev = [], 10.0
-    for v in vals:
-        v = min(v, prev - 1e-6); out.append(v); prev = v
-    return out
+def _sigma_grid(steps: int, biases, profile: str, decimals: Optional[int] = 5):
+    """[len(biases), steps + 1] Custom schedules in one NumPy pass.
+    hold_high: 1 - t**lerp(1.1, 3.0, bias); big_drop: (1 - t)**lerp(0.8, 1.4, bias);
+    then strictly decreasing with the ends pinned to 1.0 / 0.0. decimals=None keeps full precision.
+    """
+    import numpy as np
+
+    b = np.clip(np.asarray(biases, dtype=np.float64), 0.0, 1.0)[:, None]
+    t = np.arange(steps, dtype=np.float64)[None, :] / float(steps)
+    if profile == "big_drop":
+        vals = (1.0 - t) ** (0.8 + 0.6 * b)
+    else:
+        vals = 1.0 - t ** (1.1 + 1.9 * b)
+    vals = np.concatenate([vals, np.zeros((vals.shape[0], 1))], axis=1)
+    # out[i] = min(v[i], out[i-1] - 1e-6) == min_j<=i(v[j] + j*1e-6) - i*1e-6
+    ramp = np.arange(steps + 1, dtype=np.float64) * 1e-6
+    vals = np.minimum.accumulate(vals + ramp, axis=1) - ramp
+    vals[:, 0], vals[:, -1] = 1.0, 0.0
+    return vals if decimals is None else np.round(vals, decimals)
+
+def _format_sigmas(vals) -> str:
+    return ", ".join(f"{float(v):.5f}".rstrip("0").rstrip(".") for v in vals)
 
-def _sigmas_hold_high(steps: int, bias: float) -> List[float]:
-    p = _lerp(1.1, 3.0, _clamp(bias, 0.0, 1.0))
-    vals = []
-    for i in range(steps):
-        t = i / float(steps); vals.append(1.0 - (t ** p))
-    vals.append(0.0)
-    vals = _strictly_decreasing(vals)
-    vals[0], vals[-1] = 1.0, 0.0
-    return [_round5(v) for v in vals]
-
-def _sigmas_big_drop(steps: int, bias: float) -> List[float]:
-    q = _lerp(0.8, 1.4, _clamp(bias, 0.0, 1.0))
-    vals = []
-    for i in range(steps):
-        t = i / float(steps); vals.append((1.0 - t) ** q)
-    vals.append(0.0)
-    vals = _strictly_decreasing(vals)
-    vals[0], vals[-1] = 1.0, 0.0
-    return [_round5(v) for v in vals]
+def _sigma_tensors(vals, split_step: int):
+    """(full, high, low) SIGMAS; high/low share the boundary sigma like Comfy's SplitSigmas."""
+    import torch
+
+    full = torch.as_tensor(vals, dtype=torch.float32)
+    return full, full[: split_step + 1].clone(), full[split_step:].clone()
 
 # Presets: exact outputs (independent of Custom controls)
 _PRESETS = {
@@ -108,13 +116,240 @@ def _noise_hints(bias: float) -> Tuple[bool, bool]:
     b = _clamp(bias, 0.0, 1.0)
     return (b >= 0.65, False)
 
+# ---------------- user preset library ----------------
+
+# Extra preset folders (os.pathsep-separated); scanned after the user folder
+_PRESET_DIRS_ENV = "EA_MOTION_BIAS_PRESETS"
+# Under ComfyUI's user directory; the Fit node saves here
+_USER_PRESET_SUBDIR = ("ea_nodes", "motion_bias_presets")
+
+def _user_preset_dir() -> Optional[Path]:
+    try:
+        import folder_paths
+        return Path(folder_paths.get_user_directory()).joinpath(*_USER_PRESET_SUBDIR)
+    except Exception:
+        return None
+
+_CUSTOM_KEYS = ("steps", "motion_bias", "profile", "base_high", "base_low", "min_low_steps")
+_PRESET_DEFAULTS = {"cfg_high": 1.0, "cfg_low": 1.0, "add_noise_high": False, "add_noise_low": False,
+                    "scheduler_hint": "euler"}
+
+def _normalize_preset(name: str, raw: dict) -> dict:
+    """Validate one preset: exact (steps/split_step/sigmas/weights) or {"custom": {...Custom controls}}."""
+    if not isinstance(raw, dict):
+        raise ValueError("preset must be a table/object")
+    if isinstance(raw.get("custom"), dict):
+        custom = raw["custom"]
+        missing = [k for k in ("steps", "motion_bias", "profile", "base_high", "base_low") if k not in custom]
+        if missing:
+            raise ValueError(f"custom preset missing {missing}")
+        if custom["profile"] not in ("hold_high", "big_drop"):
+            raise ValueError(f"unknown profile {custom['profile']!r}")
+        cfg = dict(_PRESET_DEFAULTS, **{k: v for k, v in raw.items() if k != "custom"})
+        cfg["custom"] = {k: custom[k] for k in _CUSTOM_KEYS if k in custom}
+        return cfg
+    cfg = dict(_PRESET_DEFAULTS, **raw)
+    for k in ("steps", "split_step", "sigmas", "high_weight", "low_weight"):
+        if k not in cfg:
+            raise ValueError(f"missing {k!r}")
+    sig = [float(v) for v in cfg["sigmas"]]
+    if len(sig) != int(cfg["steps"]) + 1:
+        raise ValueError(f"{len(sig)} sigmas for {cfg['steps']} steps (need steps + 1)")
+    if any(b >= a for a, b in zip(sig, sig[1:])):
+        raise ValueError("sigmas must be strictly decreasing")
+    if not 1 <= int(cfg["split_step"]) < int(cfg["steps"]):
+        raise ValueError("split_step must be in [1, steps)")
+    cfg["sigmas"] = sig
+    return cfg
+
+def _load_preset_file(path: Path) -> Dict[str, dict]:
+    """A file holds one preset (with "name") or a mapping of name -> preset."""
+    if path.suffix.lower() == ".toml":
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise ValueError("TOML presets need Python 3.11+ or the tomli package") from None
+        data = tomllib.loads(path.read_text(encoding="utf-8"))
+    else:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    if isinstance(data, dict) and "name" in data:
+        data = {str(data["name"]): {k: v for k, v in data.items() if k != "name"}}
+    if isinstance(data, dict) and isinstance(data.get("presets"), dict):
+        data = data["presets"]
+    if not isinstance(data, dict):
+        raise ValueError("expected an object of presets")
+    return {str(name): _normalize_preset(str(name), cfg) for name, cfg in data.items()}
+
+class _PresetLibrary:
+    """Built-in presets plus *.json / *.toml files from the user and EA_MOTION_BIAS_PRESETS folders.
+    Files are re-read only when their (mtime, size) changes; the folder scan runs at most every _RESCAN_S.
+    Later folders and files override earlier ones; built-ins can be overridden by name.
+    """
+
+    _RESCAN_S = 2.0
+
+    def __init__(self, builtin: Dict[str, dict]):
+        self._builtin = builtin
+        self._lock = threading.Lock()
+        self._files: Dict[Path, Tuple[Tuple[int, int], Dict[str, dict]]] = {}
+        self._index: Dict[str, dict] = dict(builtin)
+        self._folded: Dict[str, str] = {k.casefold(): k for k in builtin}
+        self._scanned = 0.0
+
+    @staticmethod
+    def dirs() -> List[Path]:
+        extra = [Path(p) for p in os.environ.get(_PRESET_DIRS_ENV, "").split(os.pathsep) if p.strip()]
+        user = _user_preset_dir()
+        return ([user] if user is not None else []) + extra
+
+    def _refresh(self):
+        now = time.monotonic()
+        if now - self._scanned < self._RESCAN_S:
+            return
+        self._scanned = now
+        seen: Dict[Path, Tuple[Tuple[int, int], Dict[str, dict]]] = {}
+        changed = False
+        for d in self.dirs():
+            try:
+                entries = sorted(e for e in d.iterdir() if e.suffix.lower() in (".json", ".toml") and e.is_file())
+            except OSError:
+                continue
+            for path in entries:
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                stamp = (st.st_mtime_ns, st.st_size)
+                cached = self._files.get(path)
+                if cached is not None and cached[0] == stamp:
+                    seen[path] = cached
+                    continue
+                changed = True
+                try:
+                    seen[path] = (stamp, _load_preset_file(path))
+                except Exception as e:
+                    print(f"[EA Motion Bias] Skipping preset file {path}: {e}")
+                    seen[path] = (stamp, {})
+        if changed or seen.keys() != self._files.keys():
+            index = dict(self._builtin)
+            for _, presets in seen.values():
+                index.update(presets)
+            self._index = index
+            self._folded = {k.casefold(): k for k in index}
+        self._files = seen
+
+    def names(self) -> List[str]:
+        with self._lock:
+            self._refresh()
+            user = sorted(k for k in self._index if k not in self._builtin)
+        return list(self._builtin) + user
+
+    def get(self, name: str) -> Optional[dict]:
+        with self._lock:
+            self._refresh()
+            cfg = self._index.get(name)
+            if cfg is None:
+                key = self._folded.get(str(name).casefold())
+                cfg = self._index.get(key) if key else None
+        return cfg
+
+_PRESET_LIBRARY = _PresetLibrary(_PRESETS)
+
+# Dropdown order for the built-ins (default first)
+_BUILTIN_ORDER = ["Aggressive 3/2", "Balanced 3/2", "Speedrun 4/1", "Detail 6/2", "Lightning Default 2/2"]
+
+def _preset_choices() -> List[str]:
+    names = _PRESET_LIBRARY.names()
+    return [n for n in _BUILTIN_ORDER if n in names] + [n for n in names if n not in _BUILTIN_ORDER] + ["Custom"]
+
+def _preset_overlays() -> Dict[str, dict]:
+    """Resolved values per preset for the web overlay (sent with the preset combo's options).
+    Exact presets carry their outputs; Custom-pinned presets carry the pinned controls."""
+    out: Dict[str, dict] = {}
+    for name in _PRESET_LIBRARY.names():
+        cfg = _PRESET_LIBRARY.get(name)
+        if cfg is None:
+            continue
+        if "custom" in cfg:
+            out[name] = {"custom": dict(cfg["custom"])}
+            continue
+        out[name] = {
+            "steps": int(cfg["steps"]), "split": int(cfg["split_step"]),
+            "sigmas": [_round5(v) for v in cfg["sigmas"]],
+            "high": float(cfg["high_weight"]), "low": float(cfg["low_weight"]),
+            "cfgHigh": float(cfg["cfg_high"]), "cfgLow": float(cfg["cfg_low"]),
+            "addNoiseHigh": bool(cfg["add_noise_high"]), "addNoiseLow": bool(cfg["add_noise_low"]),
+            "scheduler": str(cfg["scheduler_hint"]),
+        }
+    return out
+
+# ---------------- fitting (target sigmas -> Custom controls) ----------------
+
+def _fit_custom(target: List[float], high_weight: Optional[float] = None, low_weight: Optional[float] = None,
+                split_step: Optional[int] = None) -> dict:
+    """
+    Nearest Custom settings for a target sigma list: a vectorized coarse-to-fine search over
+    motion_bias for both profiles (least squares on the sigmas), then base weights solved in
+    closed form from the target weights and min_low_steps picked to reproduce split_step.
+    Custom can only lower its natural split round(steps * (0.5 + 0.2 * bias)), so a later split
+    (e.g. Speedrun 4/1) may be out of reach; split_exact reports whether it was met.
+    """
+    import numpy as np
+
+    tgt = np.asarray([float(v) for v in target], dtype=np.float64)
+    steps = len(tgt) - 1
+    if steps < 3:
+        raise ValueError("need at least 4 sigmas (Custom profiles use 3+ steps)")
+
+    best = None
+    for profile in ("hold_high", "big_drop"):
+        lo, hi = 0.0, 1.0
+        for n in (1001, 201):
+            grid = np.linspace(lo, hi, n)
+            err = np.sqrt(np.mean((_sigma_grid(steps, grid, profile, decimals=None) - tgt) ** 2, axis=1))
+            k = int(np.argmin(err))
+            span = (hi - lo) / (n - 1)
+            lo, hi = max(0.0, grid[k] - span), min(1.0, grid[k] + span)
+        bias = float(grid[k])
+        if best is None or err[k] < best["rmse"]:
+            best = {"profile": profile, "motion_bias": bias, "rmse": float(err[k])}
+
+    bias = round(best["motion_bias"], 4)
+    fitted = _sigma_grid(steps, [bias], best["profile"], decimals=None)[0]
+    out = {
+        "steps": steps,
+        "motion_bias": bias,
+        "profile": best["profile"],
+        "base_high": round(_clamp((high_weight if high_weight is not None else 1.04) / (1.0 + 0.25 * bias), 0.0, 2.0), 4),
+        "base_low": round(_clamp((low_weight if low_weight is not None else 1.14) / (1.0 - 0.15 * bias), 0.0, 2.0), 4),
+        "min_low_steps": 2,
+        "rmse": round(float(np.sqrt(np.mean((fitted - tgt) ** 2))), 6),
+        "max_error": round(float(np.max(np.abs(fitted - tgt))), 6),
+        "fitted_sigmas": [_round5(v) for v in fitted],
+    }
+
+    # min_low_steps only caps the split; pick the value that lands on the requested one
+    natural = max(1, int(round(steps * (0.5 + 0.2 * bias))))
+    if split_step:
+        options = []
+        for m in range(1, 5):
+            mm = int(_clamp(m, 1, max(1, steps - 1)))
+            options.append((abs(max(1, min(natural, steps - mm)) - int(split_step)), abs(m - 2), m))
+        out["min_low_steps"] = min(options)[2]
+    out["split_step"] = max(1, min(natural, steps - int(_clamp(out["min_low_steps"], 1, max(1, steps - 1)))))
+    out["split_exact"] = not split_step or out["split_step"] == int(split_step)
+    return out
+
 class EA_LightningMotionBias:
     @classmethod
     def INPUT_TYPES(cls):
         return {
             "required": {
                 # Default remains Aggressive 3/2
-                "preset": (["Aggressive 3/2", "Balanced 3/2", "Speedrun 4/1", "Detail 6/2", "Lightning Default 2/2", "Custom"], {"default": "Aggressive 3/2"}),
+                "preset": (_preset_choices(), {"default": "Aggressive 3/2", "ea_presets": _preset_overlays()}),
                 # Custom controls (ignored when preset != Custom)
                 "steps": ("INT", {"default": 5, "min": 3, "max": 12}),
                 "motion_bias": ("FLOAT", {"default": 0.80, "min": 0.0, "max": 1.0, "step": 0.01}),
@@ -128,25 +363,31 @@ class EA_LightningMotionBias:
             },
         }
 
-    RETURN_TYPES = ("INT","INT","STRING","FLOAT","FLOAT","BOOLEAN","BOOLEAN")
-    RETURN_NAMES  = ("steps","split_step","sigmas_str","lightning_high_weight","lightning_low_weight","add_noise_high","add_noise_low")
+    RETURN_TYPES = ("INT","INT","STRING","FLOAT","FLOAT","BOOLEAN","BOOLEAN","SIGMAS","SIGMAS","SIGMAS")
+    RETURN_NAMES  = ("steps","split_step","sigmas_str","lightning_high_weight","lightning_low_weight","add_noise_high","add_noise_low",
+                     "sigmas","sigmas_high","sigmas_low")
     CATEGORY = "EA / Schedules"
     FUNCTION = "compute"
 
     @staticmethod
     def compute(preset: str, steps: int, motion_bias: float, profile: str, base_high: float, base_low: float, min_low_steps: int = 2):
-        # Preset path: emit exact values
-        if preset in _PRESETS and preset != "Custom":
-            cfg = _PRESETS[preset]
-            sigmas_str = ", ".join(f"{float(v):.5f}".rstrip("0").rstrip(".") for v in cfg["sigmas"])
+        # Preset path: emit exact values (library presets may instead pin Custom controls)
+        cfg = _PRESET_LIBRARY.get(preset) if preset != "Custom" else None
+        if cfg is not None and "custom" in cfg:
+            c = cfg["custom"]
+            return EA_LightningMotionBias.compute("Custom", int(c["steps"]), float(c["motion_bias"]), c["profile"],
+                                                  float(c["base_high"]), float(c["base_low"]),
+                                                  int(c.get("min_low_steps", 2)))
+        if cfg is not None:
             return (
                 int(cfg["steps"]),
                 int(cfg["split_step"]),
-                sigmas_str,
+                _format_sigmas(cfg["sigmas"]),
                 float(cfg["high_weight"]),
                 float(cfg["low_weight"]),
                 bool(cfg["add_noise_high"]),
                 bool(cfg["add_noise_low"]),
+                *_sigma_tensors(cfg["sigmas"], int(cfg["split_step"])),
             )
 
         # Custom path
@@ -158,8 +399,8 @@ class EA_LightningMotionBias:
         split_step = int(round(steps * split_f))
         split_step = max(1, min(split_step, steps - min_low_steps))
 
-        sigmas = _sigmas_big_drop(steps, bias) if profile == "big_drop" else _sigmas_hold_high(steps, bias)
-        sigmas_str = ", ".join(f"{v:.5f}".rstrip("0").rstrip(".") for v in sigmas)
+        # Full precision for the SIGMAS outputs; 5 decimals only for the display string
+        sigmas = _sigma_grid(steps, [bias], profile, decimals=None)[0]
 
         high_weight = _round5(base_high * (1.0 + 0.25 * bias))
         low_weight  = _round5(base_low  * (1.0 - 0.15 * bias))
@@ -169,12 +410,211 @@ class EA_LightningMotionBias:
         return (
             int(steps),
             int(split_step),
-            sigmas_str,
+            _format_sigmas(_round5(v) for v in sigmas),
             float(high_weight),
             float(low_weight),
             bool(add_noise_high),
             bool(add_noise_low),
+            *_sigma_tensors(sigmas, split_step),
         )
 
-NODE_CLASS_MAPPINGS = {"EA_LightningMotionBias": EA_LightningMotionBias}
-NODE_DISPLAY_NAME_MAPPINGS = {"EA_LightningMotionBias": "EA Motion Bias (Lightning)"}
+# ---------------- sweep (vectorized Custom grid) ----------------
+
+_PROFILES = ["hold_high", "big_drop"]
+_SWEEP_MAX_ROWS = 4096
+
+def _parse_values(spec: str, integer: bool = False) -> List[float]:
+    """'0.2, 0.5, 0.8' and/or inclusive ranges 'start:stop[:step]'; order kept, duplicates dropped."""
+    out: List[float] = []
+    for part in str(spec or "").replace(";", ",").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if ":" in part:
+            bits = [float(x) for x in part.split(":")]
+            start, stop = bits[0], bits[1]
+            step = abs(bits[2]) if len(bits) > 2 and bits[2] else (1.0 if integer else 0.1)
+            n = int((abs(stop - start) + step * 1e-6) // step)
+            sign = 1.0 if stop >= start else -1.0
+            vals = [start + sign * step * i for i in range(n + 1)]
+        else:
+            vals = [float(part)]
+        for v in vals:
+            v = float(int(round(v))) if integer else round(v, 6)
+            if v not in out:
+                out.append(v)
+    return out
+
+def _sweep(steps_values: List[int], biases: List[float], profiles: List[str],
+           base_high: float, base_low: float, min_low_steps: int) -> Tuple[List[dict], list]:
+    """Every Custom schedule for profiles x steps x biases, vectorized over biases.
+    Returns (table rows with 5-decimal sigmas, full-precision sigma arrays)."""
+    import numpy as np
+
+    b = np.clip(np.asarray(biases, dtype=np.float64), 0.0, 1.0)
+    high = np.round(base_high * (1.0 + 0.25 * b), 5)
+    low = np.round(base_low * (1.0 - 0.15 * b), 5)
+    noise_high = b >= 0.65
+    rows: List[dict] = []
+    raw: list = []
+    for profile in profiles:
+        for steps in steps_values:
+            steps = int(max(3, steps))
+            min_low = int(_clamp(min_low_steps, 1, max(1, steps - 1)))
+            split = np.clip(np.round(steps * (0.5 + 0.2 * b)), 1, max(1, steps - min_low)).astype(int)
+            full = _sigma_grid(steps, b, profile, decimals=None)
+            sigmas = np.round(full, 5)
+            raw.extend(full)
+            for k in range(len(b)):
+                rows.append({
+                    "index": len(rows),
+                    "profile": profile,
+                    "steps": steps,
+                    "motion_bias": float(b[k]),
+                    "split_step": int(split[k]),
+                    "high_weight": float(high[k]),
+                    "low_weight": float(low[k]),
+                    "add_noise_high": bool(noise_high[k]),
+                    "add_noise_low": False,
+                    "sigmas": sigmas[k].tolist(),
+                })
+    return rows, raw
+
+def _sweep_table(rows: List[dict], fmt: str) -> str:
+    if fmt == "json":
+        import json
+        return json.dumps(rows)
+    import csv
+    import io
+    buf = io.StringIO()
+    cols = [c for c in rows[0] if c != "sigmas"] + ["sigmas"] if rows else []
+    w = csv.writer(buf)
+    w.writerow(cols)
+    for r in rows:
+        w.writerow([_format_sigmas(r[c]).replace(",", "") if c == "sigmas" else r[c] for c in cols])
+    return buf.getvalue()
+
+class EA_LightningMotionBiasSweep:
+    """Custom-profile grid over motion_bias x steps x profile in one execution.
+    Value fields take '0.2, 0.5' and/or inclusive ranges 'start:stop:step'.
+    List outputs run downstream samplers once per grid row, in table order.
+    """
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "motion_bias_values": ("STRING", {"default": "0.5:0.9:0.1"}),
+                "steps_values": ("STRING", {"default": "4:6"}),
+                "profiles": (["both"] + _PROFILES, {"default": "both"}),
+                "base_high": ("FLOAT", {"default": 1.04, "min": 0.0, "max": 2.0, "step": 0.01}),
+                "base_low":  ("FLOAT", {"default": 1.14, "min": 0.0, "max": 2.0, "step": 0.01}),
+            },
+            "optional": {
+                "min_low_steps": ("INT", {"default": 2, "min": 1, "max": 4}),
+                "table_format": (["json", "csv"], {"default": "json"}),
+            },
+        }
+
+    RETURN_TYPES = ("STRING", "SIGMAS", "INT", "INT", "FLOAT", "FLOAT", "BOOLEAN", "BOOLEAN", "INT")
+    RETURN_NAMES = ("table", "sigmas", "steps", "split_step", "lightning_high_weight", "lightning_low_weight",
+                    "add_noise_high", "add_noise_low", "count")
+    OUTPUT_IS_LIST = (False, True, True, True, True, True, True, True, False)
+    CATEGORY = "EA / Schedules"
+    FUNCTION = "sweep"
+
+    @staticmethod
+    def sweep(motion_bias_values: str, steps_values: str, profiles: str, base_high: float, base_low: float,
+              min_low_steps: int = 2, table_format: str = "json"):
+        import torch
+
+        biases = _parse_values(motion_bias_values) or [0.8]
+        steps = _parse_values(steps_values, integer=True) or [5]
+        profs = _PROFILES if profiles == "both" else [profiles]
+        n = len(biases) * len(steps) * len(profs)
+        if n > _SWEEP_MAX_ROWS:
+            raise ValueError(f"EA Motion Bias Sweep: {n} combinations exceeds the limit of {_SWEEP_MAX_ROWS}")
+
+        rows, raw = _sweep(steps, biases, profs, base_high, base_low, min_low_steps)
+        return (
+            _sweep_table(rows, table_format),
+            [torch.as_tensor(v, dtype=torch.float32) for v in raw],
+            [r["steps"] for r in rows],
+            [r["split_step"] for r in rows],
+            [r["high_weight"] for r in rows],
+            [r["low_weight"] for r in rows],
+            [r["add_noise_high"] for r in rows],
+            [r["add_noise_low"] for r in rows],
+            len(rows),
+        )
+
+# ---------------- fit node ----------------
+
+class EA_LightningMotionBiasFit:
+    """Fit Custom controls (steps, motion_bias, profile, base_high/low, min_low_steps) to a target
+    schedule, e.g. to turn an exact preset into a reproducible Custom one. save_as writes the
+    result into the user preset library (<ComfyUI user dir>/ea_nodes/motion_bias_presets/<name>.json).
+    """
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "target_sigmas": ("STRING", {"default": "1.0, 0.95, 0.85, 0.70, 0.55, 0.0"}),
+                "high_weight": ("FLOAT", {"default": 1.25, "min": 0.0, "max": 3.0, "step": 0.01}),
+                "low_weight": ("FLOAT", {"default": 1.00, "min": 0.0, "max": 3.0, "step": 0.01}),
+                "split_step": ("INT", {"default": 0, "min": 0, "max": 12}),
+            },
+            "optional": {
+                "sigmas": ("SIGMAS",),
+                "save_as": ("STRING", {"default": ""}),
+            },
+        }
+
+    RETURN_TYPES = ("STRING", "FLOAT", "SIGMAS")
+    RETURN_NAMES = ("custom_json", "rmse", "fitted_sigmas")
+    CATEGORY = "EA / Schedules"
+    FUNCTION = "fit"
+    OUTPUT_NODE = True
+
+    @staticmethod
+    def fit(target_sigmas: str, high_weight: float, low_weight: float, split_step: int = 0,
+            sigmas=None, save_as: str = ""):
+        import torch
+
+        if sigmas is not None:
+            target = [float(v) for v in sigmas.flatten().tolist()]
+        else:
+            target = [float(v) for v in str(target_sigmas).replace(" ", ",").split(",") if v.strip()]
+        result = _fit_custom(target, high_weight, low_weight, split_step or None)
+        if not result["split_exact"]:
+            print(f"[EA Motion Bias] Fit: Custom can't reach split_step {split_step} at motion_bias "
+                  f"{result['motion_bias']}; nearest is {result['split_step']}")
+
+        name = (save_as or "").strip()
+        if name:
+            custom = {k: result[k] for k in _CUSTOM_KEYS}
+            slug = "".join(ch if ch.isalnum() or ch in "-_" else "_" for ch in name)
+            folder = _user_preset_dir()
+            if folder is None:
+                raise RuntimeError("EA Motion Bias Fit: no ComfyUI user directory to save presets into")
+            folder.mkdir(parents=True, exist_ok=True)
+            path = folder / f"{slug}.json"
+            tmp = path.with_suffix(".json.tmp")
+            tmp.write_text(json.dumps({"name": name, "custom": custom}, indent=2), encoding="utf-8")
+            os.replace(tmp, path)
+            print(f"[EA Motion Bias] Saved preset '{name}' to {path}")
+
+        return (json.dumps(result), float(result["rmse"]),
+                torch.as_tensor(result["fitted_sigmas"], dtype=torch.float32))
+
+NODE_CLASS_MAPPINGS = {
+    "EA_LightningMotionBias": EA_LightningMotionBias,
+    "EA_LightningMotionBiasSweep": EA_LightningMotionBiasSweep,
+    "EA_LightningMotionBiasFit": EA_LightningMotionBiasFit,
+}
+NODE_DISPLAY_NAME_MAPPINGS = {
+    "EA_LightningMotionBias": "EA Motion Bias (Lightning)",
+    "EA_LightningMotionBiasSweep": "EA Motion Bias Sweep (Lightning)",
+    "EA_LightningMotionBiasFit": "EA Motion Bias Fit (Lightning)",
+}
@@ -1,6 +1,17 @@
 # nodes/ea_power_lora.py
+import difflib
+import hashlib
 import json
-from typing import List
+import mmap
+import os
+import struct
+import threading
+import time
+import uuid
+import warnings
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 def _safe_float(x, default=0.0):
     try:
@@ -11,85 +22,555 @@ def _safe_float(x, default=0.0):
     except Exception:
         return default
 
+# ---------------- LoRA weight cache ----------------
+
+# Byte budget for cached LoRA state dicts (override with EA_LORA_CACHE_MB)
+_LORA_CACHE_BYTES = int(_safe_float(os.environ.get("EA_LORA_CACHE_MB", 4096), 4096) * (1 << 20))
+
+_ST_DTYPES = {
+    "F64": "float64", "F32": "float32", "F16": "float16", "BF16": "bfloat16",
+    "I64": "int64", "I32": "int32", "I16": "int16", "I8": "int8", "U8": "uint8",
+    "BOOL": "bool", "F8_E4M3": "float8_e4m3fn", "F8_E5M2": "float8_e5m2",
+}
+
+def _read_safetensors_header(path: str) -> Tuple[dict, int]:
+    """Return (header dict, data offset) without touching tensor data."""
+    with open(path, "rb") as f:
+        n = struct.unpack("<Q", f.read(8))[0]
+        header = json.loads(f.read(n))
+    return header, 8 + n
+
+def _load_safetensors_mmap(path: str) -> Dict[str, Any]:
+    """Load a .safetensors file as read-only tensors viewing an mmap of the file (no full copy)."""
+    import torch
+
+    header, base = _read_safetensors_header(path)
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    out = {}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # torch warns that the mmap buffer is not writable
+        for key, info in header.items():
+            if key == "__metadata__":
+                continue
+            dtype = getattr(torch, _ST_DTYPES[info["dtype"]])
+            start, end = info["data_offsets"]
+            shape = info["shape"]
+            if end <= start:
+                out[key] = torch.empty(shape, dtype=dtype)
+                continue
+            itemsize = torch.empty((), dtype=dtype).element_size()
+            out[key] = torch.frombuffer(mm, dtype=dtype, count=(end - start) // itemsize,
+                                        offset=base + start).reshape(shape)
+    return out
+
+class _LoraCache:
+    """Process-wide LRU of LoRA state dicts keyed by (path, mtime, size), bounded by bytes."""
+
+    def __init__(self, budget_bytes: int):
+        self.budget = max(0, int(budget_bytes))
+        self._items: "OrderedDict[tuple, Tuple[dict, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(path: str) -> Optional[tuple]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+    def get(self, path: str) -> Optional[dict]:
+        key = self._key(path)
+        if key is None:
+            return None
+        with self._lock:
+            hit = self._items.get(key)
+            if hit is not None:
+                self._items.move_to_end(key)
+                return hit[0]
+
+        if path.lower().endswith(".safetensors"):
+            sd = _load_safetensors_mmap(path)
+        else:
+            import comfy.utils
+            sd = comfy.utils.load_torch_file(path, safe_load=True)
+        nbytes = sum(t.numel() * t.element_size() for t in sd.values() if hasattr(t, "element_size"))
+
+        with self._lock:
+            # Drop stale entries for the same path (file replaced on disk)
+            for k in [k for k in self._items if k[0] == key[0] and k != key]:
+                self._bytes -= self._items.pop(k)[1]
+            if key not in self._items and nbytes <= self.budget:
+                self._items[key] = (sd, nbytes)
+                self._bytes += nbytes
+                while self._bytes > self.budget and self._items:
+                    _, (_, b) = self._items.popitem(last=False)
+                    self._bytes -= b
+        return sd
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+_LORA_CACHE = _LoraCache(_LORA_CACHE_BYTES)
+
+def _lora_path(name: str) -> Optional[str]:
+    try:
+        import folder_paths as _folder_paths
+        return _folder_paths.get_full_path("loras", name)
+    except Exception:
+        return None
+
+def _apply_lora(model, clip, name: str, s_m: float, s_c: float, loader=None):
+    """Apply one LoRA using the shared weight cache; falls back to Comfy's LoraLoader."""
+    if s_m == 0 and s_c == 0:
+        return model, clip
+    try:
+        import comfy.sd as _comfy_sd
+    except Exception:
+        _comfy_sd = None
+    path = _lora_path(name) if _comfy_sd else None
+    sd = _LORA_CACHE.get(path) if path else None
+    if sd is None:
+        if loader:
+            return loader.load_lora(model, clip, name, s_m, s_c)
+        return model, clip
+    return _comfy_sd.load_lora_for_models(model, clip, sd, s_m, s_c)
+
+# ---------------- fused stack application ----------------
+
+def _plain_lora_weights(patch):
+    """(up, down, alpha) for a plain low-rank patch (no mid/DoRA/reshape), else None."""
+    if getattr(patch, "name", None) == "lora" and hasattr(patch, "weights"):
+        weights = tuple(patch.weights)          # comfy.weight_adapter.LoRAAdapter
+    elif isinstance(patch, tuple) and len(patch) == 2 and patch[0] == "lora":
+        weights = tuple(patch[1])               # legacy ("lora", (...)) tuples
+    else:
+        return None
+    up, down, alpha, mid, dora, reshape = (weights + (None,) * 6)[:6]
+    if up is None or down is None or mid is not None or dora is not None or reshape is not None:
+        return None
+    return up, down, alpha
+
+def _make_lora_patch(template, up, down, alpha):
+    weights = (up, down, alpha, None, None, None)
+    if hasattr(template, "weights"):
+        return type(template)(set(), weights)
+    return ("lora", weights)
+
+def _fuse_key_patches(entries):
+    """
+    entries: [(strength, patch)] for one weight key. Plain LoRAs with matching
+    non-rank dims are concatenated along the rank axis with strength*alpha/rank
+    folded into `up`, so one patch at strength 1.0 equals their sum.
+    Returns [(strength, patch)].
+    """
+    import torch
+
+    groups: Dict[tuple, list] = {}
+    out = []
+    for s, p in entries:
+        w = _plain_lora_weights(p)
+        if w is None:
+            out.append((s, p))
+            continue
+        up, down, _ = w
+        sig = (tuple(up.shape[:1]) + tuple(up.shape[2:]), tuple(down.shape[1:]))
+        groups.setdefault(sig, []).append((s, p, w))
+
+    for members in groups.values():
+        if len(members) == 1:
+            out.append((members[0][0], members[0][1]))
+            continue
+        dtype = members[0][2][0].dtype
+        for _, _, (up, down, _) in members:
+            dtype = torch.promote_types(dtype, torch.promote_types(up.dtype, down.dtype))
+        ups, downs = [], []
+        for s, _, (up, down, alpha) in members:
+            rank = int(down.shape[0])
+            scale = s * (float(alpha) / rank if alpha is not None else 1.0)
+            ups.append((up.to(torch.float32) * scale).to(dtype))
+            downs.append(down.to(dtype))
+        fused_up = torch.cat(ups, dim=1)
+        fused_down = torch.cat(downs, dim=0)
+        out.append((1.0, _make_lora_patch(members[0][1], fused_up, fused_down, float(fused_down.shape[0]))))
+    return out
+
+def _add_fused(target, groups: Dict[object, list]):
+    """Clone target and add one fused patch set; patches are batched per strength."""
+    if target is None or not groups:
+        return target
+    by_strength: Dict[float, dict] = {}
+    for key, entries in groups.items():
+        for s, patch in _fuse_key_patches(entries):
+            by_strength.setdefault(s, {})[key] = patch
+    out = target.clone()
+    for s, patches in by_strength.items():
+        out.add_patches(patches, s)
+    return out
+
+def _lora_key_maps(model, clip):
+    """(combined LoRA->weight key map, model target keys, clip target keys, sd converter)"""
+    import comfy.lora
+    try:
+        from comfy.lora_convert import convert_lora as _convert
+    except Exception:
+        _convert = lambda sd: sd
+
+    unet_map = comfy.lora.model_lora_keys_unet(model.model, {}) if model is not None else {}
+    clip_map = comfy.lora.model_lora_keys_clip(clip.cond_stage_model, {}) if clip is not None else {}
+    key_map = dict(unet_map)
+    key_map.update(clip_map)
+    return key_map, set(unet_map.values()), set(clip_map.values()), _convert
+
+def _apply_fused(model, clip, items: List[Tuple[dict, float, float]]):
+    """
+    Apply a whole LoRA stack at once: rows are grouped by target weight key and
+    compatible low-rank deltas are pre-summed into one patch per weight.
+    items: [(state_dict, strength_model, strength_clip)].
+    """
+    import comfy.lora
+
+    key_map, unet_keys, clip_keys, _convert = _lora_key_maps(model, clip)
+
+    model_groups: Dict[object, list] = {}
+    clip_groups: Dict[object, list] = {}
+    for sd, s_m, s_c in items:
+        for key, patch in comfy.lora.load_lora(_convert(sd), key_map).items():
+            if s_m and key in unet_keys:
+                model_groups.setdefault(key, []).append((s_m, patch))
+            if s_c and key in clip_keys:
+                clip_groups.setdefault(key, []).append((s_c, patch))
+
+    return _add_fused(model, model_groups), _add_fused(clip, clip_groups)
+
+def _row_weights(i: int, name: str, skipped: Optional[Dict[int, Tuple[str, str]]] = None) -> Optional[dict]:
+    """Cached state dict for active row i; a LoRA that can't be resolved or loaded is recorded in skipped."""
+    path = _lora_path(name)
+    reason = "file not found"
+    if path:
+        try:
+            sd = _LORA_CACHE.get(path)
+        except Exception as e:
+            sd, reason = None, f"{type(e).__name__}: {e}"
+        if sd is not None:
+            return sd
+    if skipped is not None:
+        skipped.setdefault(i, (name, reason))
+    return None
+
+# ---------------- incremental re-patching ----------------
+
+def _build_tracked(model, clip, active: List[Tuple[str, float, float]],
+                   skipped: Optional[Dict[int, Tuple[str, str]]] = None):
+    """
+    Sequential stack on a single clone per target. Returns (model, clip, owners)
+    where owners maps id(patch) -> row index, so strengths can be swapped later.
+    Rows whose LoRA can't be loaded are left out and recorded in skipped.
+    """
+    import comfy.lora
+
+    key_map, _, _, _convert = _lora_key_maps(model, clip)
+    m = model.clone() if model is not None else None
+    c = clip.clone() if clip is not None else None
+    owners: Dict[int, int] = {}
+    for i, (name, s_m, s_c) in enumerate(active):
+        if not (s_m or s_c):
+            continue
+        sd = _row_weights(i, name, skipped)
+        if sd is None:
+            continue
+        loaded = comfy.lora.load_lora(_convert(sd), key_map)
+        for patch in loaded.values():
+            owners[id(patch)] = i
+        if s_m and m is not None:
+            m.add_patches(loaded, s_m)
+        if s_c and c is not None:
+            c.add_patches(loaded, s_c)
+    return m, c, owners
+
+def _restrength(target, owners: Dict[int, int], strengths: List[float]):
+    """Clone target and rewrite the strength of every patch we own; weights re-patch lazily."""
+    if target is None:
+        return None
+    out = target.clone()
+    patcher = getattr(out, "patcher", out)  # CLIP wraps a ModelPatcher
+    for entries in patcher.patches.values():
+        for j, entry in enumerate(entries):
+            i = owners.get(id(entry[1]))
+            if i is not None:
+                entries[j] = (strengths[i],) + tuple(entry[1:])
+    patcher.patches_uuid = uuid.uuid4()
+    return out
+
+def _stack_signature(active: List[Tuple[str, float, float]], fuse: bool) -> tuple:
+    """Everything about a stack except the strength values (zero vs non-zero still counts)."""
+    rows = []
+    for name, s_m, s_c in active:
+        path = _lora_path(name)
+        rows.append((name, _LoraCache._key(path) if path else None, bool(s_m), bool(s_c)))
+    return (tuple(rows), bool(fuse))
+
+def _node_state(node) -> dict:
+    return node.__dict__.setdefault("_ea_stack_state", {})
+
+def _apply_stack(model, clip, active: List[Tuple[str, float, float]], loader=None, fuse: bool = False,
+                 state: Optional[dict] = None, skipped: Optional[Dict[int, Tuple[str, str]]] = None):
+    """
+    Apply [(name, strength_model, strength_clip)] sequentially or as one fused patch set.
+    With a per-node `state`, a re-run that only changes strengths reuses the
+    previous patched model and just rewrites patch strengths.
+    Rows left out because their LoRA can't be loaded go into skipped ({active index: (name, reason)}).
+    """
+    sig = _stack_signature(active, fuse)
+    if (state and not fuse and state.get("sig") == sig
+            and state.get("model") is model and state.get("clip") is clip):
+        try:
+            m = _restrength(state["m"], state["owners"], [a[1] for a in active])
+            c = _restrength(state["c"], state["owners"], [a[2] for a in active])
+            return m, c
+        except Exception as e:
+            print(f"[EA Power LoRA] Strength update failed, rebuilding stack: {e}")
+    if state is not None:
+        state.clear()
+
+    if fuse and active:
+        try:
+            items = []
+            for i, (name, s_m, s_c) in enumerate(active):
+                sd = _row_weights(i, name, skipped) if (s_m or s_c) else None
+                if sd is not None:
+                    items.append((sd, s_m, s_c))
+            return _apply_fused(model, clip, items)
+        except Exception as e:
+            print(f"[EA Power LoRA] Fused apply failed, applying rows one by one: {e}")
+
+    try:
+        m, c, owners = _build_tracked(model, clip, active, skipped)
+    except ImportError:
+        pass  # no Comfy internals (CI); fall through to the loader
+    except Exception as e:
+        print(f"[EA Power LoRA] Tracked apply failed, using LoraLoader: {e}")
+    else:
+        if state is not None:
+            state.update(sig=sig, model=model, clip=clip, m=m, c=c, owners=owners)
+        return m, c
+
+    m, c = model, clip
+    for name, s_m, s_c in active:
+        m, c = _apply_lora(m, c, name, s_m, s_c, loader)
+    return m, c
+
+# ---------------- availability index / parsed rows ----------------
+
+class _LoraIndex:
+    """Process-wide set of available LoRA names.
+    Re-listed only when the mtime of a LoRA root or of a directory holding LoRAs changes;
+    the stat pass itself runs at most every _RECHECK_S seconds.
+    """
+
+    _RECHECK_S = 2.0
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._names: frozenset = frozenset()
+        self._dirs: Dict[str, Optional[int]] = {}
+        self._checked = 0.0
+
+    @staticmethod
+    def _stat_dirs(dirs) -> Dict[str, Optional[int]]:
+        out = {}
+        for d in dirs:
+            try:
+                out[d] = os.stat(d).st_mtime_ns
+            except OSError:
+                out[d] = None
+        return out
+
+    @staticmethod
+    def _watch_dirs(fp, names) -> set:
+        """Roots plus every directory between a root and a listed file (new subfolders bump a parent)."""
+        try:
+            roots = [os.path.abspath(r) for r in fp.get_folder_paths("loras")]
+        except Exception:
+            return set()
+        rels = {""}
+        for n in names:
+            parent = os.path.dirname(n.replace("\\", "/"))
+            while parent and parent not in rels:
+                rels.add(parent)
+                parent = os.path.dirname(parent)
+        dirs = set()
+        for root in roots:
+            for rel in rels:
+                d = os.path.join(root, rel) if rel else root
+                if rel == "" or os.path.isdir(d):
+                    dirs.add(d)
+        return dirs
+
+    def names(self) -> frozenset:
+        try:
+            import folder_paths as fp
+        except Exception:
+            return frozenset()
+        with self._lock:
+            now = time.monotonic()
+            if self._dirs:
+                if now - self._checked < self._RECHECK_S:
+                    return self._names
+                if self._stat_dirs(self._dirs) == self._dirs:
+                    self._checked = now
+                    return self._names
+            try:
+                names = frozenset(fp.get_filename_list("loras"))
+            except Exception as e:
+                print(f"[EA Power LoRA] LoRA listing failed: {e}")
+                return self._names
+            self._names = names
+            self._dirs = self._stat_dirs(self._watch_dirs(fp, names))
+            self._checked = now
+            return names
+
+    def invalidate(self):
+        with self._lock:
+            self._dirs = {}
+
+_LORA_INDEX = _LoraIndex()
+
+_ROWS_CACHE_SIZE = 256
+
+@lru_cache(maxsize=_ROWS_CACHE_SIZE)
+def _parse_rows_cached(raw: str, with_clip: bool) -> Tuple[dict, ...]:
+    """Parse a loras_json payload once per distinct string. Returned rows are shared: do not mutate."""
+    try:
+        data = json.loads(raw or "{}")
+    except Exception:
+        return ()
+    if isinstance(data, dict) and isinstance(data.get("rows"), list):
+        return tuple(it for it in data["rows"] if isinstance(it, dict))
+    # legacy list forms
+    if isinstance(data, list):
+        rows = []
+        for it in data:
+            if isinstance(it, str):
+                row = {"enabled": True, "name": it, "strength_model": 1.0}
+                if with_clip:
+                    row["strength_clip"] = 1.0
+                rows.append(row)
+            elif isinstance(it, dict):
+                row = {
+                    "enabled": it.get("enabled", True) is not False,
+                    "name": (it.get("name") or "").strip(),
+                    "strength_model": _safe_float(it.get("strength_model", 1.0), 1.0),
+                }
+                if with_clip:
+                    row["strength_clip"] = _safe_float(it.get("strength_clip", 1.0), 1.0)
+                rows.append(row)
+        return tuple(rows)
+    return ()
+
+def _lora_warnings(unknown: List[Tuple[int, str]], available,
+                   failed: Optional[List[Tuple[int, str, str]]] = None) -> str:
+    """JSON report of rows naming LoRAs that are not installed (with close matches)
+    and of rows whose LoRA could not be loaded (failed: [(row, name, reason)])."""
+    if not unknown and not failed:
+        return "[]"
+    pool = list(available)
+    out = []
+    for idx, name in unknown:
+        out.append({
+            "code": "unknown_lora",
+            "row": idx,
+            "name": name,
+            "suggestions": difflib.get_close_matches(name, pool, n=3, cutoff=0.6),
+        })
+        print(f"[EA Power LoRA] Row {idx}: LoRA not found, skipped: {name}")
+    for idx, name, reason in failed or ():
+        out.append({"code": "load_failed", "row": idx, "name": name, "error": reason})
+        print(f"[EA Power LoRA] Row {idx}: could not load {name}, skipped: {reason}")
+    return json.dumps(out)
+
+def _active_rows(rows: List[dict], available, with_clip: bool,
+                 unknown: Optional[List[Tuple[int, str]]] = None,
+                 row_ids: Optional[List[int]] = None) -> List[Tuple[str, float, float]]:
+    """[(name, strength_model, strength_clip)] for enabled, installed rows; row_ids gets each one's row index."""
+    out = []
+    for idx, item in enumerate(rows):
+        if item.get("enabled") is False:
+            continue
+        name = (item.get("name") or "").strip()
+        if not name:
+            continue
+        if available and name not in available:
+            if unknown is not None:
+                unknown.append((idx, name))
+            continue
+        s_m = _safe_float(item.get("strength_model", 1.0), 1.0)
+        # CLIP strength is irrelevant (0.0) for the model-only node
+        s_c = _safe_float(item.get("strength_clip", 1.0), 1.0) if with_clip else 0.0
+        out.append((name, s_m, s_c))
+        if row_ids is not None:
+            row_ids.append(idx)
+    return out
+
 # ---------------- EA Power LoRA (no CLIP) ----------------
 
 class EA_PowerLora:
     """Apply N LoRAs (in order) to MODEL only (no CLIP path).
     JSON payload (v0.2):
         { "rows": [ { "enabled": true, "name": "file.safetensors", "strength_model": 1.0 } ] }
+    fuse_stack pre-sums compatible low-rank deltas into one patch per weight.
+    warnings is a JSON list of rows whose LoRA is not installed or could not be loaded.
     """
 
     @classmethod
     def INPUT_TYPES(cls):
         return {
             "required": {"model": ("MODEL",)},
-            "optional": {"loras_json": ("STRING", {"default": "{}", "multiline": True})},
+            "optional": {
+                "loras_json": ("STRING", {"default": "{}", "multiline": True}),
+                "fuse_stack": ("BOOLEAN", {"default": False}),
+            },
         }
 
-    RETURN_TYPES = ("MODEL",)
-    RETURN_NAMES = ("model",)
+    RETURN_TYPES = ("MODEL", "STRING")
+    RETURN_NAMES = ("model", "warnings")
     CATEGORY = "EA / LoRA"
     FUNCTION = "apply"
 
     @staticmethod
     def _parse_rows(raw: str) -> List[dict]:
-        try:
-            data = json.loads(raw or "{}")
-        except Exception:
-            return []
-        if isinstance(data, dict) and isinstance(data.get("rows"), list):
-            return data["rows"]
-        # legacy list forms
-        if isinstance(data, list):
-            rows = []
-            for it in data:
-                if isinstance(it, str):
-                    rows.append({"enabled": True, "name": it, "strength_model": 1.0})
-                elif isinstance(it, dict):
-                    rows.append({
-                        "enabled": it.get("enabled", True) is not False,
-                        "name": (it.get("name") or "").strip(),
-                        "strength_model": _safe_float(it.get("strength_model", 1.0), 1.0),
-                    })
-            return rows
-        return []
+        return list(_parse_rows_cached(raw, False))
 
     @classmethod
     def IS_CHANGED(cls, **kwargs):
         return (kwargs.get("loras_json", ""),)
 
-    def apply(self, model, loras_json: str = "{}"):
+    def apply(self, model, loras_json: str = "{}", fuse_stack: bool = False):
         # Lazy imports so CI can import without Comfy/torch
         try:
             from nodes import LoraLoader as CoreLoraLoader
         except Exception:
             CoreLoraLoader = None
-        try:
-            import folder_paths as _folder_paths
-        except Exception:
-            _folder_paths = None
 
         rows = self._parse_rows(loras_json)
-        available = set(_folder_paths.get_filename_list("loras")) if _folder_paths else set()
+        available = _LORA_INDEX.names()
+        unknown: List[Tuple[int, str]] = []
 
-        m = model
         loader = CoreLoraLoader() if CoreLoraLoader else None
 
-        for item in rows:
-            if item.get("enabled") is False:
-                continue
-            name = (item.get("name") or "").strip()
-            if not name:
-                continue
-            if available and name not in available:
-                continue
-            s_m = _safe_float(item.get("strength_model", 1.0), 1.0)
+        row_ids: List[int] = []
+        active = _active_rows(rows, available, False, unknown, row_ids)
 
-            if loader:
-                # CLIP is None for this node; clip strength irrelevant (0.0)
-                m, _ = loader.load_lora(m, None, name, s_m, 0.0)
+        # CLIP is None for this node
+        skipped: Dict[int, Tuple[str, str]] = {}
+        m, _ = _apply_stack(model, None, active, loader, bool(fuse_stack), _node_state(self), skipped)
+        failed = [(row_ids[i], name, reason) for i, (name, reason) in sorted(skipped.items())]
 
-        return (m,)
+        return (m, _lora_warnings(unknown, available, failed))
 
 # ---------------- EA Power LoRA +CLIP ----------------
 
@@ -98,87 +579,539 @@ class EA_PowerLora_CLIP:
     JSON payload (v0.2):
         { "rows": [ { "enabled": true, "name": "...", "strength_model": 1.0, "strength_clip": 1.0 } ] }
     Note: no global toggle; strengths are honored per-row.
+    fuse_stack pre-sums compatible low-rank deltas into one patch per weight.
+    warnings is a JSON list of rows whose LoRA is not installed or could not be loaded.
     """
 
     @classmethod
     def INPUT_TYPES(cls):
         return {
             "required": {"model": ("MODEL",)},
-            "optional": {"clip": ("CLIP",), "loras_json": ("STRING", {"default": "{}", "multiline": True})},
+            "optional": {
+                "clip": ("CLIP",),
+                "loras_json": ("STRING", {"default": "{}", "multiline": True}),
+                "fuse_stack": ("BOOLEAN", {"default": False}),
+            },
         }
 
-    RETURN_TYPES = ("MODEL", "CLIP")
-    RETURN_NAMES = ("model", "clip")
+    RETURN_TYPES = ("MODEL", "CLIP", "STRING")
+    RETURN_NAMES = ("model", "clip", "warnings")
     CATEGORY = "EA / LoRA"
     FUNCTION = "apply"
 
     @staticmethod
     def _parse_rows(raw: str) -> List[dict]:
-        try:
-            data = json.loads(raw or "{}")
-        except Exception:
-            return []
-        if isinstance(data, dict) and isinstance(data.get("rows"), list):
-            return data["rows"]
-        if isinstance(data, list):
-            rows = []
-            for it in data:
-                if isinstance(it, str):
-                    rows.append({"enabled": True, "name": it, "strength_model": 1.0, "strength_clip": 1.0})
-                elif isinstance(it, dict):
-                    rows.append({
-                        "enabled": it.get("enabled", True) is not False,
-                        "name": (it.get("name") or "").strip(),
-                        "strength_model": _safe_float(it.get("strength_model", 1.0), 1.0),
-                        "strength_clip": _safe_float(it.get("strength_clip", 1.0), 1.0),
-                    })
-            return rows
-        return []
+        return list(_parse_rows_cached(raw, True))
 
     @classmethod
     def IS_CHANGED(cls, **kwargs):
         return (kwargs.get("loras_json", ""),)
 
-    def apply(self, model, clip=None, loras_json: str = "{}"):
+    def apply(self, model, clip=None, loras_json: str = "{}", fuse_stack: bool = False):
         try:
             from nodes import LoraLoader as CoreLoraLoader
         except Exception:
             CoreLoraLoader = None
-        try:
-            import folder_paths as _folder_paths
-        except Exception:
-            _folder_paths = None
 
         rows = self._parse_rows(loras_json)
-        available = set(_folder_paths.get_filename_list("loras")) if _folder_paths else set()
+        available = _LORA_INDEX.names()
+        unknown: List[Tuple[int, str]] = []
 
-        m, c = model, clip
         loader = CoreLoraLoader() if CoreLoraLoader else None
 
-        for item in rows:
-            if item.get("enabled") is False:
+        row_ids: List[int] = []
+        active = _active_rows(rows, available, True, unknown, row_ids)
+        skipped: Dict[int, Tuple[str, str]] = {}
+        m, c = _apply_stack(model, clip, active, loader, bool(fuse_stack), _node_state(self), skipped)
+        failed = [(row_ids[i], name, reason) for i, (name, reason) in sorted(skipped.items())]
+
+        return (m, c, _lora_warnings(unknown, available, failed))
+
+# ---------------- header-only inspection ----------------
+
+# Suffixes that split a LoRA key into (module, part); longest first so ".lora_up.weight" wins over ".weight"
+_LORA_SUFFIXES = tuple(sorted((
+    ".lora_up.weight", ".lora_down.weight", ".lora_mid.weight", ".lora_B.weight", ".lora_A.weight",
+    ".lora.up.weight", ".lora.down.weight", ".lora_linear_layer.up.weight", ".lora_linear_layer.down.weight",
+    ".alpha", ".dora_scale", ".diff", ".diff_b", ".set_weight", ".w_norm", ".b_norm",
+    ".hada_w1_a", ".hada_w1_b", ".hada_w2_a", ".hada_w2_b", ".hada_t1", ".hada_t2",
+    ".lokr_w1", ".lokr_w2", ".lokr_w1_a", ".lokr_w1_b", ".lokr_w2_a", ".lokr_w2_b", ".lokr_t2",
+), key=len, reverse=True))
+
+_DOWN_PARTS = (".lora_down.weight", ".lora_A.weight", ".lora.down.weight", ".lora_linear_layer.down.weight")
+
+# Metadata fields that name the base model a LoRA was trained against
+_BASE_META_KEYS = ("modelspec.architecture", "ss_base_model_version")
+
+# Bytes read at each of three offsets to tell byte-identical copies from same-layout LoRAs
+_SAMPLE_BYTES = 4096
+
+def _split_lora_key(key: str) -> Tuple[str, str]:
+    for suf in _LORA_SUFFIXES:
+        if key.endswith(suf):
+            return key[: -len(suf)], suf
+    return key, ""
+
+def _read_scalar(f, base: int, info: dict) -> Optional[float]:
+    """Read one scalar (e.g. an alpha) straight from the file; a few bytes, not a tensor load."""
+    fmt = {"F64": "<d", "F32": "<f", "F16": "<e", "I64": "<q", "I32": "<i"}.get(info.get("dtype"))
+    start, end = info["data_offsets"]
+    f.seek(base + start)
+    raw = f.read(end - start)
+    if info.get("dtype") == "BF16" and len(raw) == 2:
+        return struct.unpack("<f", b"\x00\x00" + raw)[0]
+    if fmt is None or len(raw) != struct.calcsize(fmt):
+        return None
+    return float(struct.unpack(fmt, raw)[0])
+
+@lru_cache(maxsize=256)
+def _inspect_file(path: str, mtime_ns: int, size: int) -> dict:
+    """Summarize a .safetensors LoRA from its JSON header plus alpha scalars and a few
+    small content samples; tensor data is never loaded. Keyed by stat so edits re-read."""
+    header, base = _read_safetensors_header(path)
+    meta = header.pop("__metadata__", None) or {}
+    modules: Dict[str, dict] = {}
+    dtypes: Counter = Counter()
+    data_bytes = 0
+    for key, info in header.items():
+        start, end = info["data_offsets"]
+        data_bytes += end - start
+        module, part = _split_lora_key(key)
+        if part != ".alpha":
+            # Alphas are F32 scalars regardless of the weights' dtype; they'd make every file look mixed
+            dtypes[info["dtype"]] += 1
+        modules.setdefault(module, {})[part] = info
+
+    ranks: Counter = Counter()
+    alphas: Counter = Counter()
+    kinds: Counter = Counter()
+    with open(path, "rb") as f:
+        for parts in modules.values():
+            down = next((parts[p] for p in _DOWN_PARTS if p in parts), None)
+            if down is not None:
+                kinds["lora"] += 1
+                if down["shape"]:
+                    ranks[int(down["shape"][0])] += 1
+            elif any(p.startswith(".hada") for p in parts):
+                kinds["loha"] += 1
+            elif any(p.startswith(".lokr") for p in parts):
+                kinds["lokr"] += 1
+            elif ".diff" in parts or ".set_weight" in parts:
+                kinds["full"] += 1
+            else:
+                kinds["other"] += 1
+            if ".alpha" in parts:
+                a = _read_scalar(f, base, parts[".alpha"])
+                if a is not None:
+                    alphas[round(a, 4)] += 1
+        # Same-layout LoRAs are common (same trainer config); tell copies apart by a few small data samples
+        digest = hashlib.blake2b(json.dumps(header, sort_keys=True).encode(), digest_size=16)
+        for frac in (0.0, 0.5, 1.0):
+            f.seek(max(base, base + int((size - base - _SAMPLE_BYTES) * frac)))
+            digest.update(f.read(_SAMPLE_BYTES))
+
+    return {
+        "keys": len(header),
+        "modules": frozenset(modules),
+        "bytes": data_bytes,
+        "file_bytes": size,
+        "dtypes": dict(dtypes),
+        "ranks": dict(ranks),
+        "alphas": dict(alphas),
+        "kinds": dict(kinds),
+        "base_model": next((str(meta[k]) for k in _BASE_META_KEYS if meta.get(k)), None),
+        "signature": digest.hexdigest(),
+    }
+
+def _summarize(counts: dict):
+    """One value if uniform, else {min, max}; None if empty."""
+    if not counts:
+        return None
+    if len(counts) == 1:
+        return next(iter(counts))
+    return {"min": min(counts), "max": max(counts)}
+
+def _matched_modules(modules: frozenset, key_map: dict, convert) -> int:
+    """How many LoRA modules map onto weights of the connected model/clip."""
+    try:
+        converted = convert({f"{m}.alpha": None for m in modules})
+        names = {_split_lora_key(k)[0] for k in converted}
+    except Exception:
+        names = set(modules)
+    return sum(1 for m in names if m in key_map)
+
+def _inspect_rows(rows: List[dict], available, model=None, clip=None) -> dict:
+    key_map = convert = None
+    if model is not None or clip is not None:
+        try:
+            key_map, _, _, convert = _lora_key_maps(model, clip)
+        except Exception as e:
+            print(f"[EA Power LoRA] Key map unavailable, skipping compatibility check: {e}")
+
+    report_rows: List[dict] = []
+    issues: List[dict] = []
+    infos: Dict[int, dict] = {}
+    seen: Dict[tuple, int] = {}
+    for idx, item in enumerate(rows):
+        name = (item.get("name") or "").strip()
+        row = {"row": idx, "name": name, "enabled": item.get("enabled") is not False,
+               "strength_model": _safe_float(item.get("strength_model", 1.0), 1.0),
+               "strength_clip": _safe_float(item.get("strength_clip", 1.0), 1.0)}
+        report_rows.append(row)
+        if not name or not row["enabled"]:
+            continue
+        path = _lora_path(name) if (not available or name in available) else None
+        key = _LoraCache._key(path) if path else None
+        if key is None:
+            issues.append({"row": idx, "code": "missing", "detail": name})
+            continue
+        if not path.lower().endswith(".safetensors"):
+            issues.append({"row": idx, "code": "not_inspectable", "detail": "header-only reads need .safetensors"})
+            continue
+        try:
+            info = _inspect_file(*key)
+        except Exception as e:
+            issues.append({"row": idx, "code": "unreadable", "detail": str(e)})
+            continue
+        infos[idx] = info
+        row.update(
+            keys=info["keys"], modules=len(info["modules"]), bytes=info["bytes"],
+            dtype=next(iter(info["dtypes"])) if len(info["dtypes"]) == 1 else info["dtypes"], rank=_summarize(info["ranks"]),
+            alpha=_summarize(info["alphas"]), kinds=info["kinds"], base_model=info["base_model"],
+        )
+        if row["strength_model"] == 0 and row["strength_clip"] == 0:
+            issues.append({"row": idx, "code": "zero_strength", "detail": "row has no effect"})
+        first = seen.setdefault((key[0],), idx)
+        if first != idx:
+            issues.append({"row": idx, "code": "duplicate", "detail": f"same file as row {first}"})
+        else:
+            twin = seen.setdefault(("sig", info["signature"]), idx)
+            if twin != idx:
+                issues.append({"row": idx, "code": "identical", "detail": f"same content as row {twin}"})
+        if key_map is not None:
+            matched = _matched_modules(info["modules"], key_map, convert)
+            row["matched_modules"] = matched
+            if matched == 0:
+                issues.append({"row": idx, "code": "incompatible", "detail": "no keys match the connected model/clip"})
+            elif matched < len(info["modules"]):
+                issues.append({"row": idx, "code": "partial_match",
+                               "detail": f"{matched}/{len(info['modules'])} modules match"})
+
+    bases = {i: inf["base_model"] for i, inf in infos.items() if inf["base_model"]}
+    if len(set(bases.values())) > 1:
+        majority = Counter(bases.values()).most_common(1)[0][0]
+        for i, b in bases.items():
+            if b != majority:
+                issues.append({"row": i, "code": "base_mismatch", "detail": f"{b} (stack is mostly {majority})"})
+
+    overlap = []
+    ids = sorted(infos)
+    for a_pos, a in enumerate(ids):
+        for b in ids[a_pos + 1:]:
+            shared = len(infos[a]["modules"] & infos[b]["modules"])
+            if shared:
+                smaller = min(len(infos[a]["modules"]), len(infos[b]["modules"])) or 1
+                overlap.append({"rows": [a, b], "shared_modules": shared, "ratio": round(shared / smaller, 4)})
+
+    return {"rows": report_rows, "overlap": overlap, "issues": issues}
+
+class EA_PowerLoraInspect:
+    """Preflight a loras_json stack from safetensors headers only (no weights loaded).
+    Reports rank/alpha/keys/bytes/dtype per row, module overlap between rows and
+    issues (missing, duplicate/identical, base-model mismatch, incompatible with the
+    optionally connected model/clip).
+    """
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "loras_json": ("STRING", {"default": "{}", "multiline": True}),
+            },
+            "optional": {
+                "model": ("MODEL",),
+                "clip": ("CLIP",),
+            },
+        }
+
+    RETURN_TYPES = ("STRING", "INT")
+    RETURN_NAMES = ("report", "issue_count")
+    CATEGORY = "EA / LoRA"
+    FUNCTION = "inspect"
+    OUTPUT_NODE = True
+
+    @classmethod
+    def IS_CHANGED(cls, **kwargs):
+        return (kwargs.get("loras_json", ""),)
+
+    def inspect(self, loras_json: str = "{}", model=None, clip=None):
+        rows = list(_parse_rows_cached(loras_json, True))
+        report = _inspect_rows(rows, _LORA_INDEX.names(), model, clip)
+        for issue in report["issues"]:
+            print(f"[EA Power LoRA] Inspect row {issue['row']}: {issue['code']} ({issue['detail']})")
+        return (json.dumps(report, indent=2), len(report["issues"]))
+
+# ---------------- offline bake ----------------
+
+_UP_PARTS = (".lora_up.weight", ".lora_B.weight", ".lora.up.weight", ".lora_linear_layer.up.weight")
+_BAKE_MODES = ["low_rank", "full_delta"]
+_BAKE_DTYPES = {"fp16": ("F16", "float16"), "bf16": ("BF16", "bfloat16"), "fp32": ("F32", "float32")}
+_BAKE_META_KEY = "ea_bake"
+
+# Module-name prefixes of text-encoder weights (when no MODEL/CLIP is connected to classify keys)
+_TE_PREFIXES = ("lora_te", "text_encoder", "te1", "te2", "te_", "lora_clip", "clip_", "text_model", "cond_stage_model")
+
+def _bake_plan(sources: List[Tuple[str, float, float]], mode: str, te_modules=None) -> Tuple[dict, List[str]]:
+    """
+    From headers only: {module: {"rows": [(row, strength, up_info, down_info, alpha_info, diff_info)],
+    "up": shape, "down": shape, "full": shape}} plus a list of problems that block the bake.
+    te_modules: {module: is_text_encoder} for modules the connected MODEL/CLIP key maps know;
+    anything else is classified by _TE_PREFIXES.
+    """
+    plan: Dict[str, dict] = {}
+    problems: List[str] = []
+    for i, (path, s_m, s_c) in enumerate(sources):
+        header, _ = _read_safetensors_header(path)
+        header.pop("__metadata__", None)
+        modules: Dict[str, dict] = {}
+        for key, info in header.items():
+            module, part = _split_lora_key(key)
+            modules.setdefault(module, {})[part] = info
+        for module, parts in modules.items():
+            is_te = (te_modules or {}).get(module)
+            if is_te is None:
+                is_te = module.lower().startswith(_TE_PREFIXES)
+            strength = s_c if is_te else s_m
+            if strength == 0:
+                continue
+            up = next((parts[p] for p in _UP_PARTS if p in parts), None)
+            down = next((parts[p] for p in _DOWN_PARTS if p in parts), None)
+            diff = parts.get(".diff")
+            extra = set(parts) - set(_UP_PARTS) - set(_DOWN_PARTS) - {".alpha", ".diff"}
+            if extra or (diff is None and (up is None or down is None)):
+                problems.append(f"row {i}: {module} uses {sorted(extra) or 'an incomplete LoRA'}; only plain LoRA can be baked")
                 continue
-            name = (item.get("name") or "").strip()
-            if not name:
+            if diff is not None and mode != "full_delta":
+                problems.append(f"row {i}: {module} is a full diff; use mode full_delta")
                 continue
-            if available and name not in available:
+            full = list(diff["shape"]) if diff is not None else [up["shape"][0]] + list(down["shape"][1:])
+            entry = plan.setdefault(module, {"rows": [], "full": full, "rank": 0, "up": up, "down": down})
+            if entry["full"] != full:
+                problems.append(f"row {i}: {module} shape {full} != {entry['full']} from an earlier row")
+                continue
+            if diff is None:
+                if mode == "low_rank" and (list(up["shape"][2:]) != list(entry["up"]["shape"][2:])):
+                    problems.append(f"row {i}: {module} has a different up-projection layout")
+                    continue
+                entry["rank"] += int(down["shape"][0])
+            entry["rows"].append((i, strength, up, down, parts.get(".alpha"), diff))
+    return plan, problems
+
+def _bake_layout(plan: dict, mode: str, st_dtype: str) -> Tuple[dict, List[Tuple[str, str, list]]]:
+    """Output safetensors header entries (offsets filled in) and the write order."""
+    itemsize = {"F16": 2, "BF16": 2, "F32": 4}[st_dtype]
+    order: List[Tuple[str, str, list]] = []
+    for module, entry in plan.items():
+        if mode == "full_delta":
+            order.append((module, ".diff", entry["full"]))
+        else:
+            up, down = entry["up"]["shape"], entry["down"]["shape"]
+            order.append((module, ".lora_up.weight", [up[0], entry["rank"]] + list(up[2:])))
+            order.append((module, ".lora_down.weight", [entry["rank"]] + list(down[1:])))
+            order.append((module, ".alpha", []))
+    header: Dict[str, dict] = {}
+    offset = 0
+    for module, part, shape in order:
+        n = 1
+        for d in shape:
+            n *= int(d)
+        size = (4 if part == ".alpha" else itemsize) * n
+        header[module + part] = {"dtype": "F32" if part == ".alpha" else st_dtype, "shape": shape,
+                                 "data_offsets": [offset, offset + size]}
+        offset += size
+    return header, order
+
+def _bake_module(entry: dict, mode: str, tensors: List[dict], names: Dict[int, Dict[str, str]], dtype):
+    """Compute one module's output tensors from memory-mapped sources; returns {part: tensor}."""
+    import torch
+
+    if mode == "full_delta":
+        delta = torch.zeros(entry["full"], dtype=torch.float32)
+        for i, strength, up, down, alpha, diff in entry["rows"]:
+            keys = names[i]
+            if diff is not None:
+                delta += strength * tensors[i][keys["diff"]].to(torch.float32)
                 continue
-            s_m = _safe_float(item.get("strength_model", 1.0), 1.0)
-            s_c = _safe_float(item.get("strength_clip", 1.0), 1.0)
+            u = tensors[i][keys["up"]].to(torch.float32)
+            d = tensors[i][keys["down"]].to(torch.float32)
+            rank = d.shape[0]
+            a = float(tensors[i][keys["alpha"]]) if alpha is not None else rank
+            delta += (strength * a / rank) * (u.flatten(1) @ d.flatten(1)).reshape(entry["full"])
+        return {".diff": delta.to(dtype)}
+
+    ups, downs = [], []
+    for i, strength, up, down, alpha, _ in entry["rows"]:
+        keys = names[i]
+        u = tensors[i][keys["up"]].to(torch.float32)
+        d = tensors[i][keys["down"]]
+        rank = d.shape[0]
+        a = float(tensors[i][keys["alpha"]]) if alpha is not None else rank
+        ups.append((u * (strength * a / rank)).to(dtype))
+        downs.append(d.to(dtype))
+    fused_down = torch.cat(downs, dim=0)
+    return {".lora_up.weight": torch.cat(ups, dim=1), ".lora_down.weight": fused_down,
+            ".alpha": torch.tensor(float(fused_down.shape[0]), dtype=torch.float32)}
+
+def _source_key_names(path: str) -> Dict[str, Dict[str, str]]:
+    """{module: {"up"|"down"|"alpha"|"diff": full key}} for one source file."""
+    header, _ = _read_safetensors_header(path)
+    out: Dict[str, Dict[str, str]] = {}
+    for key in header:
+        if key == "__metadata__":
+            continue
+        module, part = _split_lora_key(key)
+        slot = ("up" if part in _UP_PARTS else "down" if part in _DOWN_PARTS
+                else "alpha" if part == ".alpha" else "diff" if part == ".diff" else None)
+        if slot:
+            out.setdefault(module, {})[slot] = key
+    return out
+
+def _bake_stack(sources: List[Tuple[str, float, float]], target: str, mode: str, dtype_name: str,
+                metadata: Dict[str, str], te_modules=None) -> dict:
+    """Stream a fused safetensors file: header from the plan first, then one module at a time."""
+    import torch
+
+    plan, problems = _bake_plan(sources, mode, te_modules)
+    if problems:
+        raise ValueError("EA Power LoRA Bake: " + "; ".join(problems[:8])
+                         + (f" (+{len(problems) - 8} more)" if len(problems) > 8 else ""))
+    st_dtype, torch_dtype = _BAKE_DTYPES[dtype_name]
+    dtype = getattr(torch, torch_dtype)
+    header, order = _bake_layout(plan, mode, st_dtype)
+    header["__metadata__"] = metadata
+    raw = json.dumps(header, separators=(",", ":")).encode()
+    raw += b" " * (-len(raw) % 8)
+
+    tensors = [_load_safetensors_mmap(path) for path, _, _ in sources]
+    key_names = [_source_key_names(path) for path, _, _ in sources]
+    os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+    tmp = f"{target}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(struct.pack("<Q", len(raw)))
+            f.write(raw)
+            done = None
+            out: Dict[str, "torch.Tensor"] = {}
+            for module, part, _ in order:
+                if module != done:
+                    names = {i: key_names[i][module] for i, *_ in plan[module]["rows"]}
+                    out = _bake_module(plan[module], mode, tensors, names, dtype)
+                    done = module
+                t = out[part].contiguous()
+                f.write(t.reshape(-1).view(torch.uint8).numpy().tobytes())
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+    finally:
+        del tensors
+    return {"modules": len(plan), "keys": len(order), "bytes": os.path.getsize(target)}
+
+class EA_PowerLoraBake:
+    """Bake a fixed loras_json stack into one .safetensors in the loras folder.
+    low_rank concatenates the LoRAs along the rank axis (exact, file size = sum of inputs);
+    full_delta writes one dense .diff per weight (exact, size of the touched weights).
+    Model/clip strengths are folded in, so load the result at strength 1.0.
+    The file is streamed module by module; a re-run with unchanged inputs is skipped.
+    """
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "loras_json": ("STRING", {"default": "{}", "multiline": True}),
+                "filename": ("STRING", {"default": "baked/ea_stack"}),
+                "mode": (_BAKE_MODES, {"default": "low_rank"}),
+                "dtype": (list(_BAKE_DTYPES), {"default": "fp16"}),
+            },
+            "optional": {
+                "model": ("MODEL",),
+                "clip": ("CLIP",),
+            },
+        }
+
+    RETURN_TYPES = ("STRING", "STRING")
+    RETURN_NAMES = ("lora_name", "report")
+    CATEGORY = "EA / LoRA"
+    FUNCTION = "bake"
+    OUTPUT_NODE = True
+
+    def bake(self, loras_json: str = "{}", filename: str = "baked/ea_stack", mode: str = "low_rank",
+             dtype: str = "fp16", model=None, clip=None):
+        import folder_paths
+
+        rows = list(_parse_rows_cached(loras_json, True))
+        available = _LORA_INDEX.names()
+        unknown: List[Tuple[int, str]] = []
+        active = _active_rows(rows, available, True, unknown)
+        if unknown:
+            raise ValueError(f"EA Power LoRA Bake: missing LoRAs: {_lora_warnings(unknown, available)}")
+
+        sources, recipe = [], []
+        for name, s_m, s_c in active:
+            path = _lora_path(name)
+            if not path or not path.lower().endswith(".safetensors"):
+                raise ValueError(f"EA Power LoRA Bake: {name} is not a .safetensors file")
+            key = _LoraCache._key(path)
+            sources.append((path, s_m, s_c))
+            recipe.append([name, s_m, s_c, key[1] if key else 0, key[2] if key else 0])
+        if not sources:
+            raise ValueError("EA Power LoRA Bake: no enabled LoRAs in loras_json")
+
+        rel = filename.strip().replace("\\", "/").lstrip("/")
+        if not rel.lower().endswith(".safetensors"):
+            rel += ".safetensors"
+        root = os.path.abspath(folder_paths.get_folder_paths("loras")[0])
+        target = os.path.abspath(os.path.join(root, rel))
+        if os.path.commonpath([root, target]) != root:
+            raise ValueError(f"EA Power LoRA Bake: filename escapes the loras folder: {filename}")
+
+        recipe_json = json.dumps({"mode": mode, "dtype": dtype, "rows": recipe}, sort_keys=True)
+        try:
+            existing = json.loads((_read_safetensors_header(target)[0].get("__metadata__") or {}).get(_BAKE_META_KEY, "null"))
+        except Exception:
+            existing = None
+        if existing == json.loads(recipe_json):
+            print(f"[EA Power LoRA] Bake up to date: {rel}")
+            return (rel, json.dumps({"skipped": True, "path": target}))
 
-            if loader:
-                m, c = loader.load_lora(m, c, name, s_m, s_c)
+        te_modules = None
+        if model is not None or clip is not None:
+            # Only modules the connected key maps contain are classified here; with MODEL alone
+            # the text-encoder modules are unknown to them and fall back to the name prefixes.
+            key_map, _, clip_keys, _ = _lora_key_maps(model, clip)
+            te_modules = {k: v in clip_keys for k, v in key_map.items()}
 
-        return (m, c)
+        stats = _bake_stack(sources, target, mode, dtype, {_BAKE_META_KEY: recipe_json, "format": "pt"}, te_modules)
+        _LORA_INDEX.invalidate()
+        print(f"[EA Power LoRA] Baked {len(sources)} LoRAs into {rel} ({stats['bytes'] / (1 << 20):.1f} MiB)")
+        return (rel, json.dumps(dict(stats, skipped=False, path=target)))
 
 # ---------------- mappings ----------------
 
 NODE_CLASS_MAPPINGS = {
     "EA_PowerLora": EA_PowerLora,
     "EA_PowerLora_CLIP": EA_PowerLora_CLIP,
+    "EA_PowerLoraInspect": EA_PowerLoraInspect,
+    "EA_PowerLoraBake": EA_PowerLoraBake,
 }
 
 NODE_DISPLAY_NAME_MAPPINGS = {
     "EA_PowerLora": "EA Power LoRA",
     "EA_PowerLora_CLIP": "EA Power LoRA +CLIP",
+    "EA_PowerLoraInspect": "EA Power LoRA Inspect",
+    "EA_PowerLoraBake": "EA Power LoRA Bake",
 }
@@ -1,7 +1,11 @@
 # nodes/ea_power_lora_wanvideo.py
-import json
+import os
 import sys
+import threading
+import time
 import importlib
+from importlib.util import spec_from_file_location, module_from_spec
+from pathlib import Path
 from typing import Iterable, Optional, Tuple, Dict, Any, List
 
 def _safe_float(x, default=0.0):
@@ -13,26 +17,26 @@ def _safe_float(x, default=0.0):
     except Exception:
         return default
 
+def _registry():
+    """nodes/_registry.py, shared through sys.modules; loaded by path if this module was imported on its own."""
+    mod = sys.modules.get("ea_nodes._registry")
+    if mod is None:
+        spec = spec_from_file_location("ea_nodes._registry", Path(__file__).with_name("_registry.py"))
+        mod = module_from_spec(spec)
+        sys.modules["ea_nodes._registry"] = mod
+        try:
+            spec.loader.exec_module(mod)
+        except Exception:
+            sys.modules.pop("ea_nodes._registry", None)
+            raise
+    return mod
+
+def _power_lora_module():
+    """The sibling ea_power_lora module (shared LoRA index / row parser), via the node registry."""
+    return _registry().load_module("ea_power_lora", trigger="ea_power_lora_wanvideo")
+
 def _parse_rows(raw: str) -> List[dict]:
-    try:
-        data = json.loads(raw or "{}")
-    except Exception:
-        return []
-    if isinstance(data, dict) and isinstance(data.get("rows"), list):
-        return data["rows"]
-    if isinstance(data, list):
-        out = []
-        for it in data:
-            if isinstance(it, str):
-                out.append({"enabled": True, "name": it, "strength_model": 1.0})
-            elif isinstance(it, dict):
-                out.append({
-                    "enabled": it.get("enabled", True) is not False,
-                    "name": (it.get("name") or "").strip(),
-                    "strength_model": _safe_float(it.get("strength_model", 1.0), 1.0),
-                })
-        return out
-    return []
+    return list(_power_lora_module()._parse_rows_cached(raw, False))
 
 # -------- robust discovery of the real node class --------
 
@@ -73,6 +77,8 @@ def _looks_like_comfy_node_class(cls: Any) -> bool:
     # Comfy node classes normally have INPUT_TYPES and a process()
     return (
         isinstance(cls, type)
+        # skip EA's deferred stand-ins: probing them would import every EA node module
+        and "_ea_key" not in cls.__dict__
         and hasattr(cls, "INPUT_TYPES")
         and callable(getattr(cls, "INPUT_TYPES"))
         and hasattr(cls, "process")
@@ -89,9 +95,11 @@ def _score_loraselect_candidate(cls: type) -> int:
             score += 10
     return score
 
-def _find_lora_select_class() -> type:
+def _scan_lora_select_class() -> Tuple[Optional[type], Optional[str], Optional[Exception]]:
+    """Full discovery pass: (class, module it was found in, last import error)."""
     # 1) First scan already-loaded modules to avoid import-path guessing
     best: Optional[type] = None
+    best_mod: Optional[str] = None
     best_score = -1
     for name, mod in list(sys.modules.items()):
         try:
@@ -100,11 +108,11 @@ def _find_lora_select_class() -> type:
                     continue
                 s = _score_loraselect_candidate(cls)
                 if s > best_score:
-                    best, best_score = cls, s
+                    best, best_mod, best_score = cls, name, s
         except Exception:
             pass
     if best is not None and best_score >= 10:  # found something explicitly lora-select-ish
-        return best
+        return best, best_mod, None
 
     # 2) Try importing a few plausible modules, then scan their mappings
     last_err = None
@@ -116,17 +124,144 @@ def _find_lora_select_class() -> type:
                     continue
                 s = _score_loraselect_candidate(cls)
                 if s > best_score:
-                    best, best_score = cls, s
+                    best, best_mod, best_score = cls, path, s
             if best is not None:
-                return best
+                return best, best_mod, None
         except Exception as e:
             last_err = e
+    return None, None, last_err
 
-    raise RuntimeError(
-        "EA Power LoRA WanVideo: couldn't locate the wrapper's LoRA-select node class. "
-        "Make sure ComfyUI-WanVideoWrapper is installed and enabled. "
-        f"Last import error: {last_err}"
-    )
+# Failed lookups are not retried for this long (seconds)
+_RESOLVE_RETRY_S = 30.0
+
+_resolve_lock = threading.Lock()
+_resolved: Dict[str, Any] = {}
+
+def _still_registered(cls: type, mod_name: str) -> bool:
+    """The cached class is still what its module's NODE_CLASS_MAPPINGS expose (module not reloaded/removed)."""
+    if sys.modules.get(cls.__module__) is None:
+        return False
+    mod = sys.modules.get(mod_name)
+    return mod is not None and any(c is cls for c in _iter_node_classes_from_module(mod))
+
+def _find_lora_select_class() -> type:
+    """Memoized discovery: a hit stays valid while it is still registered by the module it came from;
+    a miss is re-raised from cache until _RESOLVE_RETRY_S has passed."""
+    with _resolve_lock:
+        now = time.monotonic()
+        cached = _resolved.get("cls")
+        if cached is not None and _still_registered(cached, _resolved["module"]):
+            return cached
+        if _resolved.get("error") is not None and now - _resolved.get("failed_at", 0.0) < _RESOLVE_RETRY_S:
+            raise RuntimeError(_resolved["error"])
+
+        t0 = time.perf_counter()
+        cls, mod_name, last_err = _scan_lora_select_class()
+        elapsed_ms = (time.perf_counter() - t0) * 1000.0
+        _resolved.clear()
+        if cls is None:
+            msg = ("EA Power LoRA WanVideo: couldn't locate the wrapper's LoRA-select node class. "
+                   "Make sure ComfyUI-WanVideoWrapper is installed and enabled. "
+                   f"Last import error: {last_err}")
+            _resolved.update(error=msg, failed_at=now)
+            print(f"[EA Power LoRA WanVideo] LoRA-select lookup failed in {elapsed_ms:.1f} ms; "
+                  f"retrying in {_RESOLVE_RETRY_S:.0f} s")
+            raise RuntimeError(msg)
+        if cls is not cached:
+            print(f"[EA Power LoRA WanVideo] Using {cls.__name__} from {mod_name} "
+                  f"(resolved in {elapsed_ms:.1f} ms)")
+        _resolved.update(cls=cls, module=mod_name)
+        return cls
+
+# ---------------- batched stacking ----------------
+
+# Entry fields the batched path fills per row
+_ENTRY_ROW_KEYS: Tuple[str, ...] = ("path", "strength", "name", "blocks", "layer_filter")
+# Entry fields known to be per-node settings; copied from the probed entry
+_ENTRY_FLAG_KEYS: Tuple[str, ...] = ("low_mem_load", "merge_loras")
+
+# wrapper class -> (flags, row keys) of its WANVIDLORA entry format; None = unrecognized, always delegate
+_entry_formats: Dict[type, Optional[Tuple[dict, Tuple[str, ...]]]] = {}
+
+def _row_blocks(item: dict, blocks: Any) -> Any:
+    """Per-row block selection: a row's "blocks" (SELECTEDBLOCKS dict or plain block map) overrides the socket."""
+    rb = item.get("blocks")
+    if isinstance(rb, dict):
+        return rb if ("selected_blocks" in rb or "layer_filter" in rb) else {"selected_blocks": rb}
+    return blocks
+
+def _delegate(cls: type, acc: Any, blocks: Any, name: str, strength: float) -> Any:
+    # Instantiate the real Comfy node class and call its process()
+    node = cls()
+    (acc,) = node.process(prev_lora=acc, blocks=blocks, lora=name, strength=strength)
+    return acc
+
+def _probe_entry_format(out: Any, name: str, strength: float, blocks: Any) -> Optional[Tuple[dict, Tuple[str, ...]]]:
+    """Learn the entry layout from one wrapper call made with prev_lora=None; None if it isn't recognized
+    or if our own derivation of that row (_make_entry) differs from what the wrapper built."""
+    if not isinstance(out, list) or len(out) != 1 or not isinstance(out[0], dict):
+        return None
+    entry = out[0]
+    keys = set(entry)
+    if not {"path", "strength", "name"} <= keys or not keys <= set(_ENTRY_ROW_KEYS + _ENTRY_FLAG_KEYS):
+        return None
+    flags = {k: entry[k] for k in _ENTRY_FLAG_KEYS if k in entry}
+    fmt = (flags, tuple(k for k in _ENTRY_ROW_KEYS if k in entry))
+    try:
+        if _make_entry(fmt, name, strength, blocks) != entry:
+            return None
+    except Exception:
+        return None
+    return fmt
+
+def _lora_full_path(name: str) -> str:
+    try:
+        import folder_paths as _fp
+        return _fp.get_full_path("loras", name) or name
+    except Exception:
+        return name
+
+def _make_entry(fmt: Tuple[dict, Tuple[str, ...]], name: str, strength: float, blocks: Any) -> dict:
+    flags, row_keys = fmt
+    blocks = blocks if isinstance(blocks, dict) else {}
+    values = {
+        "path": _lora_full_path(name),
+        "strength": round(strength, 4),
+        "name": os.path.splitext(name)[0],
+        "blocks": blocks.get("selected_blocks", {}),
+        "layer_filter": blocks.get("layer_filter", ""),
+    }
+    entry = dict(flags)
+    for k in row_keys:
+        entry[k] = values[k]
+    return entry
+
+def _stack_rows(cls: type, prev_lora: Any, rows: List[Tuple[str, float, Any]]) -> Any:
+    """Build the whole WANVIDLORA list in one pass once the wrapper's entry format is known;
+    delegate row by row (the original path) when it is not."""
+    if not rows:
+        return prev_lora
+    fmt = _entry_formats.get(cls, False)
+    if fmt is not None and (prev_lora is None or isinstance(prev_lora, list)):
+        entries: List[dict] = []
+        start = 0
+        if fmt is False:
+            name, strength, blocks = rows[0]
+            out = _delegate(cls, None, blocks, name, strength)
+            fmt = _entry_formats[cls] = _probe_entry_format(out, name, strength, blocks)
+            if fmt is None:
+                print(f"[EA Power LoRA WanVideo] {cls.__name__} entries differ from ours; delegating per row")
+            else:
+                entries.append(out[0])
+                start = 1
+        if fmt is not None:
+            entries.extend(_make_entry(fmt, name, strength, blocks) for name, strength, blocks in rows[start:])
+            return list(prev_lora or []) + entries
+
+    acc = prev_lora
+    for name, strength, blocks in rows:
+        acc = _delegate(cls, acc, blocks, name, strength)
+    return acc
 
 # ---------------- node ----------------
 
@@ -134,11 +269,13 @@ class EA_PowerLora_WanVideo:
     """
     Stack WanVideo LoRAs by delegating to the wrapper’s own LoRA-select node class.
     Sockets match WanVideo so links are compatible.
+    A row may carry its own "blocks" selection, overriding the blocks socket for that LoRA.
+    warnings is a JSON list of rows whose LoRA is not installed.
     """
 
     CATEGORY = "EA / LoRA"
-    RETURN_TYPES = ("WANVIDLORA",)
-    RETURN_NAMES = ("lora",)
+    RETURN_TYPES = ("WANVIDLORA", "STRING")
+    RETURN_NAMES = ("lora", "warnings")
     FUNCTION = "process"
 
     @classmethod
@@ -158,35 +295,32 @@ class EA_PowerLora_WanVideo:
         return (kwargs.get("loras_json", ""), kwargs.get("blocks", ""))
 
     def process(self, loras_json: str = "{}", prev_lora=None, blocks=None):
+        shared = _power_lora_module()
         rows = _parse_rows(loras_json)
 
-        # optional: filter to existing files
-        try:
-            import folder_paths as _fp
-            available = set(_fp.get_filename_list("loras"))
-        except Exception:
-            available = None
+        # optional: filter to existing files (empty index = no filtering)
+        available = shared._LORA_INDEX.names()
+        unknown: List[Tuple[int, str]] = []
 
         LoraSelectCls = _find_lora_select_class()
-        acc = prev_lora
+        selected: List[Tuple[str, float, Any]] = []
 
-        for item in rows:
+        for idx, item in enumerate(rows):
             if item.get("enabled") is False:
                 continue
             name = (item.get("name") or "").strip()
             if not name:
                 continue
-            if available is not None and name not in available:
+            if available and name not in available:
+                unknown.append((idx, name))
                 continue
             strength = _safe_float(item.get("strength_model", 1.0), 1.0)
             if abs(strength) <= 1e-9:
                 continue
+            selected.append((name, strength, _row_blocks(item, blocks)))
 
-            # Instantiate the real Comfy node class and call its process()
-            node = LoraSelectCls()
-            (acc,) = node.process(prev_lora=acc, blocks=blocks, lora=name, strength=strength)
-
-        return (acc,)
+        acc = _stack_rows(LoraSelectCls, prev_lora, selected)
+        return (acc, shared._lora_warnings(unknown, available))
 
 
 NODE_CLASS_MAPPINGS = {
@@ -0,0 +1,77 @@
+# EA Profiler Dump — toggles the EA execution profiler and dumps its metrics as JSON
+# (+ a Prometheus-style text file). The profiler itself lives in nodes/_profiler.py.
+
+import sys
+from importlib.util import spec_from_file_location, module_from_spec
+from pathlib import Path
+
+def _registry():
+    """nodes/_registry.py, shared through sys.modules; loaded by path if this module was imported on its own."""
+    mod = sys.modules.get("ea_nodes._registry")
+    if mod is None:
+        spec = spec_from_file_location("ea_nodes._registry", Path(__file__).with_name("_registry.py"))
+        mod = module_from_spec(spec)
+        sys.modules["ea_nodes._registry"] = mod
+        try:
+            spec.loader.exec_module(mod)
+        except Exception:
+            sys.modules.pop("ea_nodes._registry", None)
+            raise
+    return mod
+
+def _profiler():
+    """Shared profiler module (nodes/_profiler.py), loaded through the node registry."""
+    return _registry().profiler()
+
+class EA_ProfilerDump:
+    """
+    Turn per-node profiling on/off and report what it has recorded.
+    Output: JSON with running totals per node and the last N calls
+    (wall/CPU seconds, peak CUDA bytes, input shapes, sub-stages).
+    Also rewrites the Prometheus text file (EA_PROFILE_PROM or Comfy's temp dir).
+    """
+
+    # Reporting on itself would only add noise to the buffer
+    _EA_NO_PROFILE = True
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "profiling": (["keep", "on", "off"], {"default": "keep"}),
+                "last_n": ("INT", {"default": 50, "min": 0, "max": 100000, "step": 1}),
+                "clear_after": ("BOOLEAN", {"default": False}),
+            }
+        }
+
+    RETURN_TYPES = ("STRING", "STRING")
+    RETURN_NAMES = ("report", "metrics_path")
+    FUNCTION = "dump"
+    CATEGORY = "EA / Debug"
+    OUTPUT_NODE = True
+
+    @classmethod
+    def IS_CHANGED(cls, **kwargs):
+        return float("nan")  # always re-run: the metrics change between prompts
+
+    def dump(self, profiling: str = "keep", last_n: int = 50, clear_after: bool = False):
+        prof = _profiler()
+        if profiling != "keep":
+            prof.set_enabled(profiling == "on")
+        report = prof.dump_json(int(last_n))
+        try:
+            path = prof.write_prometheus()
+        except Exception as e:
+            print(f"[EA Profiler] Could not write metrics file: {e}")
+            path = ""
+        if clear_after:
+            prof.clear()
+        return (report, path)
+
+NODE_CLASS_MAPPINGS = {
+    "EA_ProfilerDump": EA_ProfilerDump,
+}
+
+NODE_DISPLAY_NAME_MAPPINGS = {
+    "EA_ProfilerDump": "EA Profiler Dump",
+}
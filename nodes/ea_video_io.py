@@ -1,7 +1,44 @@
 # ea_video_io.py
+import sys
+from contextlib import nullcontext
+from importlib.util import spec_from_file_location, module_from_spec
 from typing import List, Tuple
 from pathlib import Path
 
+def _registry():
+    """nodes/_registry.py, shared through sys.modules; loaded by path if this module was imported on its own."""
+    mod = sys.modules.get("ea_nodes._registry")
+    if mod is None:
+        spec = spec_from_file_location("ea_nodes._registry", Path(__file__).with_name("_registry.py"))
+        mod = module_from_spec(spec)
+        sys.modules["ea_nodes._registry"] = mod
+        try:
+            spec.loader.exec_module(mod)
+        except Exception:
+            sys.modules.pop("ea_nodes._registry", None)
+            raise
+    return mod
+
+class _NoProfiler:
+    stage = attach = staticmethod(lambda _: nullcontext())
+    current = staticmethod(lambda: None)
+
+class _Profiler:
+    """Shared execution profiler, looked up when a node first runs (no-op if it can't be loaded).
+    _PROFILER.stage(name) times a sub-stage; outside a profiled call it does nothing."""
+    _mod = None
+
+    def __getattr__(self, name):
+        if _Profiler._mod is None:
+            try:
+                _Profiler._mod = _registry().profiler()
+            except Exception as e:
+                print(f"[EA Nodes] Profiler unavailable, stages not timed: {e}")
+                _Profiler._mod = _NoProfiler
+        return getattr(_Profiler._mod, name)
+
+_PROFILER = _Profiler()
+
 def _as_str(x) -> str:
     try:
         return str(x)
@@ -123,31 +160,33 @@ class EA_VideoLoad:
         fps = 0.0
         width = height = total = 0
 
-        # Try OpenCV first
-        try:
-            res = self._load_cv2(p, int(every_n), int(max_frames), bool(to_float))
-            if res is not None:
-                frames, fps, width, height, total = res
-        except Exception:
-            frames = None
-
-        # Fallback to imageio if cv2 failed
-        if frames is None:
+        with _PROFILER.stage("decode"):
+            # Try OpenCV first
             try:
-                res = self._load_imageio(p, int(every_n), int(max_frames), bool(to_float))
+                res = self._load_cv2(p, int(every_n), int(max_frames), bool(to_float))
                 if res is not None:
                     frames, fps, width, height, total = res
             except Exception:
                 frames = None
 
+            # Fallback to imageio if cv2 failed
+            if frames is None:
+                try:
+                    res = self._load_imageio(p, int(every_n), int(max_frames), bool(to_float))
+                    if res is not None:
+                        frames, fps, width, height, total = res
+                except Exception:
+                    frames = None
+
         if not frames:
             empty = torch.empty((0,1,1,3))
             return (empty, 0.0, 0, 0, 0, 0.0, full, name, stem, parent, ext)
 
         # Stack to torch [N,H,W,3]
-        arr = torch.from_numpy(__import__('numpy').stack(frames, axis=0))
-        if arr.dtype != torch.float32:
-            arr = arr.to(torch.float32) / 255.0
+        with _PROFILER.stage("to_tensor"):
+            arr = torch.from_numpy(__import__('numpy').stack(frames, axis=0))
+            if arr.dtype != torch.float32:
+                arr = arr.to(torch.float32) / 255.0
         N, H, W = int(arr.size(0)), int(arr.size(1)), int(arr.size(2))
         duration = float(N / fps) if fps > 0.0 else 0.0
         return (arr, float(fps), int(N), int(W), int(H), float(duration), full, name, stem, parent, ext)
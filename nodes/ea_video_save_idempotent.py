@@ -3,15 +3,627 @@
 # EA Video Save (Idempotent) - Save video with deterministic filename
 # - Uses input filename stem to create predictable output filename
 # - Overwrites existing file (idempotent - same input = same output)
+# - Skips the encode when frames + settings match the fingerprint sidecar
+# - Crash-safe: encodes to a temp file in the target dir, then renames atomically
+# - Segmented mode for long renders: fixed-length segments (resumable) + optional concat
+# - Lossless PNG/WebP sequences and a raw mmap-able uint8 .npy archive for training data
+# - EA Video Save Batch: many clips saved concurrently with a JSON report
 # - Perfect for iterative parameter tuning workflows
 
 import os
+import json
+import hashlib
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from importlib.util import spec_from_file_location, module_from_spec
+from typing import List, Tuple
 from pathlib import Path
 
+# Frames converted per chunk; bounds the uint8 conversion buffers (two chunks).
+_DEFAULT_CHUNK_FRAMES = 16
+
+
+def _registry():
+    """nodes/_registry.py, shared through sys.modules; loaded by path if this module was imported on its own."""
+    mod = sys.modules.get("ea_nodes._registry")
+    if mod is None:
+        spec = spec_from_file_location("ea_nodes._registry", Path(__file__).with_name("_registry.py"))
+        mod = module_from_spec(spec)
+        sys.modules["ea_nodes._registry"] = mod
+        try:
+            spec.loader.exec_module(mod)
+        except Exception:
+            sys.modules.pop("ea_nodes._registry", None)
+            raise
+    return mod
+
+class _NoProfiler:
+    stage = attach = staticmethod(lambda _: nullcontext())
+    current = staticmethod(lambda: None)
+
+class _Profiler:
+    """Shared execution profiler, looked up when a node first runs (no-op if it can't be loaded).
+    _PROFILER.stage(name) times a sub-stage; outside a profiled call it does nothing."""
+    _mod = None
+
+    def __getattr__(self, name):
+        if _Profiler._mod is None:
+            try:
+                _Profiler._mod = _registry().profiler()
+            except Exception as e:
+                print(f"[EA Nodes] Profiler unavailable, stages not timed: {e}")
+                _Profiler._mod = _NoProfiler
+        return getattr(_Profiler._mod, name)
+
+_PROFILER = _Profiler()
+
+
+def _uint8_chunks(images, chunk_frames: int = _DEFAULT_CHUNK_FRAMES, bgr: bool = True):
+    """
+    Yield contiguous uint8 numpy arrays (BGR for OpenCV unless bgr=False) of at
+    most `chunk_frames` frames. A worker thread converts chunk k+1 while the
+    caller consumes chunk k, writing into two preallocated uint8 buffers that
+    are reused once the caller moves on, so a yielded array is only valid until
+    the next iteration. Scaling goes through a single float frame of scratch:
+    peak extra memory is two uint8 chunks plus one frame, never the full clip.
+    """
+    import torch
+
+    n, h, w, c = (int(d) for d in images.shape)
+    step = max(1, min(int(chunk_frames), n))
+    # output channel <- input channel (RGB -> BGR drops any alpha, as OpenCV expects 3 channels)
+    order = [2, 1, 0] if bgr else list(range(c))
+    device = images.device
+    on_cpu = device.type == "cpu"
+
+    free = queue.Queue()
+    for _ in range(2):
+        free.put(torch.empty((step, h, w, len(order)), dtype=torch.uint8))
+    ready = queue.Queue()
+    stop = threading.Event()
+    done = object()
+
+    scratch = torch.empty((h, w, c), dtype=torch.float32, device=device) if images.is_floating_point() else None
+    frame8 = None if on_cpu else torch.empty((h, w, len(order)), dtype=torch.uint8, device=device)
+
+    def _fill(buf, chunk):
+        for i, frame in enumerate(chunk):
+            if scratch is not None:
+                frame = torch.mul(frame, 255.0, out=scratch).clamp_(0, 255)
+            dst = buf[i] if on_cpu else frame8
+            if bgr:
+                for d, src in enumerate(order):
+                    dst[..., d].copy_(frame[..., src])
+            else:
+                dst.copy_(frame)  # float -> uint8 truncates, like .to(torch.uint8)
+            if not on_cpu:
+                buf[i].copy_(dst)
+
+    def _take_free():
+        while not stop.is_set():
+            try:
+                return free.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return None
+
+    def _worker():
+        try:
+            for start in range(0, n, step):
+                buf = _take_free()
+                if buf is None:
+                    return
+                k = min(step, n - start)
+                _fill(buf, images[start:start + k])
+                ready.put((buf, k))
+        except BaseException as e:  # surfaced on the consumer side
+            ready.put(e)
+        finally:
+            ready.put(done)
+
+    t = threading.Thread(target=_worker, name="EA_VideoSave-convert", daemon=True)
+    t.start()
+    try:
+        while True:
+            item = ready.get()
+            if item is done:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            buf, k = item
+            yield buf[:k].numpy()
+            free.put(buf)  # the caller has finished with this chunk
+    finally:
+        stop.set()
+        t.join()
+
+
+# Content fingerprint sampling: frames spread across the clip, every Nth pixel.
+_FP_SAMPLE_FRAMES = 16
+_FP_PIXEL_STRIDE = 7
+_SIDECAR_SUFFIX = ".ea.json"
+
+
+def _fingerprint(images, settings: dict) -> str:
+    """
+    Fast content fingerprint of an IMAGE tensor plus the encode settings.
+    Hashes shape/dtype/settings, a strided pixel sample of evenly spaced frames
+    and a float64 sum of the whole tensor (cheap single pass, catches edits
+    that fall between sampled pixels). The sum is taken _DEFAULT_CHUNK_FRAMES
+    frames at a time so the float64 temporary stays chunk-sized.
+    """
+    import torch
+
+    h = hashlib.blake2b(digest_size=16)
+    header = {"shape": list(images.shape), "dtype": str(images.dtype), "settings": settings}
+    h.update(json.dumps(header, sort_keys=True).encode("utf-8"))
+
+    n = int(images.size(0))
+    idx = torch.linspace(0, n - 1, steps=min(n, _FP_SAMPLE_FRAMES)).round().long().unique()
+    sample = images[idx.to(images.device), ::_FP_PIXEL_STRIDE, ::_FP_PIXEL_STRIDE]
+    h.update(sample.contiguous().cpu().numpy().tobytes())
+    total = 0.0
+    for start in range(0, n, _DEFAULT_CHUNK_FRAMES):
+        total += float(images[start:start + _DEFAULT_CHUNK_FRAMES].sum(dtype=torch.float64))
+    h.update(repr(total).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _sidecar_path(output_path: Path) -> Path:
+    return output_path.with_name(output_path.name + _SIDECAR_SUFFIX)
+
+
+def _read_fingerprint(output_path: Path) -> str:
+    try:
+        with open(_sidecar_path(output_path), "r", encoding="utf-8") as f:
+            return str(json.load(f).get("fingerprint", ""))
+    except Exception:
+        return ""
+
+
+def _write_json_atomic(path: Path, data: dict):
+    tmp = _temp_path(path)
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, sort_keys=True)
+        os.replace(tmp, path)
+    except BaseException:
+        _discard(tmp)
+        raise
+
+
+def _write_fingerprint(output_path: Path, fingerprint: str, settings: dict):
+    try:
+        _write_json_atomic(_sidecar_path(output_path), {"fingerprint": fingerprint, "settings": settings})
+    except Exception as e:
+        print(f"[EA Video Save] Could not write fingerprint for {output_path.name}: {e}")
+
+
+def _drop_fingerprint(output_path: Path):
+    try:
+        _sidecar_path(output_path).unlink()
+    except FileNotFoundError:
+        pass
+
+
+# Temp files live next to the target so the final rename never crosses filesystems.
+_TMP_MARKER = ".ea-tmp"
+_ORPHAN_MAX_AGE_S = 3600.0
+_FSYNC_POLICIES = ["file", "file+dir", "none"]
+_swept_dirs = set()
+_swept_lock = threading.Lock()
+
+
+def _temp_path(target: Path) -> Path:
+    """Hidden, process-unique sibling of `target` that keeps its extension (OpenCV picks the container from it)."""
+    token = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+    return target.with_name(f".{target.name}.{token}{_TMP_MARKER}{target.suffix}")
+
+
+def _discard(path: Path):
+    try:
+        path.unlink()
+    except OSError:
+        pass
+
+
+def _sweep_orphans(directory: Path):
+    """
+    Remove temp files left behind by crashed encodes, once per directory per process.
+    Only temps untouched for _ORPHAN_MAX_AGE_S are removed, so encodes still running
+    in other processes on shared storage are left alone.
+    """
+    key = str(directory.resolve())
+    with _swept_lock:
+        if key in _swept_dirs:
+            return
+        _swept_dirs.add(key)
+    now = time.time()
+    for p in directory.glob(f".*{_TMP_MARKER}*"):
+        try:
+            if now - p.stat().st_mtime <= _ORPHAN_MAX_AGE_S:
+                continue
+            if p.is_dir():
+                shutil.rmtree(p, ignore_errors=True)  # unfinished image sequence
+            else:
+                p.unlink()
+        except OSError:
+            pass
+
+
+def _fsync_path(path: Path, directory: bool = False):
+    if directory and os.name == "nt":
+        return  # directories can't be opened for fsync on Windows
+    try:
+        fd = os.open(str(path), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _commit_atomic(tmp: Path, target: Path, fsync: str = "file"):
+    """Flush `tmp` per the fsync policy and atomically move it over `target`."""
+    if fsync in ("file", "file+dir"):
+        _fsync_path(tmp)
+    os.replace(tmp, target)
+    if fsync == "file+dir":
+        _fsync_path(target.parent, directory=True)
+
+
+# Output extension / OpenCV fourcc per format
+_EXT_MAP = {
+    "video/h264-mp4": ".mp4",
+    "video/h265-mp4": ".mp4",
+    "video/vp9-webm": ".webm",
+    "image/png-sequence": ".png",
+    "image/webp-lossless-sequence": ".webp",
+    "raw/npy-uint8": ".npy",
+}
+_SEQUENCE_FORMATS = ("image/png-sequence", "image/webp-lossless-sequence")
+_NPY_FORMAT = "raw/npy-uint8"
+_CODEC_MAP = {
+    "video/h264-mp4": "mp4v",  # Use mp4v for broader compatibility
+    "video/h265-mp4": "hvc1",
+    "video/vp9-webm": "VP90",
+}
+_SEGMENT_DIR_SUFFIX = ".segments"
+
+
+def _resolve_stem(input_stem: str, suffix: str = "") -> str:
+    """Deterministic output stem: input stem without extension, plus optional suffix."""
+    if not input_stem or input_stem.strip() == "":
+        stem = "video"
+    else:
+        stem = Path(input_stem).stem  # Strip any extension if provided
+    if suffix and suffix.strip():
+        stem = f"{stem}_{suffix.strip()}"
+    return stem
+
+
+def _resolve_output_dir(output_dir: str) -> Path:
+    """<ComfyUI output>/<output_dir>, created and swept of orphaned temps."""
+    output_subdir = Path((output_dir or "").strip() or "pretrain")
+    # For VHS compatibility, we need to use ComfyUI's output structure
+    try:
+        import folder_paths
+        output_base = folder_paths.get_output_directory()
+    except Exception:
+        # Fallback if folder_paths not available
+        output_base = Path.cwd() / "output"
+    full_output_dir = Path(output_base) / output_subdir
+    full_output_dir.mkdir(parents=True, exist_ok=True)
+    _sweep_orphans(full_output_dir)
+    return full_output_dir
+
+
+def _encode_video(images, target: Path, format: str, fps: float,
+                  chunk_frames: int = _DEFAULT_CHUNK_FRAMES, fsync: str = "file"):
+    """Encode an IMAGE tensor to `target` via a temp sibling + atomic rename."""
+    import cv2
+
+    height, width = int(images.size(1)), int(images.size(2))
+    fourcc = cv2.VideoWriter_fourcc(*_CODEC_MAP.get(format, "mp4v"))
+
+    # Write video to a temp sibling; the existing file stays intact until the rename
+    tmp_path = _temp_path(target)
+    writer = cv2.VideoWriter(str(tmp_path), fourcc, float(fps), (width, height))
+    if not writer.isOpened():
+        # Fallback to default codec
+        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+        writer = cv2.VideoWriter(str(tmp_path), fourcc, float(fps), (width, height))
+
+    # Convert in chunks on a worker thread while the encoder drains the previous chunk
+    with _PROFILER.stage("encode"):
+        try:
+            try:
+                for chunk in _uint8_chunks(images, chunk_frames):
+                    for frame in chunk:
+                        writer.write(frame)
+            finally:
+                writer.release()
+            if not tmp_path.exists() or tmp_path.stat().st_size == 0:
+                raise RuntimeError(f"EA Video Save: encoder produced no output for {target.name} ({format})")
+            _commit_atomic(tmp_path, target, fsync)
+        except BaseException:
+            _discard(tmp_path)
+            raise
+
+
+def _replace_dir(tmp_dir: Path, target_dir: Path, fsync: str = "file"):
+    """Swap a fully written temp directory into place; the old one is removed afterwards."""
+    old = None
+    if target_dir.exists():
+        old = _temp_path(target_dir)
+        os.replace(target_dir, old)
+    os.replace(tmp_dir, target_dir)
+    if fsync == "file+dir":
+        _fsync_path(target_dir.parent, directory=True)
+    if old is not None:
+        shutil.rmtree(old, ignore_errors=True)
+
+
+def _write_image_sequence(images, target_dir: Path, format: str,
+                          chunk_frames: int = _DEFAULT_CHUNK_FRAMES, fsync: str = "file", workers: int = 0):
+    """Write lossless frames NNNNN.png / NNNNN.webp into target_dir using a thread pool
+    (`workers` threads; 0 = one per core, up to 32)."""
+    import cv2
+
+    ext = _EXT_MAP[format]
+    if ext == ".webp":
+        params = [cv2.IMWRITE_WEBP_QUALITY, 101]  # >100 selects lossless WebP
+    else:
+        params = [cv2.IMWRITE_PNG_COMPRESSION, 3]
+
+    tmp_dir = _temp_path(target_dir)
+    tmp_dir.mkdir(parents=True)
+
+    def _write_frame(i, frame):
+        path = tmp_dir / f"{i:05d}{ext}"
+        if not cv2.imwrite(str(path), frame, params):
+            raise RuntimeError(f"EA Video Save: could not write {path.name} ({format})")
+        if fsync in ("file", "file+dir"):
+            _fsync_path(path)
+
+    workers = int(workers) if int(workers) > 0 else min(32, os.cpu_count() or 1)
+    with _PROFILER.stage("encode"):
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="EA_VideoSave-seq") as pool:
+                base = 0
+                for chunk in _uint8_chunks(images, chunk_frames):
+                    list(pool.map(_write_frame, range(base, base + len(chunk)), chunk))
+                    base += len(chunk)
+            _replace_dir(tmp_dir, target_dir, fsync)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+
+def _write_npy(images, target: Path, fps: float,
+               chunk_frames: int = _DEFAULT_CHUNK_FRAMES, fsync: str = "file"):
+    """
+    Write an RGB uint8 [N,H,W,C] .npy (np.load(..., mmap_mode="r") friendly)
+    plus a <stem>.json header describing the layout.
+    """
+    import numpy as np
+
+    n, h, w, c = (int(d) for d in images.shape)
+    tmp_path = _temp_path(target)
+    with _PROFILER.stage("encode"):
+        try:
+            arr = np.lib.format.open_memmap(str(tmp_path), mode="w+", dtype=np.uint8, shape=(n, h, w, c))
+            base = 0
+            for chunk in _uint8_chunks(images, chunk_frames, bgr=False):
+                arr[base:base + len(chunk)] = chunk
+                base += len(chunk)
+            arr.flush()
+            del arr
+            _commit_atomic(tmp_path, target, fsync)
+        except BaseException:
+            _discard(tmp_path)
+            raise
+
+    _write_json_atomic(target.with_suffix(".json"), {
+        "format": _NPY_FORMAT,
+        "file": target.name,
+        "frames": n,
+        "height": h,
+        "width": w,
+        "channels": c,
+        "dtype": "uint8",
+        "layout": "NHWC",
+        "color": "RGB",
+        "fps": float(fps),
+    })
+
+
+def _write_tracked(images, target: Path, settings: dict, skip_unchanged: bool, write) -> bool:
+    """
+    Call write() to (re)produce `target` unless its sidecar fingerprint already
+    matches `images` + `settings`. Returns True when something was written.
+    """
+    with _PROFILER.stage("fingerprint"):
+        fingerprint = _fingerprint(images, settings) if bool(skip_unchanged) else ""
+    if fingerprint and target.exists() and _read_fingerprint(target) == fingerprint:
+        return False
+    write()
+    # Fingerprint is only recorded once the new output is in place
+    if fingerprint:
+        _write_fingerprint(target, fingerprint, settings)
+    else:
+        _drop_fingerprint(target)
+    return True
+
+
+def _find_ffmpeg() -> str:
+    exe = shutil.which("ffmpeg")
+    if exe:
+        return exe
+    try:
+        import imageio_ffmpeg
+        return imageio_ffmpeg.get_ffmpeg_exe()
+    except Exception:
+        return ""
+
+
+def _concat_segments(segments, target: Path, fsync: str = "file") -> bool:
+    """Stream-copy `segments` into `target` with ffmpeg's concat demuxer. False if unavailable/failed."""
+    exe = _find_ffmpeg()
+    if not exe or not segments:
+        return False
+    tmp_path = _temp_path(target)
+    list_path = _temp_path(target.with_suffix(".txt"))
+    with _PROFILER.stage("concat"):
+        try:
+            with open(list_path, "w", encoding="utf-8") as f:
+                for seg in segments:
+                    quoted = str(Path(seg).resolve()).replace("'", "'\\''")
+                    f.write(f"file '{quoted}'\n")
+            subprocess.run(
+                [exe, "-hide_banner", "-loglevel", "error", "-y",
+                 "-f", "concat", "-safe", "0", "-i", str(list_path), "-c", "copy", str(tmp_path)],
+                check=True, capture_output=True,
+            )
+            _commit_atomic(tmp_path, target, fsync)
+            return True
+        except Exception as e:
+            print(f"[EA Video Save] Segment concat failed for {target.name}: {e}")
+            _discard(tmp_path)
+            return False
+        finally:
+            _discard(list_path)
+
+
+def _write_segments(images, seg_dir: Path, ext: str, settings: dict, segment_frames: int,
+                    skip_unchanged: bool, format: str, fps: float, chunk_frames: int, fsync: str):
+    """
+    Write fixed-length segments into seg_dir, skipping ones already on disk.
+    Returns (segment paths, whether any segment was written or removed).
+    """
+    seg_dir.mkdir(parents=True, exist_ok=True)
+    _sweep_orphans(seg_dir)
+    n = int(images.size(0))
+    segments, written = [], False
+    for k, start in enumerate(range(0, n, segment_frames)):
+        part = images[start:start + segment_frames]
+        seg_path = seg_dir / f"seg_{k:05d}{ext}"
+        written |= _write_tracked(
+            part, seg_path, settings, skip_unchanged,
+            lambda part=part, seg_path=seg_path: _encode_video(part, seg_path, format, fps, chunk_frames, fsync),
+        )
+        segments.append(seg_path)
+
+    # Drop leftovers from an earlier, longer render
+    keep = {p.name for p in segments}
+    for p in seg_dir.glob(f"seg_*{ext}"):
+        if p.name not in keep:
+            _discard(p)
+            _drop_fingerprint(p)
+            written = True
+    return segments, written
+
+
+def _save_clip(images, stem: str, full_output_dir: Path, format: str = "video/h264-mp4",
+               fps: float = 16.0, crf: int = 16, chunk_frames: int = _DEFAULT_CHUNK_FRAMES,
+               skip_unchanged: bool = True, fsync: str = "file", segment_frames: int = 0,
+               concat_segments: bool = True, keep_segments: bool = False,
+               workers: int = 0) -> Tuple[Path, bool]:
+    """
+    Save one clip under full_output_dir using the idempotent naming/fingerprint rules.
+    `workers` sizes the image-sequence writer pool (0 = per core).
+    Returns (output path, whether anything was written).
+    """
+    frame_count = int(images.size(0))
+    ext = _EXT_MAP.get(format, ".mp4")
+    output_path = full_output_dir / f"{stem}{ext}"
+
+    if format in _SEQUENCE_FORMATS:
+        seq_dir = full_output_dir / f"{stem}_{ext.lstrip('.')}"
+        written = _write_tracked(
+            images, seq_dir, {"format": str(format)}, skip_unchanged,
+            lambda: _write_image_sequence(images, seq_dir, format, chunk_frames, fsync, workers),
+        )
+        return seq_dir, written
+
+    if format == _NPY_FORMAT:
+        written = _write_tracked(
+            images, output_path, {"fps": float(fps), "format": str(format)}, skip_unchanged,
+            lambda: _write_npy(images, output_path, fps, chunk_frames, fsync),
+        )
+        return output_path, written
+
+    settings = {"fps": float(fps), "format": str(format), "crf": int(crf)}
+    segment_frames = max(0, int(segment_frames))
+    if segment_frames and bool(concat_segments) and not _find_ffmpeg():
+        # Without ffmpeg the segments couldn't be joined; encode once instead of twice
+        print(f"[EA Video Save] ffmpeg not found; encoding {stem}{ext} in one pass instead of segments")
+        segment_frames = 0
+
+    if segment_frames <= 0 or segment_frames >= frame_count:
+        written = _write_tracked(
+            images, output_path, settings, skip_unchanged,
+            lambda: _encode_video(images, output_path, format, fps, chunk_frames, fsync),
+        )
+        return output_path, written
+
+    seg_dir = full_output_dir / f"{stem}{_SEGMENT_DIR_SUFFIX}"
+    seg_args = (seg_dir, ext, settings, segment_frames, skip_unchanged, format, fps, chunk_frames, fsync)
+
+    if not bool(concat_segments):
+        _, written = _write_segments(images, *seg_args)
+        return seg_dir, written
+
+    def _write_concat():
+        segments, _ = _write_segments(images, *seg_args)
+        if not _concat_segments(segments, output_path, fsync):
+            _encode_video(images, output_path, format, fps, chunk_frames, fsync)
+        elif not bool(keep_segments):
+            # The joined file is committed; the segments only speed up partial re-renders
+            shutil.rmtree(seg_dir, ignore_errors=True)
+
+    written = _write_tracked(
+        images, output_path, dict(settings, segment_frames=segment_frames), skip_unchanged, _write_concat,
+    )
+    return output_path, written
+
+
+def _output_bytes(path: Path) -> int:
+    try:
+        if path.is_dir():
+            return sum(p.stat().st_size for p in path.iterdir() if p.is_file())
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
 class EA_VideoSaveIdempotent:
     """
     Save video with deterministic filename based on input stem.
     Overwrites existing file - running same workflow produces same output filename.
+    With skip_unchanged, a sidecar fingerprint lets identical re-runs return
+    without re-encoding.
+
+    Lossless formats: PNG/WebP sequences go to <stem>_png/ or <stem>_webp/
+    (NNNNN.<ext>, written by a thread pool); raw/npy-uint8 writes <stem>.npy
+    (RGB uint8 NHWC, mmap-able) with a <stem>.json header.
+
+    For video formats, segment_frames > 0 writes <stem>.segments/seg_NNNNN<ext> (each fingerprinted,
+    so a failed or partially changed run only re-encodes the affected segments)
+    and, with concat_segments, stream-copies them into <stem><ext> via ffmpeg,
+    removing the segments afterwards unless keep_segments is set (kept segments
+    let a partially changed re-render reuse the unchanged ones). Without ffmpeg
+    the clip is encoded in one pass instead.
     """
 
     @classmethod
@@ -25,8 +637,14 @@ class EA_VideoSaveIdempotent:
                 "fps": ("FLOAT", {"default": 16.0, "min": 1.0, "max": 120.0, "step": 0.1}),
                 "output_dir": ("STRING", {"default": "pretrain"}),
                 "suffix": ("STRING", {"default": ""}),
-                "format": (["video/h264-mp4", "video/h265-mp4", "video/vp9-webm"], {"default": "video/h264-mp4"}),
+                "format": (list(_EXT_MAP.keys()), {"default": "video/h264-mp4"}),
                 "crf": ("INT", {"default": 16, "min": 0, "max": 51, "step": 1}),
+                "chunk_frames": ("INT", {"default": _DEFAULT_CHUNK_FRAMES, "min": 1, "max": 1024, "step": 1}),
+                "skip_unchanged": ("BOOLEAN", {"default": True}),
+                "fsync": (_FSYNC_POLICIES, {"default": "file"}),
+                "segment_frames": ("INT", {"default": 0, "min": 0, "max": 100000, "step": 1}),
+                "concat_segments": ("BOOLEAN", {"default": True}),
+                "keep_segments": ("BOOLEAN", {"default": False}),
             }
         }
 
@@ -45,10 +663,14 @@ class EA_VideoSaveIdempotent:
         suffix: str = "",
         format: str = "video/h264-mp4",
         crf: int = 16,
+        chunk_frames: int = _DEFAULT_CHUNK_FRAMES,
+        skip_unchanged: bool = True,
+        fsync: str = "file",
+        segment_frames: int = 0,
+        concat_segments: bool = True,
+        keep_segments: bool = False,
     ):
         import torch
-        import numpy as np
-        import cv2
 
         # Validate input
         if images is None or not torch.is_tensor(images):
@@ -59,97 +681,173 @@ class EA_VideoSaveIdempotent:
             return ("", "", "")
 
         # Determine output filename
-        if not input_stem or input_stem.strip() == "":
-            stem = "video"
-        else:
-            stem = Path(input_stem).stem  # Strip any extension if provided
-
-        # Add suffix if provided
-        if suffix and suffix.strip():
-            stem = f"{stem}_{suffix.strip()}"
-
-        # Determine extension based on format
-        ext_map = {
-            "video/h264-mp4": ".mp4",
-            "video/h265-mp4": ".mp4",
-            "video/vp9-webm": ".webm",
-        }
-        ext = ext_map.get(format, ".mp4")
+        stem = _resolve_stem(input_stem, suffix)
+        full_output_dir = _resolve_output_dir(output_dir)
 
-        # Build output path (relative to ComfyUI output directory)
-        # ComfyUI will handle the base output directory
-        output_subdir = Path(output_dir.strip() or "pretrain")
-        filename = f"{stem}{ext}"
+        output_path, _ = _save_clip(
+            images, stem, full_output_dir, format, fps, crf, chunk_frames,
+            skip_unchanged, fsync, segment_frames, concat_segments, keep_segments,
+        )
+        return (str(output_path), output_path.name, stem)
 
-        # For VHS compatibility, we need to use ComfyUI's output structure
-        # Get ComfyUI output directory
-        try:
-            import folder_paths
-            output_base = folder_paths.get_output_directory()
-        except Exception:
-            # Fallback if folder_paths not available
-            output_base = Path.cwd() / "output"
 
-        full_output_dir = Path(output_base) / output_subdir
-        full_output_dir.mkdir(parents=True, exist_ok=True)
+class EA_VideoSaveBatch:
+    """
+    Save many clips concurrently with the same naming, fingerprint-skip and
+    atomic-write rules as EA Video Save (Idempotent).
 
-        output_path = full_output_dir / filename
+    Clips arrive as a list of IMAGE batches (list inputs) or as one ragged
+    batch split by `frame_counts` ("56,48,60"; must sum to the batch size).
+    `stems` gives one stem per clip (list input or newline-separated);
+    missing stems become video_NNN.
+    Encodes run on a thread pool (OpenCV and torch release the GIL, and clips
+    are not copied into worker processes). max_workers (0 = core count) is the
+    total thread budget, split between clips and each clip's sequence writers.
 
-        # Convert images to numpy for OpenCV
-        frames_np = images.cpu().numpy()
-        if frames_np.dtype == np.float32 or frames_np.dtype == np.float64:
-            frames_np = (frames_np * 255.0).clip(0, 255).astype(np.uint8)
+    Outputs a JSON report: per clip stem, path, bytes, frames, seconds, status.
+    """
 
-        # Get video dimensions
-        height, width = frames_np.shape[1:3]
+    INPUT_IS_LIST = True
 
-        # Determine codec
-        codec_map = {
-            "video/h264-mp4": "mp4v",  # Use mp4v for broader compatibility
-            "video/h265-mp4": "hvc1",
-            "video/vp9-webm": "VP90",
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "images": ("IMAGE",),
+                "stems": ("STRING", {"default": "", "multiline": True}),
+            },
+            "optional": {
+                "frame_counts": ("STRING", {"default": ""}),
+                "fps": ("FLOAT", {"default": 16.0, "min": 1.0, "max": 120.0, "step": 0.1}),
+                "output_dir": ("STRING", {"default": "pretrain"}),
+                "suffix": ("STRING", {"default": ""}),
+                "format": (list(_EXT_MAP.keys()), {"default": "video/h264-mp4"}),
+                "crf": ("INT", {"default": 16, "min": 0, "max": 51, "step": 1}),
+                "skip_unchanged": ("BOOLEAN", {"default": True}),
+                "fsync": (_FSYNC_POLICIES, {"default": "file"}),
+                "max_workers": ("INT", {"default": 0, "min": 0, "max": 256, "step": 1}),
+            }
         }
-        fourcc_str = codec_map.get(format, "mp4v")
-        fourcc = cv2.VideoWriter_fourcc(*fourcc_str)
-
-        # Remove existing file to ensure idempotency
-        if output_path.exists():
-            output_path.unlink()
-
-        # Write video
-        writer = cv2.VideoWriter(
-            str(output_path),
-            fourcc,
-            float(fps),
-            (width, height),
-        )
 
-        if not writer.isOpened():
-            # Fallback to default codec
-            fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-            writer = cv2.VideoWriter(
-                str(output_path),
-                fourcc,
-                float(fps),
-                (width, height),
-            )
+    RETURN_TYPES = ("STRING", "INT")
+    RETURN_NAMES = ("report_json", "saved_count")
+    FUNCTION = "save_batch"
+    CATEGORY = "EA / Video"
+    OUTPUT_NODE = True
+
+    @staticmethod
+    def _first(v, default):
+        # INPUT_IS_LIST wraps every input (widgets included) in a list
+        if isinstance(v, (list, tuple)):
+            return v[0] if v else default
+        return default if v is None else v
+
+    @staticmethod
+    def _split_clips(images, frame_counts: str) -> List:
+        import torch
+
+        if images is None:
+            return []
+        batches = images if isinstance(images, (list, tuple)) else [images]
+        batches = [b for b in batches if torch.is_tensor(b) and b.ndim == 4 and int(b.size(0)) > 0]
+        counts = [int(c) for c in (frame_counts or "").replace(";", ",").split(",") if c.strip().isdigit()]
+        if counts and len(batches) > 1:
+            raise ValueError(f"EA Video Save Batch: frame_counts splits one batch, but {len(batches)} "
+                             f"batches were given (each list item is already a clip)")
+        if not counts or not batches:
+            return batches
+        total = int(batches[0].size(0))
+        if sum(counts) != total:
+            # Guessing which clip the extra/missing frames belong to would save wrong outputs
+            raise ValueError(f"EA Video Save Batch: frame_counts sum to {sum(counts)} "
+                             f"but the batch has {total} frames")
+        clips, start = [], 0
+        for c in counts:
+            if c <= 0:
+                continue
+            clips.append(batches[0][start:start + c])
+            start += c
+        return clips
+
+    @staticmethod
+    def _split_stems(stems) -> List[str]:
+        items = stems if isinstance(stems, (list, tuple)) else [stems]
+        out = []
+        for it in items:
+            out.extend(line.strip() for line in str(it or "").splitlines() if line.strip())
+        return out
+
+    def save_batch(self, images, stems, frame_counts=None, fps=None, output_dir=None, suffix=None,
+                   format=None, crf=None, skip_unchanged=None, fsync=None, max_workers=None):
+        frame_counts = str(self._first(frame_counts, ""))
+        fps = float(self._first(fps, 16.0))
+        output_dir = str(self._first(output_dir, "pretrain"))
+        suffix = str(self._first(suffix, ""))
+        format = str(self._first(format, "video/h264-mp4"))
+        crf = int(self._first(crf, 16))
+        skip_unchanged = bool(self._first(skip_unchanged, True))
+        fsync = str(self._first(fsync, "file"))
+        max_workers = int(self._first(max_workers, 0))
+
+        clips = self._split_clips(images, frame_counts)
+        if not clips:
+            return (json.dumps([]), 0)
+
+        names = self._split_stems(stems)
+        full_output_dir = _resolve_output_dir(output_dir)
+        jobs, seen = [], set()
+        for i, clip in enumerate(clips):
+            raw = names[i] if i < len(names) else f"video_{i:03d}"
+            jobs.append((i, clip, _resolve_stem(raw, suffix)))
+
+        call = _PROFILER.current()  # worker threads report their stages into this node call
+
+        def _run(job):
+            i, clip, stem = job
+            entry = {"index": i, "stem": stem, "frames": int(clip.size(0))}
+            t0 = time.perf_counter()
+            try:
+                with _PROFILER.attach(call):
+                    path, written = _save_clip(
+                        clip, stem, full_output_dir, format, fps, crf,
+                        skip_unchanged=skip_unchanged, fsync=fsync, workers=frame_workers,
+                    )
+                entry.update(path=str(path), bytes=_output_bytes(path),
+                             status="written" if written else "skipped")
+            except Exception as e:
+                entry.update(path="", bytes=0, status="error", error=str(e))
+            entry["seconds"] = round(time.perf_counter() - t0, 4)
+            return entry
 
-        for i in range(frame_count):
-            frame = frames_np[i]
-            # Convert RGB to BGR for OpenCV
-            frame_bgr = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
-            writer.write(frame_bgr)
+        report = [None] * len(jobs)
+        runnable = []
+        for job in jobs:
+            # Two clips resolving to one stem would race on the same target
+            if job[2] in seen:
+                report[job[0]] = {"index": job[0], "stem": job[2], "frames": int(job[1].size(0)),
+                                  "path": "", "bytes": 0, "seconds": 0.0,
+                                  "status": "error", "error": "duplicate stem in batch"}
+                continue
+            seen.add(job[2])
+            runnable.append(job)
 
-        writer.release()
+        # One thread budget for clips x per-clip sequence writers, so the pools don't multiply
+        budget = max_workers if max_workers > 0 else (os.cpu_count() or 1)
+        workers = max(1, min(budget, len(runnable) or 1))
+        frame_workers = max(1, budget // workers)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="EA_VideoSaveBatch") as pool:
+            for entry in pool.map(_run, runnable):
+                report[entry["index"]] = entry
 
-        # Return paths for reference
-        relative_path = str(output_subdir / filename)
-        return (str(output_path), filename, stem)
+        saved = sum(1 for e in report if e and e["status"] in ("written", "skipped"))
+        return (json.dumps(report, indent=2), int(saved))
 
 
 NODE_CLASS_MAPPINGS = {
     "EA_VideoSaveIdempotent": EA_VideoSaveIdempotent,
+    "EA_VideoSaveBatch": EA_VideoSaveBatch,
 }
 NODE_DISPLAY_NAME_MAPPINGS = {
     "EA_VideoSaveIdempotent": "EA Video Save (Idempotent)",
+    "EA_VideoSaveBatch": "EA Video Save Batch",
 }
@@ -7,7 +7,7 @@ or from tests/:
   python ./tests/validate_ea_nodes.py
 """
 from __future__ import annotations
-import importlib.util, sys, types
+import importlib.util, json, os, struct, sys, tempfile, types
 from pathlib import Path
 
 EXPECTED_NODES = {
@@ -29,6 +29,221 @@ def import_root_init(repo_root: Path):
     spec.loader.exec_module(mod)
     return mod
 
+def write_safetensors(path: Path, tensors: dict):
+    """tensors: {key: (dtype, shape, raw bytes)} -> minimal .safetensors file."""
+    header, blobs, offset = {}, [], 0
+    for key, (dtype, shape, raw) in tensors.items():
+        header[key] = {"dtype": dtype, "shape": list(shape), "data_offsets": [offset, offset + len(raw)]}
+        blobs.append(raw)
+        offset += len(raw)
+    head = json.dumps(header).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(struct.pack("<Q", len(head)) + head + b"".join(blobs))
+
+def node_module(stem: str):
+    return sys.modules["ea_nodes._registry"].load_module(stem, trigger="validator")
+
+def check_bake_te_classification() -> bool:
+    """MODEL-only bake of an SD LoRA: text-encoder modules the model key map doesn't know
+    must still be classified by name and baked at strength_clip."""
+    lora = node_module("ea_power_lora")
+    zeros = lambda n: bytes(4 * n)
+    tensors = {}
+    for module in ("lora_unet_down_blocks_0_proj", "lora_te_text_model_encoder_layers_0_q_proj"):
+        tensors[f"{module}.lora_up.weight"] = ("F32", (4, 2), zeros(8))
+        tensors[f"{module}.lora_down.weight"] = ("F32", (2, 4), zeros(8))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "sd.safetensors")
+        write_safetensors(Path(path), tensors)
+        te_modules = {"lora_unet_down_blocks_0_proj": False}  # what a MODEL-only key map yields
+        plan, problems = lora._bake_plan([(path, 0.0, 1.0)], "low_rank", te_modules)
+        ok = not problems and list(plan) == ["lora_te_text_model_encoder_layers_0_q_proj"]
+        plan, _ = lora._bake_plan([(path, 1.0, 0.5)], "low_rank", te_modules)
+        strengths = {m: e["rows"][0][1] for m, e in plan.items()}
+        ok = ok and strengths == {"lora_unet_down_blocks_0_proj": 1.0,
+                                  "lora_te_text_model_encoder_layers_0_q_proj": 0.5}
+    print(f"[{'PASS' if ok else 'FAIL'}] bake: text-encoder modules keep strength_clip without CLIP")
+    return ok
+
+class FakePatcher:
+    """Just enough of Comfy's ModelPatcher: clone() shares patch objects, add_patches appends."""
+    def __init__(self, keys):
+        self.model = types.SimpleNamespace(keys=keys)
+        self.patches = {}
+        self.patches_uuid = None
+
+    def clone(self):
+        out = FakePatcher(self.model.keys)
+        out.model = self.model
+        out.patches = {k: list(v) for k, v in self.patches.items()}
+        return out
+
+    def add_patches(self, patches, strength_patch=1.0, strength_model=1.0):
+        for key, patch in patches.items():
+            if key in self.model.keys:
+                self.patches.setdefault(key, []).append((strength_patch, patch, strength_model, None, None))
+        return list(patches)
+
+def fake_comfy_lora():
+    """comfy.lora stand-in: plain LoRA rows -> legacy ("lora", (up, down, alpha, None, None, None)) patches."""
+    mod = types.ModuleType("comfy.lora")
+    mod.model_lora_keys_unet = lambda model, key_map: {f"lora_unet_{k}": k for k in model.keys}
+    mod.model_lora_keys_clip = lambda model, key_map: {}
+    def load_lora(sd, key_map):
+        out = {}
+        for lora_key, weight_key in key_map.items():
+            up = sd.get(f"{lora_key}.lora_up.weight")
+            if up is None:
+                continue
+            alpha = sd.get(f"{lora_key}.alpha")
+            alpha = float(alpha) if alpha is not None else None
+            out[weight_key] = ("lora", (up, sd[f"{lora_key}.lora_down.weight"], alpha, None, None, None))
+        return out
+    mod.load_lora = load_lora
+    return mod
+
+def patched_weights(lora, patcher, base: dict) -> dict:
+    """Apply a patcher's plain-LoRA patches to `base` the way Comfy does (W*strength_model + s*scale*up@down)."""
+    out = {}
+    for key, w in base.items():
+        w = w.clone()
+        for strength, patch, strength_model, _, _ in patcher.patches.get(key, []):
+            up, down, alpha = lora._plain_lora_weights(patch)
+            scale = alpha / down.shape[0] if alpha is not None else 1.0
+            w = w * strength_model + strength * scale * (up.float().flatten(1) @ down.float().flatten(1))
+        out[key] = w
+    return out
+
+class LoraFixture:
+    """Temporary LoRA files (served through folder_paths.get_full_path) and a fake comfy.lora."""
+    def __init__(self, loras: dict):
+        self.loras = loras  # name -> {key: tensor}
+
+    def __enter__(self):
+        import torch
+        self.tmp = tempfile.TemporaryDirectory()
+        for name, tensors in self.loras.items():
+            write_safetensors(Path(self.tmp.name) / name, {
+                k: ("F32", tuple(t.shape), t.to(torch.float32).contiguous().numpy().tobytes())
+                for k, t in tensors.items()})
+        self.saved = {k: sys.modules.get(k) for k in ("comfy", "comfy.lora")}
+        comfy = types.ModuleType("comfy")
+        comfy.lora = fake_comfy_lora()
+        sys.modules["comfy"], sys.modules["comfy.lora"] = comfy, comfy.lora
+        fp = sys.modules["folder_paths"]
+        self.saved_full_path = getattr(fp, "get_full_path", None)
+        fp.get_full_path = lambda kind, name: os.path.join(self.tmp.name, name)
+        return self
+
+    def __exit__(self, *exc):
+        for k, v in self.saved.items():
+            if v is None:
+                sys.modules.pop(k, None)
+            else:
+                sys.modules[k] = v
+        fp = sys.modules["folder_paths"]
+        if self.saved_full_path is None:
+            del fp.get_full_path
+        else:
+            fp.get_full_path = self.saved_full_path
+        self.tmp.cleanup()
+        return False
+
+def lora_stack_fixture():
+    """Three LoRAs on one 6x5 weight with mixed rank/alpha (one without alpha), plus a key only one touches."""
+    import torch
+    g = torch.Generator().manual_seed(0)
+    rnd = lambda *shape: torch.randn(*shape, generator=g)
+    loras = {
+        "r2.safetensors": {"lora_unet_w.lora_up.weight": rnd(6, 2), "lora_unet_w.lora_down.weight": rnd(2, 5),
+                           "lora_unet_w.alpha": torch.tensor(1.0)},
+        "r4.safetensors": {"lora_unet_w.lora_up.weight": rnd(6, 4), "lora_unet_w.lora_down.weight": rnd(4, 5),
+                           "lora_unet_w.alpha": torch.tensor(8.0),
+                           "lora_unet_v.lora_up.weight": rnd(3, 1), "lora_unet_v.lora_down.weight": rnd(1, 3)},
+        "r3.safetensors": {"lora_unet_w.lora_up.weight": rnd(6, 3), "lora_unet_w.lora_down.weight": rnd(3, 5)},
+    }
+    base = {"w": rnd(6, 5), "v": rnd(3, 3)}
+    return LoraFixture(loras), base
+
+def max_diff(a: dict, b: dict) -> float:
+    return max(float((a[k] - b[k]).abs().max()) for k in a)
+
+def check_fused_matches_sequential() -> bool:
+    """fuse_stack=True must give the same patched weights as applying the LoRAs one after another."""
+    try:
+        import torch  # noqa: F401
+    except ImportError:
+        print("[SKIP] fused LoRA stack: torch not installed")
+        return True
+    lora = node_module("ea_power_lora")
+    fixture, base = lora_stack_fixture()
+    stack = [("r2.safetensors", 0.7, 0.0), ("r4.safetensors", -0.4, 0.0), ("r3.safetensors", 1.3, 0.0)]
+    with fixture:
+        model = FakePatcher(set(base))
+        fused, _ = lora._apply_stack(model, None, stack, fuse=True)
+        sequential, _ = lora._apply_stack(model, None, stack, fuse=False)
+        fused_patches = sum(len(v) for v in fused.patches.values())
+        diff = max_diff(patched_weights(lora, fused, base), patched_weights(lora, sequential, base))
+    ok = fused_patches == 2 and diff < 1e-4 and not model.patches
+    print(f"[{'PASS' if ok else 'FAIL'}] fused LoRA stack matches sequential (max diff {diff:.2e}, "
+          f"{fused_patches} patches)")
+    return ok
+
+def check_restrength_matches_rebuild() -> bool:
+    """A strength-only re-run reuses the tracked stack; it must equal a full rebuild at the new
+    strengths and leave the previously returned model's patches untouched."""
+    try:
+        import torch  # noqa: F401
+    except ImportError:
+        print("[SKIP] incremental LoRA strengths: torch not installed")
+        return True
+    lora = node_module("ea_power_lora")
+    fixture, base = lora_stack_fixture()
+    before = [("r2.safetensors", 0.7, 0.0), ("r4.safetensors", -0.4, 0.0), ("r3.safetensors", 1.3, 0.0)]
+    after = [("r2.safetensors", 0.2, 0.0), ("r4.safetensors", 0.9, 0.0), ("r3.safetensors", -0.5, 0.0)]
+    builds = []
+    build_tracked = lora._build_tracked
+    lora._build_tracked = lambda *a: builds.append(1) or build_tracked(*a)
+    try:
+        with fixture:
+            model = FakePatcher(set(base))
+            state = {}
+            first, _ = lora._apply_stack(model, None, before, state=state)
+            first_weights = patched_weights(lora, first, base)
+            second, _ = lora._apply_stack(model, None, after, state=state)
+            rebuilt, _ = lora._apply_stack(model, None, after)
+            diff = max_diff(patched_weights(lora, second, base), patched_weights(lora, rebuilt, base))
+            untouched = max_diff(patched_weights(lora, first, base), first_weights)
+    finally:
+        lora._build_tracked = build_tracked
+    ok = len(builds) == 2 and second is not first and diff < 1e-5 and untouched == 0.0
+    print(f"[{'PASS' if ok else 'FAIL'}] incremental LoRA strengths match a rebuild "
+          f"(max diff {diff:.2e}, earlier model changed by {untouched:.2e}, {len(builds)} builds for 3 runs)")
+    return ok
+
+def check_motion_bias_fit() -> bool:
+    """Fitting each built-in preset: the Custom controls reproduce the fitted steps/split through
+    compute(), and split_exact flags the one split Custom can't reach (Speedrun 4/1 needs bias 1.0)."""
+    try:
+        import numpy, torch  # noqa: F401
+    except ImportError:
+        print("[SKIP] motion bias fit: numpy/torch not installed")
+        return True
+    mb = node_module("ea_lightning_motion_bias")
+    ok, missed = True, []
+    for name in mb._BUILTIN_ORDER:
+        cfg = mb._PRESETS[name]
+        fit = mb._fit_custom(cfg["sigmas"], cfg["high_weight"], cfg["low_weight"], cfg["split_step"])
+        out = mb.EA_LightningMotionBias.compute("Custom", fit["steps"], fit["motion_bias"], fit["profile"],
+                                                fit["base_high"], fit["base_low"], fit["min_low_steps"])
+        ok = ok and out[:2] == (cfg["steps"], fit["split_step"])
+        ok = ok and fit["split_exact"] == (fit["split_step"] == cfg["split_step"])
+        if not fit["split_exact"]:
+            missed.append(name)
+    ok = ok and missed == ["Speedrun 4/1"]
+    print(f"[{'PASS' if ok else 'FAIL'}] motion bias fit reproduces preset splits (unreachable: {missed})")
+    return ok
+
 def main():
     here = Path(__file__).resolve()
     repo_root = here.parent if here.parent.name.lower() != "tests" else here.parent.parent
@@ -66,11 +281,18 @@ def main():
     # Ensure we can instantiate without heavy deps
     for key, cls in cls_map.items():
         try:
-            _ = cls()
+            inst = cls()
+            if not (isinstance(inst, cls) and issubclass(type(inst), cls) and issubclass(cls, cls)):
+                raise TypeError("instance is not recognised as an instance of the registered class")
             print(f"[PASS] instantiate: {key}")
         except Exception as e:
             print(f"[FAIL] instantiate {key}: {e}"); ok = False
 
+    ok = check_bake_te_classification() and ok
+    ok = check_fused_matches_sequential() and ok
+    ok = check_restrength_matches_rebuild() and ok
+    ok = check_motion_bias_fit() and ok
+
     sys.exit(0 if ok else 1)
 
 if __name__ == "__main__":
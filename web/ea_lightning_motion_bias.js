@@ -61,6 +61,10 @@ import { app } from "/scripts/app.js";
     "Custom": null,
   };
 
+  // Resolved values per preset as sent by Python (preset combo options.ea_presets); covers
+  // library presets and built-ins overridden by a preset file. Refreshed with the node defs.
+  const PY_PRESETS = {};
+
   // math for Custom overlay only
   function strictlyDecreasing(vals){const out=[];let prev=10;for(const v0 of vals){const v=Math.min(v0,prev-1e-6);out.push(v);prev=v}return out;}
   function sigmasHoldHigh(steps,bias){const p=lerp(1.1,3,clamp(bias,0,1));const v=[];for(let i=0;i<steps;i++){const t=i/steps;v.push(1-Math.pow(t,p))}v.push(0);const s=strictlyDecreasing(v);s[0]=1;s[s.length-1]=0;return s.map(round5);}
@@ -100,12 +104,28 @@ import { app } from "/scripts/app.js";
     const pw = get(node, "preset");
     if (pw) { pw.hidden = true; pw.name = "(preset hidden)"; }
   }
+  // Library presets (user / EA_MOTION_BIAS_PRESETS *.json|toml) come from the Python combo's options
+  function presetOptions(node) {
+    const py = get(node, "(preset hidden)")?.options?.values || [];
+    const names = Object.keys(PRESETS).filter((n) => n !== "Custom");
+    for (const n of py) if (n !== "Custom" && !names.includes(n)) names.push(n);
+    names.push("Custom");
+    return names;
+  }
+
+  // Keep the serialized Python preset in step with the visible JS combo
+  function syncPythonPreset(node, val) {
+    const pw = get(node, "(preset hidden)");
+    if (pw && pw.value !== val && (pw.options?.values || []).includes(val)) pw.value = val;
+  }
+
   function ensureJsPreset(node) {
     if (node.__ea_js_widget) return node.__ea_js_widget;
-    const options = Object.keys(PRESETS);
+    const options = presetOptions(node);
     const w = node.addWidget("combo", "preset", "Aggressive 3/2", (val) => {
       node.__ea_js_preset = val;
-      if (val !== "Custom") {
+      syncPythonPreset(node, val);
+      if (val !== "Custom" && PRESETS[val]) {
         const cfg = PRESETS[val].widgets;
         setWidget(node, "steps", cfg.steps);
         setWidget(node, "motion_bias", cfg.motion_bias);
@@ -125,40 +145,60 @@ import { app } from "/scripts/app.js";
     return node.__ea_js_preset || node.__ea_js_widget?.value || "Aggressive 3/2";
   }
 
+  // Custom math (mirrors the Python Custom path) for the given controls
+  function customInfo(c) {
+    const steps = Math.max(3, Math.floor(Number(c.steps)));
+    const bias  = clamp(Number(c.motion_bias), 0, 1);
+    const profile = c.profile;
+    const baseHigh = Number(c.base_high);
+    const baseLow  = Number(c.base_low);
+    const minLow   = Math.max(1, Math.floor(Number(c.min_low_steps ?? 2)));
+
+    let splitF = 0.5 + 0.2 * bias;
+    let split = Math.round(steps * splitF);
+    split = Math.max(1, Math.min(split, steps - minLow));
+
+    const sigmas = (profile === "big_drop") ? sigmasBigDrop(steps, bias) : sigmasHoldHigh(steps, bias);
+    const highW = round5(baseHigh * (1.0 + 0.25 * bias));
+    const lowW  = round5(baseLow  * (1.0 - 0.15 * bias));
+    const scheduler = chooseSchedulerAuto(bias, profile);
+    const { addNoiseHigh, addNoiseLow } = noiseHints(bias);
+
+    const cfgHigh = Math.max(0.75, Math.min(1.0, 1.0 - 0.25 * bias));
+    const cfgLow  = Math.max(1.0, Math.min(1.1, 1.0 + 0.05 * bias));
+
+    return { steps, split, sigmas, highW, lowW, cfgHigh, cfgLow, addNoiseHigh, addNoiseLow, scheduler };
+  }
+
+  function exactInfo(P) {
+    return {
+      steps: P.steps, split: P.split, sigmas: P.sigmas.slice(),
+      highW: P.high, lowW: P.low, cfgHigh: P.cfgHigh, cfgLow: P.cfgLow,
+      addNoiseHigh: P.addNoiseHigh, addNoiseLow: P.addNoiseLow, scheduler: P.scheduler
+    };
+  }
+
   // Build overlay lines (with per-line colors)
   function makeLines(node, width) {
     const preset = currentPreset(node);
+    const py = preset !== "Custom" ? PY_PRESETS[preset] : null;
     let info;
 
-    if (preset !== "Custom" && PRESETS[preset]) {
-      const P = PRESETS[preset];
-      info = {
-        steps: P.steps, split: P.split, sigmas: P.sigmas.slice(),
-        highW: P.high, lowW: P.low, cfgHigh: P.cfgHigh, cfgLow: P.cfgLow,
-        addNoiseHigh: P.addNoiseHigh, addNoiseLow: P.addNoiseLow, scheduler: P.scheduler
-      };
+    if (py?.custom) {
+      info = customInfo(py.custom);          // library preset pinning Custom controls
+    } else if (py?.sigmas) {
+      info = exactInfo(py);                  // exact preset values as resolved by Python
+    } else if (preset !== "Custom" && PRESETS[preset]) {
+      info = exactInfo(PRESETS[preset]);
     } else {
-      const steps = Math.max(3, Math.floor(read(node, "steps", 5, true)));
-      const bias  = clamp(read(node, "motion_bias", 0.8, true), 0, 1);
-      const profile = read(node, "profile", "big_drop");
-      const baseHigh = read(node, "base_high", 1.04, true);
-      const baseLow  = read(node, "base_low", 1.14, true);
-      const minLow   = Math.max(1, Math.floor(read(node, "min_low_steps", 2, true)));
-
-      let splitF = 0.5 + 0.2 * bias;
-      let split = Math.round(steps * splitF);
-      split = Math.max(1, Math.min(split, steps - minLow));
-
-      const sigmas = (profile === "big_drop") ? sigmasBigDrop(steps, bias) : sigmasHoldHigh(steps, bias);
-      const highW = round5(baseHigh * (1.0 + 0.25 * bias));
-      const lowW  = round5(baseLow  * (1.0 - 0.15 * bias));
-      const scheduler = chooseSchedulerAuto(bias, profile);
-      const { addNoiseHigh, addNoiseLow } = noiseHints(bias);
-
-      const cfgHigh = Math.max(0.75, Math.min(1.0, 1.0 - 0.25 * bias));
-      const cfgLow  = Math.max(1.0, Math.min(1.1, 1.0 + 0.05 * bias));
-
-      info = { steps, split, sigmas, highW, lowW, cfgHigh, cfgLow, addNoiseHigh, addNoiseLow, scheduler };
+      info = customInfo({
+        steps: read(node, "steps", 5, true),
+        motion_bias: read(node, "motion_bias", 0.8, true),
+        profile: read(node, "profile", "big_drop"),
+        base_high: read(node, "base_high", 1.04, true),
+        base_low: read(node, "base_low", 1.14, true),
+        min_low_steps: read(node, "min_low_steps", 2, true),
+      });
     }
 
     const sigmasStr = info.sigmas
@@ -199,6 +239,14 @@ import { app } from "/scripts/app.js";
 
   app.registerExtension({
     name: "ea.lightning_motion_bias.overlay.v8",
+    beforeRegisterNodeDef(nodeType, nodeData) {
+      if (nodeData?.name !== "EA_LightningMotionBias") return;
+      const sent = nodeData.input?.required?.preset?.[1]?.ea_presets;
+      if (sent && typeof sent === "object") {
+        for (const k of Object.keys(PY_PRESETS)) delete PY_PRESETS[k];
+        Object.assign(PY_PRESETS, sent);
+      }
+    },
     nodeCreated(node) {
       if (node?.comfyClass !== "EA_LightningMotionBias") return;
       if (node.__ea_lmb_installed) return;
@@ -210,7 +258,10 @@ import { app } from "/scripts/app.js";
 
       // If Python preset had a saved value, mirror once
       const pySaved = get(node, "(preset hidden)")?.value;
-      if (pySaved && PRESETS[pySaved] && node.__ea_js_widget) {
+      if (pySaved && !PRESETS[pySaved] && node.__ea_js_widget) {
+        node.__ea_js_widget.value = pySaved;   // library preset: no widget values to mirror
+        node.__ea_js_preset = pySaved;
+      } else if (pySaved && PRESETS[pySaved] && node.__ea_js_widget) {
         node.__ea_js_widget.value = pySaved;
         node.__ea_js_preset = pySaved;
         const cfg = PRESETS[pySaved].widgets;
@@ -256,6 +307,7 @@ import { app } from "/scripts/app.js";
           if (node.__ea_js_widget.value !== "Custom") {
             node.__ea_js_widget.value = "Custom";
             node.__ea_js_preset = "Custom";
+            syncPythonPreset(node, "Custom");
             this.graph?.setDirtyCanvas(true, true);
           }
         }